@@ -0,0 +1,69 @@
+"""
+Apply/undo benchmark for tree search.
+
+Plays a few random games and at sampled positions expands every legal
+action twice: once by deep-copying the engine and stepping the copy, and
+once with engine.apply followed by engine.undo on the live engine. Step
+output is thrown away so printing doesn't swamp either side.
+
+run command:
+python3 -m benchmarks.apply_undo
+"""
+import copy
+import random
+import time
+from source.engine import GameEngine
+from source.enums import GamePhase
+
+def sample_positions(rng, games=3, every=25, max_steps=1500):
+    """engines paused at regular points of random games"""
+    positions = []
+    for _ in range(games):
+        engine = GameEngine(quiet=True)
+        steps = 0
+        while engine.game_phase != GamePhase.END and steps < max_steps:
+            if steps % every == 0:
+                positions.append(copy.deepcopy(engine))
+            engine.step(rng.choice(engine.legal_actions()))
+            steps += 1
+    return positions
+
+def expand_with_deepcopy(engine) -> int:
+    """copy the whole engine for every child node"""
+    actions = engine.legal_actions()
+    for action in actions:
+        child = copy.deepcopy(engine)
+        child.step(action)
+    return len(actions)
+
+def expand_with_undo(engine) -> int:
+    """apply and undo each child on the same engine"""
+    actions = engine.legal_actions()
+    for action in actions:
+        engine.apply(action)
+        engine.undo()
+    return len(actions)
+
+def time_expansion(func, positions):
+    """total nodes and seconds to expand every position"""
+    nodes = 0
+    start = time.perf_counter()
+    for engine in positions:
+        nodes += func(engine)
+    return nodes, time.perf_counter() - start
+
+def main():
+    rng = random.Random(0)
+    positions = sample_positions(rng)
+    copy_nodes, copy_seconds = time_expansion(expand_with_deepcopy, positions)
+    undo_nodes, undo_seconds = time_expansion(expand_with_undo, positions)
+    assert copy_nodes == undo_nodes
+
+    print(f"{len(positions)} positions, {undo_nodes} child nodes")
+    print(f"{'method':<16} {'us/node':>10} {'nodes/s':>10}")
+    for name, seconds in (("deepcopy", copy_seconds), ("apply/undo", undo_seconds)):
+        print(f"{name:<16} {seconds / undo_nodes * 1e6:>10.1f} {undo_nodes / seconds:>10.0f}")
+    print(f"speedup: {copy_seconds / undo_seconds:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Dice and production throughput, one engine at a time against BatchEngine.
+
+Every game starts from the same mid-game position. The loop rolls each
+engine's dice and calls ResourceManager.distribute_resources (or moves
+the robber on a seven) game by game; BatchEngine does the same for all
+games at once with numpy.
+
+run command:
+python3 -m benchmarks.batch_production
+python3 -m benchmarks.batch_production --games 4096 --turns 200
+"""
+import argparse
+import copy
+import random
+import time
+from source.batch_engine import BatchEngine
+from source.engine import GameEngine
+from source.enums import GamePhase
+
+def mid_game_engine(seed: int, actions: int = 600) -> GameEngine:
+    """random play until a few buildings are down"""
+    rng = random.Random(seed)
+    random.seed(seed)
+    engine = GameEngine(quiet=True)
+    for _ in range(actions):
+        if engine.game_phase == GamePhase.END:
+            break
+        engine.step(rng.choice(engine.legal_actions()))
+    return engine
+
+def run_engines(engines, turns: int, rng: random.Random):
+    """roll and pay out game by game"""
+    num_tiles = len(engines[0].board.tiles)
+    for _ in range(turns):
+        for engine in engines:
+            roll = engine.dice.roll()
+            if roll == 7:
+                old_position = engine.game_state.robber_position
+                new_position = (old_position + rng.randrange(1, num_tiles)) % num_tiles
+                engine.game_state.robber_position = new_position
+                engine.resource_manager.handle_robber_moved(old_position, new_position)
+            else:
+                engine.resource_manager.distribute_resources(roll, engine.players)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=1024)
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--loop-games", type=int, default=128, help="games the one-at-a-time loop plays")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    engine = mid_game_engine(args.seed)
+    engines = [copy.deepcopy(engine) for _ in range(args.loop_games)]
+    start = time.perf_counter()
+    run_engines(engines, args.turns, random.Random(args.seed))
+    loop_seconds = time.perf_counter() - start
+
+    batch = BatchEngine.from_engine(engine, args.games, seed=args.seed)
+    start = time.perf_counter()
+    batch.run(args.turns)
+    batch_seconds = time.perf_counter() - start
+
+    loop_rate = args.loop_games * args.turns / loop_seconds
+    batch_rate = args.games * args.turns / batch_seconds
+    print(f"{len(engine.settlements)} settlements, {len(engine.cities)} cities, {args.turns} turns")
+    print(f"{'method':<24} {'games':>7} {'game turns/s':>14}")
+    print(f"{'distribute_resources':<24} {args.loop_games:>7} {loop_rate:>14.0f}")
+    print(f"{'BatchEngine':<24} {args.games:>7} {batch_rate:>14.0f}")
+    print(f"speedup: {batch_rate / loop_rate:.1f}x")
+
+if __name__ == "__main__":
+    main()
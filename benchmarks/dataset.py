@@ -0,0 +1,98 @@
+"""
+Memory-mapped position dataset against JSON dumps of GameState.to_dict.
+
+Records the start of every turn in a few random games, then tiles those
+positions out to a larger dataset file. Compares bytes per position, the
+memory needed to load every position as parsed JSON, and minibatch
+sampling from the memmap, which only reads the rows it picks.
+
+run command:
+python3 -m benchmarks.dataset
+python3 -m benchmarks.dataset --records 200000 --batch-size 512
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+from source.dataset import DatasetReader, DatasetWriter, PositionRecorder
+from source.engine import GameEngine
+from source.enums import GamePhase, PlayerAction
+
+def record_games(num_games: int, seed: int, max_steps: int = 5000):
+    """records and to_dict JSON lines for the start of every turn"""
+    rng = random.Random(seed)
+    random.seed(seed)
+    records, json_lines = [], []
+    for game_id in range(num_games):
+        engine = GameEngine(quiet=True)
+        recorder = PositionRecorder(engine.board, game_id)
+        turn = 1
+        steps = 0
+        while engine.game_phase != GamePhase.END and steps < max_steps:
+            if engine.game_phase == GamePhase.PLAY and recorder.count < turn:
+                recorder.add(engine.game_state, turn)
+                json_lines.append(json.dumps(engine.game_state.to_dict()))
+            action = rng.choice(engine.legal_actions())
+            engine.step(action)
+            if action.action_type == PlayerAction.END_TURN:
+                turn += 1
+            steps += 1
+        victory_points = [player.calculate_total_victory_points() for player in engine.players]
+        records.append(recorder.finish(engine.winner_index, victory_points))
+    return np.concatenate(records), json_lines
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=5)
+    parser.add_argument("--records", type=int, default=50000, help="size of the tiled dataset file")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--batches", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    records, json_lines = record_games(args.games, args.seed)
+    positions = len(records)
+
+    # the json approach holds every parsed position in memory
+    tracemalloc.start()
+    parsed = [json.loads(line) for line in json_lines]
+    json_memory = tracemalloc.get_traced_memory()[0] / positions
+    tracemalloc.stop()
+    del parsed
+    json_bytes = sum(len(line) + 1 for line in json_lines) / positions
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "positions.bin")
+        start = time.perf_counter()
+        with DatasetWriter(path) as writer:
+            written = 0
+            while written < args.records:
+                written += writer.write(records[:args.records - written])
+        write_seconds = time.perf_counter() - start
+
+        rng = np.random.default_rng(args.seed)
+        tracemalloc.start()
+        reader = DatasetReader(path)
+        open_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        start = time.perf_counter()
+        for _ in range(args.batches):
+            batch = reader.sample(args.batch_size, rng)
+            batch["observation"].sum()  # touch the rows
+        sample_seconds = time.perf_counter() - start
+        del batch, reader
+
+    print(f"{positions} positions from {args.games} games, tiled to {args.records} records")
+    print(f"json to_dict:  {json_bytes:>8.0f} bytes on disk, {json_memory:>8.0f} bytes in memory per position")
+    print(f"dataset:       {records.dtype.itemsize:>8} bytes on disk, {open_memory / args.records:>8.1f} bytes "
+          f"in memory per position once opened")
+    print(f"write: {args.records / write_seconds:.0f} records/s")
+    print(f"sample: {args.batches / sample_seconds:.0f} batches/s of {args.batch_size} "
+          f"({args.batches * args.batch_size / sample_seconds:.0f} positions/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Event log write overhead, replay throughput and seek time.
+
+Plays a few random games with and without an EventLogWriter attached,
+then replays them from the log: whole games from the start, and single
+mid-game turns with and without the checkpoint index.
+
+run command:
+python3 -m benchmarks.event_log
+python3 -m benchmarks.event_log --games 20 --checkpoint-every 5
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from source.engine import GameEngine
+from source.enums import EventType, GamePhase
+from source.event_log import EventLogWriter, EventLogReader
+
+def play_games(num_games: int, seed: int, writer=None, max_steps: int = 5000) -> float:
+    """random games, seconds spent playing"""
+    rng = random.Random(seed)
+    random.seed(seed)
+    start = time.perf_counter()
+    for _ in range(num_games):
+        engine = GameEngine(quiet=True)
+        if writer is not None:
+            writer.attach(engine)
+        steps = 0
+        while engine.game_phase != GamePhase.END and steps < max_steps:
+            engine.step(rng.choice(engine.legal_actions()))
+            steps += 1
+    if writer is not None:
+        writer.close()
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--checkpoint-every", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "games.evlog")
+        plain_seconds = play_games(args.games, args.seed)
+        logged_seconds = play_games(args.games, args.seed, EventLogWriter(path, args.checkpoint_every))
+
+        with EventLogReader(path) as reader:
+            num_events = sum(1 for game in range(len(reader)) for _ in reader.events(game))
+            start = time.perf_counter()
+            for game in range(len(reader)):
+                reader.replay(game, use_checkpoints=False)
+            replay_seconds = time.perf_counter() - start
+
+            # the middle turn of every game, from the nearest checkpoint then from the game start
+            targets = []
+            for game in range(len(reader)):
+                turns = sum(event.event_type == EventType.END_TURN for event in reader.events(game))
+                targets.append((game, turns // 2))
+            start = time.perf_counter()
+            for game, turn in targets:
+                reader.replay(game, turn=turn)
+            seek_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            for game, turn in targets:
+                reader.replay(game, turn=turn, use_checkpoints=False)
+            no_index_seconds = time.perf_counter() - start
+
+        log_bytes = os.path.getsize(path)
+
+    print(f"{args.games} games, {num_events} events, {log_bytes} bytes ({log_bytes / num_events:.1f} per event)")
+    print(f"play without log: {plain_seconds:.2f}s, with log: {logged_seconds:.2f}s "
+          f"({(logged_seconds / plain_seconds - 1) * 100:+.1f}%)")
+    print(f"replay from the start: {num_events / replay_seconds:.0f} events/s")
+    print(f"seek to mid-game turn: {seek_seconds / len(targets) * 1e3:.2f} ms with checkpoints every "
+          f"{args.checkpoint_every} turns, {no_index_seconds / len(targets) * 1e3:.2f} ms from the start")
+
+if __name__ == "__main__":
+    main()
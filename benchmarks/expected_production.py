@@ -0,0 +1,69 @@
+"""
+Expected production from cached tables against looping adjacent tiles.
+
+Takes a mid-game position and computes the expected yield of every
+vertex given the robber, and every player's expected yield, first by
+walking Board.get_adjacent_tiles and then from the production tables
+and the totals ResourceManager keeps up to date.
+
+run command:
+python3 -m benchmarks.expected_production
+"""
+import random
+import time
+import numpy as np
+from source.constants import RESOURCES
+from source.engine import GameEngine
+from source.enums import GamePhase
+from source.production import get_production_tables
+
+PROBABILITY = {number: (6 - abs(7 - number)) / 36 for number in range(2, 13)}
+
+def vertex_loop(engine) -> np.ndarray:
+    robber = engine.game_state.robber_position
+    out = np.zeros((len(engine.board.topology.vertex_tiles), len(RESOURCES)))
+    for vertex in range(len(out)):
+        for tile_idx, tile in engine.board.get_adjacent_tiles(vertex):
+            if tile.value is not None and tile_idx != robber:
+                out[vertex, RESOURCES.index(tile.resource_type)] += PROBABILITY[tile.value]
+    return out
+
+def player_loop(engine) -> np.ndarray:
+    state = engine.game_state
+    out = np.zeros((len(engine.players), len(RESOURCES)))
+    for buildings, level in ((state.settlements, 1), (state.cities, 2)):
+        for vertex, player_index in buildings.items():
+            for tile_idx, tile in engine.board.get_adjacent_tiles(vertex):
+                if tile.value is not None and tile_idx != state.robber_position:
+                    out[player_index, RESOURCES.index(tile.resource_type)] += level * PROBABILITY[tile.value]
+    return out
+
+def time_call(func, repeat: int = 2000) -> float:
+    """microseconds per call"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+def main():
+    rng = random.Random(0)
+    engine = GameEngine(0, quiet=True)
+    for _ in range(600):
+        if engine.game_phase == GamePhase.END:
+            break
+        engine.step(rng.choice(engine.legal_actions()))
+
+    tables = get_production_tables(engine.board)
+    robber = engine.game_state.robber_position
+    assert np.allclose(vertex_loop(engine), tables.expected_vertex_production(robber))
+    assert np.allclose(player_loop(engine), engine.resource_manager.expected_production())
+
+    print(f"{len(engine.settlements)} settlements, {len(engine.cities)} cities")
+    print(f"{'':<28} {'loop us':>9} {'tables us':>10}")
+    print(f"{'every vertex, with robber':<28} {time_call(lambda: vertex_loop(engine)):>9.1f} "
+          f"{time_call(lambda: tables.expected_vertex_production(robber)):>10.1f}")
+    print(f"{'every player':<28} {time_call(lambda: player_loop(engine)):>9.1f} "
+          f"{time_call(engine.resource_manager.expected_production):>10.1f}")
+
+if __name__ == "__main__":
+    main()
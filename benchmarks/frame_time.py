@@ -0,0 +1,117 @@
+"""
+Frame time: redrawing everything each frame against the pre-rendered
+board, dirty-rectangle updates and cached text.
+
+Plays a game with random agents in every seat, taking one action every
+few frames like the real loop does while people watch, and times a
+frame drawn the old way (sea, tiles and number tokens, pieces and UI
+with every label rendered again, then a full flip) against
+Game.present, which blits the cached board layer, only when a layer
+changed, and sends just the changed regions to the display. Runs
+headless on SDL's dummy driver by default, which doesn't count the cost
+of pushing pixels to a real screen, so the saving on the regions sent
+is shown as an area.
+
+Then times drawing a whole frame with every label rendered by the font
+again (the text cache cleared before each frame) against the cached
+text surfaces, and reports the cache's hit rate over the game.
+
+run command:
+python3 -m benchmarks.frame_time
+python3 -m benchmarks.frame_time --frames 5000 --every 20
+"""
+import argparse
+import contextlib
+import io
+import os
+import time
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from source.agents import RandomAgent, play_turn
+from source.board_renderer import BoardRenderer
+from source.constants import BLUE_SEA
+from source.enums import GamePhase
+from source.fonts import render_text
+from source.game import Game
+
+class RedrawBoardRenderer(BoardRenderer):
+    """the old way, sea and tiles drawn again every frame, plus the one blit onto the screen"""
+    def get_background(self, size):
+        if self.background is None or self.background.get_size() != size:
+            self.background = pygame.Surface(size).convert()
+        self.background.fill(BLUE_SEA)
+        self.draw_hex_tiles(self.background)
+        return self.background
+
+def play(game: Game, frames: int, every: int, frame) -> list:
+    """seconds spent in frame() for each frame, agents act every few frames"""
+    times = []
+    for index in range(frames):
+        if game.game_state.game_phase == GamePhase.END:
+            break
+        if index % every == 0:
+            play_turn(game.engine, game.agents)
+        game.ui_renderer.draw_current_player(game)
+        start = time.perf_counter()
+        frame()
+        times.append(time.perf_counter() - start)
+    return times
+
+def draw_time(game: Game, repeat: int, cached: bool) -> float:
+    """seconds to draw every layer of the current frame"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        if not cached:
+            render_text.cache_clear()
+        game.draw_frame()
+    return (time.perf_counter() - start) / repeat
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--every", type=int, default=10, help="frames between agent actions")
+    args = parser.parse_args()
+
+    areas = []
+    update = pygame.display.update
+    def counted_update(rects):
+        areas.append(sum(rect.width * rect.height for rect in rects))
+        update(rects)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        before = Game({seat: RandomAgent(seat) for seat in range(4)})
+        before.board_renderer = RedrawBoardRenderer(before.board, before.geometry)
+        def full_frame():
+            render_text.cache_clear()  # nor was any text kept
+            before.ui_renderer.expire_messages()
+            before.dice_renderer.update()
+            before.draw_frame()
+            pygame.display.flip()
+        full = play(before, args.frames, args.every, full_frame)
+
+        after = Game({seat: RandomAgent(seat) for seat in range(4)})
+        render_text.cache_clear()
+        pygame.display.update = counted_update
+        dirty = play(after, args.frames, args.every, after.present)
+        pygame.display.update = update
+        cache = render_text.cache_info()
+        uncached_draw = draw_time(after, 500, cached=False)
+        cached_draw = draw_time(after, 500, cached=True)
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            after.present()
+        idle = (time.perf_counter() - start) / 1000
+
+    screen_area = after.screen.get_width() * after.screen.get_height()
+    drawn = len(areas)
+    print(f"{len(full)} frames, an agent action every {args.every}")
+    print(f"redraw everything  {sum(full) / len(full) * 1e3:6.2f} ms per frame")
+    print(f"dirty rectangles   {sum(dirty) / len(dirty) * 1e3:6.2f} ms per frame, "
+          f"{drawn} of {len(dirty)} frames drawn, {sum(areas) / max(drawn, 1) / screen_area:.0%} of the screen sent each")
+    print(f"idle frame         {idle * 1e6:6.1f} us")
+    print(f"drawing a whole frame: {uncached_draw * 1e3:.2f} ms rendering text, {cached_draw * 1e3:.2f} ms "
+          f"from the text cache, {cache.hits / max(cache.hits + cache.misses, 1):.1%} hits over the game")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Hover picking benchmark: grid lookups against a full scan as the board grows.
+
+run command:
+python3 -m benchmarks.hover_picking
+"""
+import math
+import random
+import time
+from source.board_geometry import BoardGeometry, point_to_segment_distance
+from source.topology import get_topology, hex_layout
+
+QUERIES = 2000
+HOVER_DISTANCE = 20
+
+def linear_nearest_vertex(geometry, pos, max_dist):
+    """the old approach, check every vertex"""
+    nearest = min(range(len(geometry.vertex_positions)),
+                  key=lambda v: math.hypot(pos[0] - geometry.vertex_positions[v][0], pos[1] - geometry.vertex_positions[v][1]))
+    x, y = geometry.vertex_positions[nearest]
+    return nearest if math.hypot(pos[0] - x, pos[1] - y) <= max_dist else None
+
+def linear_nearest_edge(geometry, pos, max_dist):
+    """the old approach, check every edge"""
+    nearest = None
+    min_dist = float('inf')
+    for edge, (start, end) in enumerate(geometry.edge_positions):
+        dist = point_to_segment_distance(pos, start, end)
+        if dist < min_dist and dist <= max_dist:
+            min_dist = dist
+            nearest = edge
+    return nearest
+
+def time_queries(lookup, geometry, points) -> float:
+    """microseconds per lookup"""
+    start = time.perf_counter()
+    for pos in points:
+        lookup(geometry, pos, HOVER_DISTANCE)
+    return (time.perf_counter() - start) / len(points) * 1e6
+
+def main():
+    rng = random.Random(0)
+    print(f"{'radius':>6} {'tiles':>6} {'grid vertex':>12} {'scan vertex':>12} {'grid edge':>10} {'scan edge':>10}  (us/query)")
+    for radius in (2, 4, 8, 16, 32):
+        geometry = BoardGeometry(get_topology(tuple(hex_layout(radius))))
+
+        # points scattered around real vertices so most queries hit something
+        points = []
+        for _ in range(QUERIES):
+            x, y = rng.choice(geometry.vertex_positions)
+            points.append((x + rng.uniform(-40, 40), y + rng.uniform(-40, 40)))
+
+        grid_vertex = time_queries(BoardGeometry.find_nearest_vertex, geometry, points)
+        grid_edge = time_queries(BoardGeometry.find_nearest_edge, geometry, points)
+        scan_points = points[:200]  # the full scan gets very slow on big boards
+        scan_vertex = time_queries(linear_nearest_vertex, geometry, scan_points)
+        scan_edge = time_queries(linear_nearest_edge, geometry, scan_points)
+        print(f"{radius:>6} {geometry.topology.num_tiles:>6} {grid_vertex:>12.2f} {scan_vertex:>12.2f} {grid_edge:>10.2f} {scan_edge:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Longest road benchmark on dense and long road networks.
+
+Compares a naive search that starts a walk from every vertex with the
+odd-degree start search VictoryPointManager uses, and shows what a cached
+lookup costs once nothing has changed.
+
+run command:
+python3 -m benchmarks.longest_road
+"""
+import math
+import random
+import time
+from source.engine import GameEngine
+
+def naive_longest_road(engine, player_index) -> int:
+    """walk from every vertex the player's roads touch"""
+    topology = engine.board.topology
+    roads = set(engine.players[player_index].roads)
+    buildings = {**engine.game_state.settlements, **engine.game_state.cities}
+    best = 0
+
+    def walk(vertex, used, first):
+        nonlocal best
+        best = max(best, len(used))
+        owner = buildings.get(vertex)
+        if not first and owner is not None and owner != player_index:
+            return
+        for edge in topology.vertex_edges[vertex]:
+            if edge in roads and edge not in used:
+                start, end = topology.edge_vertices[edge]
+                used.add(edge)
+                walk(end if start == vertex else start, used, False)
+                used.remove(edge)
+
+    for vertex in {v for edge in roads for v in topology.edge_vertices[edge]}:
+        walk(vertex, set(), True)
+    return best
+
+def dense_network(engine, size):
+    """the edges closest to the middle of the board, lots of loops"""
+    topology = engine.board.topology
+
+    def distance(edge):
+        (x1, y1), (x2, y2) = (topology.vertex_lattice[v] for v in topology.edge_vertices[edge])
+        return math.hypot((x1 + x2) * math.sqrt(3) / 4, (y1 + y2) / 4)
+    return sorted(range(topology.num_edges), key=distance)[:size]
+
+def snake_network(engine, size, rng):
+    """one long winding road"""
+    topology = engine.board.topology
+    while True:
+        vertex = rng.randrange(topology.num_vertices)
+        visited = {vertex}
+        edges = []
+        while len(edges) < size:
+            options = [e for e in topology.vertex_edges[vertex]
+                       if (set(topology.edge_vertices[e]) - {vertex}).isdisjoint(visited)]
+            if not options:
+                break
+            edge = rng.choice(options)
+            edges.append(edge)
+            vertex = next(v for v in topology.edge_vertices[edge] if v != vertex)
+            visited.add(vertex)
+        if len(edges) == size:
+            return edges
+
+def time_call(func, *args, repeat=5) -> float:
+    """best of a few runs in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main():
+    rng = random.Random(0)
+    engine = GameEngine(quiet=True)
+    manager = engine.victory_point_manager
+
+    cases = []
+    for size in (15, 20, 25, 30):
+        cases.append((f"dense {size}", dense_network(engine, size), 0))
+        cases.append((f"dense {size} + blockers", dense_network(engine, size), 3))
+    cases.append(("snake 15", snake_network(engine, 15, rng), 0))
+
+    print(f"{'network':<24} {'length':>6} {'naive ms':>10} {'search ms':>10} {'cached us':>10}")
+    for name, roads, blockers in cases:
+        engine.players[0].roads = list(roads)
+        engine.game_state.settlements.clear()
+        touched = sorted({v for edge in roads for v in engine.board.topology.edge_vertices[edge]})
+        for vertex in rng.sample(touched, blockers):
+            engine.game_state.settlements[vertex] = 1
+
+        length = manager._calculate_longest_road_length(0)
+        assert length == naive_longest_road(engine, 0)
+
+        naive_ms = time_call(naive_longest_road, engine, 0)
+        search_ms = time_call(manager._calculate_longest_road_length, 0)
+        manager.road_lengths.pop(0, None)
+        manager.get_longest_road_length(0)
+        cached_us = time_call(manager.get_longest_road_length, 0) * 1000
+        print(f"{name:<24} {length:>6} {naive_ms:>10.2f} {search_ms:>10.2f} {cached_us:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+MCTS rollout throughput against worker count.
+
+Plays into the middle of a random game, then lets the mcts agent search
+that position for a fixed time with 1, 2, 4, ... workers up to the core
+count. Root parallelisation shares nothing between workers, so
+rollouts/s should grow close to linearly until the cores run out.
+
+run command:
+python3 -m benchmarks.mcts_scaling
+python3 -m benchmarks.mcts_scaling --time 5 --max-workers 16
+"""
+import argparse
+import os
+import random
+from source.engine import GameEngine
+from source.enums import GamePhase
+from source.mcts import MCTSAgent
+
+def mid_game_position(seed: int, actions: int = 300) -> GameEngine:
+    """random play until the players have some buildings and cards"""
+    rng = random.Random(seed)
+    random.seed(seed)
+    engine = GameEngine(quiet=True)
+    for _ in range(actions):
+        if engine.game_phase == GamePhase.END:
+            break
+        engine.step(rng.choice(engine.legal_actions()))
+    # stop on a real choice so the agent doesn't skip the search
+    while len(engine.legal_actions()) < 2:
+        engine.step(rng.choice(engine.legal_actions()))
+    return engine
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--time", type=float, default=2.0, help="search seconds per measurement")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    engine = mid_game_position(args.seed)
+    worker_counts = []
+    workers = 1
+    while workers < args.max_workers:
+        worker_counts.append(workers)
+        workers *= 2
+    worker_counts.append(args.max_workers)
+
+    print(f"{os.cpu_count()} cores, {args.time:.1f}s per search")
+    print(f"{'workers':>8} {'rollouts':>10} {'rollouts/s':>12} {'speedup':>8} {'efficiency':>11}")
+    baseline = None
+    for workers in worker_counts:
+        agent = MCTSAgent(workers=workers, time_limit=args.time, seed=args.seed, verbose=False)
+        agent.choose_action(engine)  # warm up the pool
+        agent.choose_action(engine)
+        stats = agent.last_stats
+        agent.close()
+
+        rate = stats["rollouts_per_second"]
+        baseline = baseline or rate
+        speedup = rate / baseline
+        print(f"{workers:>8} {stats['rollouts']:>10} {rate:>12.0f} {speedup:>8.2f} {speedup / workers:>11.0%}")
+
+if __name__ == "__main__":
+    main()
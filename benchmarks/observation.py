@@ -0,0 +1,53 @@
+"""
+Observation encoding: GameState.to_dict against ObservationEncoder.
+
+Encodes mid-game positions from a perspective seat into one reused
+buffer and into consecutive rows of a (batch, size) block, the way a
+training loop fills a batch, and times both against building the dict.
+
+run command:
+python3 -m benchmarks.observation
+python3 -m benchmarks.observation --batch-size 1024
+"""
+import argparse
+import time
+from benchmarks.batch_production import mid_game_engine
+from source.observation import ObservationEncoder
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--positions", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    states = [mid_game_engine(seed, 900).game_state for seed in range(args.positions)]
+    encoder = ObservationEncoder(states[0].board)  # a layout of its own per state isn't needed for timing
+    single = encoder.new_buffer()
+    batch = encoder.new_buffer(args.batch_size)
+    repeat = args.batch_size
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for state in states:
+            state.to_dict()
+    dict_us = (time.perf_counter() - start) / (repeat * len(states)) * 1e6
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for state in states:
+            encoder.encode(state, single, perspective=1)
+    single_us = (time.perf_counter() - start) / (repeat * len(states)) * 1e6
+
+    start = time.perf_counter()
+    for state in states:
+        for row in range(args.batch_size):
+            encoder.encode(state, batch[row], perspective=1)
+    batch_us = (time.perf_counter() - start) / (args.batch_size * len(states)) * 1e6
+
+    print(f"{len(states)} positions, observation size {encoder.size}")
+    print(f"{'to_dict':<26} {dict_us:7.1f} us")
+    print(f"{'encode, one buffer':<26} {single_us:7.1f} us")
+    print(f"{'encode, rows of a batch':<26} {batch_us:7.1f} us")
+
+if __name__ == "__main__":
+    main()
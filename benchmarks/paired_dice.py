@@ -0,0 +1,65 @@
+"""
+Per-game RNG streams: dice throughput and paired-game variance.
+
+Times GameRng's block-drawn rolls against two random.randint calls, then
+compares two agents (random agents with different seeds, standing in for
+two versions) on seat 0 over the same game seeds and over independent
+ones. Paired games share board, deck, dice and opponents, so the spread
+of the per-game difference in seat 0's points shrinks and fewer games
+are needed to tell the versions apart. Random agents' own choices add
+most of the noise here, agents that play the board gain more.
+
+run command:
+python3 -m benchmarks.paired_dice
+python3 -m benchmarks.paired_dice --games 400 --turns 150
+"""
+import argparse
+import random
+import statistics
+import time
+from source.agents import RandomAgent, play_turn
+from source.engine import GameEngine
+from source.enums import GamePhase, PlayerAction
+from source.rng import GameRng
+
+def seat_points(seed: int, agent_seed: int, turns: int) -> int:
+    """seat 0's points after a number of turns, agent_seed picks the version in seat 0"""
+    engine = GameEngine(seed, quiet=True)
+    agents = {seat: RandomAgent(seed * 10 + seat) for seat in range(1, len(engine.players))}
+    agents[0] = RandomAgent(agent_seed)
+    played = 0
+    while engine.game_phase != GamePhase.END and played < turns:
+        if play_turn(engine, agents).action_type == PlayerAction.END_TURN:
+            played += 1
+    return engine.players[0].calculate_total_victory_points()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--rolls", type=int, default=200000)
+    args = parser.parse_args()
+
+    rng = GameRng(0)
+    start = time.perf_counter()
+    for _ in range(args.rolls):
+        rng.roll()
+    block_ns = (time.perf_counter() - start) / args.rolls * 1e9
+    start = time.perf_counter()
+    for _ in range(args.rolls):
+        random.randint(1, 6) + random.randint(1, 6)
+    randint_ns = (time.perf_counter() - start) / args.rolls * 1e9
+
+    version_a = [seat_points(seed, 1, args.turns) for seed in range(args.games)]
+    paired_b = [seat_points(seed, 2, args.turns) for seed in range(args.games)]
+    unpaired_b = [seat_points(args.games + seed, 2, args.turns) for seed in range(args.games)]
+
+    paired = statistics.stdev(b - a for a, b in zip(version_a, paired_b))
+    unpaired = statistics.stdev(b - a for a, b in zip(version_a, unpaired_b))
+    print(f"dice: {block_ns:.0f} ns per roll from blocks, {randint_ns:.0f} ns with randint")
+    print(f"{args.games} games, seat 0 points after {args.turns} turns")
+    print(f"std of the per-game difference: paired {paired:.2f}, unpaired {unpaired:.2f}")
+    print(f"games needed for the same confidence: {(paired / unpaired) ** 2:.2f}x with paired seeds")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Setup placement agent: decision time and strength.
+
+Plays paired games where seat 0 opens with SetupAgent or with random
+placements, then plays on randomly like the other seats. Reports the
+time per setup decision against the time of a whole game, and seat 0's
+win rate and points either way.
+
+run command:
+python3 -m benchmarks.setup_agent
+python3 -m benchmarks.setup_agent --games 500
+"""
+import argparse
+import statistics
+import time
+from source.agents import RandomAgent, play_game
+from source.engine import GameEngine
+from source.enums import GamePhase
+from source.setup_agent import SetupAgent
+
+class TimedAgent(SetupAgent):
+    """SetupAgent that keeps the time of each setup decision"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.times = []
+
+    def choose_action(self, engine):
+        if engine.game_phase != GamePhase.SETUP:
+            return super().choose_action(engine)
+        start = time.perf_counter()
+        action = super().choose_action(engine)
+        self.times.append(time.perf_counter() - start)
+        return action
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=200)
+    args = parser.parse_args()
+
+    decision_times, game_times = [], []
+    wins = {"setup": 0, "random": 0}
+    points = {"setup": [], "random": []}
+    for seed in range(args.games):
+        for opening in ("setup", "random"):
+            engine = GameEngine(seed, quiet=True)
+            agents = {seat: RandomAgent(seed * 10 + seat) for seat in range(1, len(engine.players))}
+            agents[0] = TimedAgent(RandomAgent(seed)) if opening == "setup" else RandomAgent(seed)
+            start = time.perf_counter()
+            winner = play_game(engine, agents)
+            game_times.append(time.perf_counter() - start)
+            if opening == "setup":
+                decision_times += agents[0].times[1:]  # the first builds the per layout caches
+            wins[opening] += winner == 0
+            points[opening].append(engine.players[0].calculate_total_victory_points())
+
+    print(f"{args.games} paired games, seat 0 against three random agents")
+    print(f"setup decision: {statistics.mean(decision_times) * 1e6:.0f} us mean, "
+          f"{max(decision_times) * 1e6:.0f} us max, a whole game {statistics.mean(game_times) * 1e3:.0f} ms")
+    for opening in ("setup", "random"):
+        print(f"{opening + ' opening':<16} win rate {wins[opening] / args.games:.2f}, "
+              f"mean points {statistics.mean(points[opening]):.2f}")
+
+if __name__ == "__main__":
+    main()
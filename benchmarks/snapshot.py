@@ -0,0 +1,69 @@
+"""
+Binary snapshots against pickling GameState.
+
+Snapshots positions from a few random games and compares size and
+encode/decode time with pickle, which drags the Board and Player
+objects along with every state.
+
+run command:
+python3 -m benchmarks.snapshot
+"""
+import pickle
+import random
+import time
+from source.engine import GameEngine
+from source.enums import GamePhase
+from source.snapshot import encode_snapshot, decode_snapshot
+
+def sample_engines(rng, games=3, every=50, max_steps=2000):
+    """copies of engines paused at regular points of random games, never mid robber decision"""
+    engines = []
+    for _ in range(games):
+        engine = GameEngine(quiet=True)
+        steps = 0
+        while engine.game_phase != GamePhase.END and steps < max_steps:
+            pending = engine.robber_manager.move_pending or engine.robber_manager.stealing_pending
+            if steps % every == 0 and not pending:
+                engines.append(pickle.loads(pickle.dumps(engine)))
+            engine.step(rng.choice(engine.legal_actions()))
+            steps += 1
+    return engines
+
+def time_each(func, items, repeat=5) -> float:
+    """best total over a few passes, in microseconds per item"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter() - start)
+    return best / len(items) * 1e6
+
+def main():
+    rng = random.Random(0)
+    random.seed(0)
+    engines = sample_engines(rng)
+    states = [engine.game_state for engine in engines]
+
+    snapshots = [encode_snapshot(engine) for engine in engines]
+    pickles = [pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL) for state in states]
+
+    rows = [
+        ("snapshot", sum(map(len, snapshots)) / len(states),
+         time_each(encode_snapshot, engines),
+         time_each(lambda data: decode_snapshot(data), snapshots)),
+        ("snapshot, shared board", sum(map(len, snapshots)) / len(states),
+         time_each(encode_snapshot, engines),
+         time_each(lambda pair: decode_snapshot(pair[0], board=pair[1].board), list(zip(snapshots, states)))),
+        ("pickle", sum(map(len, pickles)) / len(states),
+         time_each(lambda state: pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL), states),
+         time_each(pickle.loads, pickles)),
+    ]
+
+    print(f"{len(states)} states")
+    print(f"{'format':<24} {'bytes':>8} {'encode us':>10} {'decode us':>10}")
+    for name, size, encode_us, decode_us in rows:
+        print(f"{name:<24} {size:>8.0f} {encode_us:>10.1f} {decode_us:>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,55 @@
-from source.game import Game
+import argparse
+from source.selfplay import AGENT_NAMES, run_selfplay
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="play catan")
+    parser.add_argument("--mcts", type=int, nargs="*", default=[], metavar="SEAT",
+                        help="seats (0-3) played by the mcts agent instead of the mouse")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes each mcts agent searches with, or games played at once with --selfplay")
+    parser.add_argument("--time", type=float, default=None, help="mcts seconds per decision")
+    parser.add_argument("--iterations", type=int, default=None, help="mcts rollouts per decision")
+
+    selfplay = parser.add_argument_group("self-play")
+    selfplay.add_argument("--selfplay", type=int, default=None, metavar="N", help="play N headless games")
+    selfplay.add_argument("--seats", nargs=4, default=["mcts", "random", "random", "random"],
+                          choices=AGENT_NAMES, help="agent for each seat")
+    selfplay.add_argument("--out", default="selfplay.jsonl", help="results file, rerun to resume")
+    selfplay.add_argument("--seed", type=int, default=0, help="game i is seeded with seed + i")
+    selfplay.add_argument("--chunksize", type=int, default=None, help="games handed to a worker at a time")
+    selfplay.add_argument("--event-logs", default=None, metavar="DIR",
+                          help="write each game's event log to DIR for replaying")
+    selfplay.add_argument("--dataset", default=None, metavar="PATH",
+                          help="append every turn's starting position and the game's outcome to a training dataset")
+    selfplay.add_argument("--heuristic-setup", action="store_true",
+                          help="every seat places its opening settlements and roads with the setup heuristic")
+    return parser.parse_args()
 
 def main():
-    game = Game()
+    args = parse_args()
+    if args.selfplay is not None:
+        run_selfplay(args.selfplay, args.seats, workers=args.workers, output_path=args.out, seed=args.seed,
+                     chunksize=args.chunksize, mcts_time=args.time if args.time is not None else 0.1,
+                     mcts_iterations=args.iterations, event_log_dir=args.event_logs,
+                     dataset_path=args.dataset, heuristic_setup=args.heuristic_setup)
+        return
+
+    # only the interactive game needs pygame
+    from source.game import Game
+    from source.mcts import MCTSAgent
+    time_limit = args.time if args.time is not None else 1.0
+    agents = {seat: MCTSAgent(workers=args.workers, time_limit=time_limit, iterations=args.iterations)
+              for seat in args.mcts}
+    game = Game(agents)
     game.run()
 
 # run command:
 # python3 main.py
+# python3 main.py --mcts 1 2 3 --workers 4 --time 2
+# python3 main.py --selfplay 1000 --workers 8 --seats mcts random random random --out runs/mcts.jsonl
+# python3 main.py --selfplay 100 --seats random random random random --event-logs runs/events
+# python3 main.py --selfplay 1000 --workers 8 --seats random random random random --dataset runs/positions.bin
+# python3 main.py --selfplay 100 --workers 8 --seats mcts random random random --heuristic-setup
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from .enums import EventType, GamePhase, PlacementType, PlayerAction
+from .topology import BoardTopology
+
+@dataclass(frozen=True)
+class Action:
+    """a single player decision that the engine can carry out"""
+    action_type: PlayerAction
+    target: Optional[Any] = None  # vertex, edge, tile or player index depending on type
+
+@dataclass(frozen=True)
+class GameEvent:
+    """something that happened in the game, with the outcome of any chance involved"""
+    event_type: EventType
+    player_index: int
+    target: Optional[int] = None  # roll, vertex, edge, tile or victim depending on type
+    item: Optional[Enum] = None  # resource stolen or dev card drawn
+
+class ActionSpace:
+    """fixed numbering of every possible action so legal moves can be given as a mask"""
+    def __init__(self, topology: BoardTopology, num_players: int):
+        self.actions: List[Action] = (
+            [Action(PlayerAction.ROLL_DICE), Action(PlayerAction.END_TURN), Action(PlayerAction.BUY_DEV_CARD)] +
+            [Action(PlayerAction.BUILD_SETTLEMENT, v) for v in range(topology.num_vertices)] +
+            [Action(PlayerAction.BUILD_ROAD, e) for e in range(topology.num_edges)] +
+            [Action(PlayerAction.BUILD_CITY, v) for v in range(topology.num_vertices)] +
+            [Action(PlayerAction.MOVE_ROBBER, t) for t in range(topology.num_tiles)] +
+            [Action(PlayerAction.STEAL, p) for p in range(num_players)]
+        )
+        self.index: Dict[Action, int] = {action: i for i, action in enumerate(self.actions)}
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+def legal_actions(engine) -> List[Action]:
+    """every action the engine would accept for the current player right now"""
+    state = engine.game_state
+    if state.game_phase == GamePhase.END:
+        return []
+
+    # robber decisions block everything else
+    robber_manager = engine.robber_manager
+    if robber_manager.stealing_pending:
+        return [Action(PlayerAction.STEAL, victim) for victim in sorted(robber_manager.current_victims)]
+    if robber_manager.move_pending:
+        return [Action(PlayerAction.MOVE_ROBBER, tile) for tile in range(len(engine.board.tiles))
+                if tile != state.robber_position]
+
+    placement_manager = engine.placement_manager
+    if state.game_phase == GamePhase.SETUP:
+        if state.placement_type == PlacementType.SETTLEMENT:
+            return [Action(PlayerAction.BUILD_SETTLEMENT, v) for v in placement_manager.get_legal_settlement_vertices()]
+        return [Action(PlayerAction.BUILD_ROAD, e) for e in placement_manager.get_legal_road_edges()]
+
+    if not state.dice_rolled:
+        return [Action(PlayerAction.ROLL_DICE)]
+
+    actions = [Action(PlayerAction.END_TURN)]
+    if state.dev_card_deck and engine.current_player.can_afford_dev():
+        actions.append(Action(PlayerAction.BUY_DEV_CARD))
+    actions.extend(Action(PlayerAction.BUILD_SETTLEMENT, v) for v in placement_manager.get_legal_settlement_vertices())
+    actions.extend(Action(PlayerAction.BUILD_ROAD, e) for e in placement_manager.get_legal_road_edges())
+    actions.extend(Action(PlayerAction.BUILD_CITY, v) for v in placement_manager.get_legal_city_vertices())
+    return actions
+
+def legal_action_mask(engine) -> List[bool]:
+    """legal actions as booleans over the engine's action space"""
+    mask = [False] * len(engine.action_space)
+    for action in legal_actions(engine):
+        mask[engine.action_space.index[action]] = True
+    return mask
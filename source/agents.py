@@ -0,0 +1,49 @@
+import random
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+from .actions import Action
+from .enums import GamePhase
+
+class Agent(ABC):
+    """something that picks actions for a seat instead of the mouse"""
+    name = "agent"
+
+    @abstractmethod
+    def choose_action(self, engine) -> Action:
+        """pick one of engine.legal_actions() for the current player"""
+
+    def close(self):
+        """release anything the agent holds on to, like worker processes"""
+
+class RandomAgent(Agent):
+    """picks uniformly among the legal actions"""
+    name = "random"
+
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = random.Random(seed)
+
+    def choose_action(self, engine) -> Action:
+        return self.rng.choice(engine.legal_actions())
+
+def play_turn(engine, agents: Dict[int, Agent]) -> Optional[Action]:
+    """let the current seat's agent act once, returns the action or None if that seat isn't an agent"""
+    if engine.game_phase == GamePhase.END:
+        return None
+    agent = agents.get(engine.current_player_index)
+    if agent is None:
+        return None
+    action = agent.choose_action(engine)
+    if not engine.step(action):
+        raise RuntimeError(f"{agent.name} agent picked an illegal action: {action}")
+    return action
+
+def play_game(engine, agents: Dict[int, Agent], max_actions: int = 20000) -> Optional[int]:
+    """run a headless game where every seat is an agent, returns the winner's index if there is one"""
+    missing = [i for i in range(len(engine.players)) if i not in agents]
+    if missing:
+        raise ValueError(f"no agent for seats {missing}")
+    actions_taken = 0
+    while engine.game_phase != GamePhase.END and actions_taken < max_actions:
+        play_turn(engine, agents)
+        actions_taken += 1
+    return engine.winner_index
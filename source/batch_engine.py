@@ -0,0 +1,118 @@
+from typing import Optional
+import numpy as np
+from .board import Board
+from .constants import RESOURCES, RESOURCE_SLOT
+
+class BatchEngine:
+    """many games on the same board advanced in lockstep, dice and production only
+
+    buildings are held per game as an owner and a level (1 settlement, 2 city)
+    per vertex. their (games x players x tiles) yield tensor is folded into
+    per dice number gains, so production is one gather per game plus taking
+    back what the robber's tile would have paid
+    """
+    def __init__(self, board: Board, num_games: int, num_players: int = 4, seed: Optional[int] = None):
+        topology = board.topology
+        self.board = board
+        self.num_games = num_games
+        self.num_players = num_players
+        self.num_tiles = topology.num_tiles
+        self.rng = np.random.default_rng(seed)
+
+        # board tables, shared by every game
+        self.vertex_tiles = np.zeros((topology.num_vertices, topology.num_tiles), dtype=np.int32)
+        for vertex, tiles in enumerate(topology.vertex_tiles):
+            self.vertex_tiles[vertex, list(tiles)] = 1
+        self.tile_numbers = np.array([tile.value or 0 for tile in board.tiles], dtype=np.int8)  # desert is 0
+        self.tile_resources = np.zeros((topology.num_tiles, len(RESOURCES)), dtype=np.int32)  # one-hot, desert empty
+        for tile_idx, tile in enumerate(board.tiles):
+            if tile.resource_type in RESOURCE_SLOT:
+                self.tile_resources[tile_idx, RESOURCE_SLOT[tile.resource_type]] = 1
+
+        # per game state
+        self.owners = np.full((num_games, topology.num_vertices), -1, dtype=np.int8)
+        self.levels = np.zeros((num_games, topology.num_vertices), dtype=np.int8)
+        self.hands = np.zeros((num_games, num_players, len(RESOURCES)), dtype=np.int32)
+        self.robber = np.full(num_games, board.robber_position, dtype=np.int16)
+        self.current_player = np.zeros(num_games, dtype=np.int8)
+        self.turns = 0
+
+        # payouts rebuilt lazily after buildings change
+        self._tile_yields: Optional[np.ndarray] = None  # (games, players, tiles)
+        self._number_gains: Optional[np.ndarray] = None  # (games, dice number, players, resources)
+        self._game_ids = np.arange(num_games)
+
+    @classmethod
+    def from_engine(cls, engine, num_games: int, seed: Optional[int] = None) -> "BatchEngine":
+        """copy the engine's position into every game of the batch"""
+        state = engine.game_state
+        batch = cls(engine.board, num_games, len(engine.players), seed)
+        for vertex, player_index in state.settlements.items():
+            batch.owners[:, vertex] = player_index
+            batch.levels[:, vertex] = 1
+        for vertex, player_index in state.cities.items():
+            batch.owners[:, vertex] = player_index
+            batch.levels[:, vertex] = 2
+        for player_index, player in enumerate(engine.players):
+            batch.hands[:, player_index] = [player.resources[resource] for resource in RESOURCES]
+        batch.robber[:] = state.robber_position
+        batch.current_player[:] = state.current_player_index
+        return batch
+
+    def place_building(self, games, vertex: int, player_index: int, level: int = 1):
+        """put a settlement (level 1) or city (level 2) on a vertex in the selected games"""
+        self.owners[games, vertex] = player_index
+        self.levels[games, vertex] = level
+        self._tile_yields = None
+        self._number_gains = None
+
+    def tile_yields(self) -> np.ndarray:
+        """(games, players, tiles) resources each tile pays each player when it rolls"""
+        if self._tile_yields is None:
+            # (games, players, vertices) payout, then summed onto the tiles around each vertex
+            owned = self.owners[:, None, :] == np.arange(self.num_players, dtype=np.int8)[None, :, None]
+            payout = owned * self.levels[:, None, :].astype(np.int32)
+            self._tile_yields = payout @ self.vertex_tiles
+        return self._tile_yields
+
+    def number_gains(self) -> np.ndarray:
+        """(games, dice number, players, resources) paid out for each roll, ignoring the robber"""
+        if self._number_gains is None:
+            numbers = (self.tile_numbers[:, None] == np.arange(13)[None, :]).astype(np.int32)  # (tiles, 13)
+            self._number_gains = np.einsum("gpt,tn,tr->gnpr", self.tile_yields(), numbers, self.tile_resources)
+        return self._number_gains
+
+    def roll_dice(self) -> np.ndarray:
+        """two dice for every game at once"""
+        return self.rng.integers(1, 7, size=(2, self.num_games), dtype=np.int8).sum(axis=0)
+
+    def produce(self, rolls: np.ndarray):
+        """pay out every game's roll, tiles under the robber give nothing"""
+        self.hands += self.number_gains()[self._game_ids, rolls]
+
+        # games where the robber sits on a tile that rolled
+        blocked = np.flatnonzero(self.tile_numbers[self.robber] == rolls)
+        if len(blocked):
+            robber = self.robber[blocked]
+            lost = self.tile_yields()[blocked, :, robber]  # (blocked games, players)
+            self.hands[blocked] -= lost[:, :, None] * self.tile_resources[robber][:, None, :]
+
+    def move_robbers(self, games: np.ndarray):
+        """move the robber to a random other tile in the selected games"""
+        count = len(games)
+        if count:
+            self.robber[games] = (self.robber[games] + self.rng.integers(1, self.num_tiles, size=count)) % self.num_tiles
+
+    def step(self) -> np.ndarray:
+        """roll, produce or move the robber, then pass the turn, returns the rolls"""
+        rolls = self.roll_dice()
+        self.produce(rolls)  # sevens never match a tile number
+        self.move_robbers(np.flatnonzero(rolls == 7))
+        self.current_player = (self.current_player + 1) % self.num_players
+        self.turns += 1
+        return rolls
+
+    def run(self, turns: int):
+        """advance every game by a number of turns"""
+        for _ in range(turns):
+            self.step()
@@ -0,0 +1,291 @@
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+from .constants import (MAX_ROADS, MAX_SETTLEMENTS, MAX_CITIES, PLAYER_SEATS, RESOURCES, DEV_CARDS,
+                        RESOURCE_SLOT, DEV_CARD_SLOT)
+from .enums import GamePhase, PlacementType
+from .board import Board
+from .player import Player
+from .game_state import GameState
+
+# building costs laid out in RESOURCES order
+ROAD_COST = (1, 1, 0, 0, 0)
+SETTLEMENT_COST = (1, 1, 0, 1, 1)
+CITY_COST = (0, 0, 3, 2, 0)
+DEV_CARD_COST = (0, 0, 1, 1, 1)
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """yield the index of every set bit, lowest first"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+class BitboardTables:
+    """bitmask adjacency for one board, shared by every state copied from it"""
+    def __init__(self, board: Board):
+        topology = board.topology
+        self.board = board
+        self.num_vertices = topology.num_vertices
+        self.num_edges = topology.num_edges
+        self.all_vertices = (1 << topology.num_vertices) - 1
+
+        # a vertex and its neighbours, i.e. everything a settlement there blocks
+        self.vertex_block_mask = [
+            (1 << v) | sum(1 << n for n in topology.vertex_neighbors[v]) for v in range(topology.num_vertices)
+        ]
+        self.vertex_edge_mask = [sum(1 << e for e in topology.vertex_edges[v]) for v in range(topology.num_vertices)]
+        self.edge_vertex_mask = [(1 << v1) | (1 << v2) for v1, v2 in topology.edge_vertices]
+        self.tile_vertex_mask = [sum(1 << v for v in vertices) for vertices in topology.tile_vertices]
+
+        # dice number -> (tile index, resource slot, vertex mask) for every producing tile
+        self.tiles_by_number: Dict[int, List[Tuple[int, int, int]]] = {number: [] for number in range(2, 13)}
+        for tile_idx, tile in enumerate(board.tiles):
+            if tile.value is not None:
+                self.tiles_by_number[tile.value].append(
+                    (tile_idx, RESOURCE_SLOT[tile.resource_type], self.tile_vertex_mask[tile_idx])
+                )
+
+class BitboardState:
+    """compact copy of GameState: bitmasks for buildings and flat int arrays for cards"""
+    __slots__ = (
+        "tables", "num_players", "settlements", "cities", "roads", "hands", "dev_cards",
+        "knights_played", "hidden_victory_points", "current_player_index", "game_phase",
+        "setup_phase", "setup_direction", "setup_turns_completed", "placement_mode",
+        "placement_type", "dice_rolled", "dice_value", "hover_distance", "robber_position",
+        "longest_road_holder", "largest_army_holder", "dev_card_deck",
+    )
+
+    def __init__(self, tables: BitboardTables, num_players: int):
+        self.tables = tables
+        self.num_players = num_players
+        self.settlements = [0] * num_players  # vertex bitmask per player
+        self.cities = [0] * num_players  # vertex bitmask per player
+        self.roads = [0] * num_players  # edge bitmask per player
+        self.hands = array('H', [0] * (num_players * len(RESOURCES)))
+        self.dev_cards = array('H', [0] * (num_players * len(DEV_CARDS)))
+        self.knights_played = array('H', [0] * num_players)
+        self.hidden_victory_points = array('H', [0] * num_players)
+        self.current_player_index = 0
+        self.game_phase = GamePhase.SETUP
+        self.setup_phase = 0
+        self.setup_direction = 1
+        self.setup_turns_completed = 0
+        self.placement_mode = True
+        self.placement_type = PlacementType.SETTLEMENT
+        self.dice_rolled = False
+        self.dice_value: Optional[int] = None
+        self.hover_distance = 20
+        self.robber_position = 0
+        self.longest_road_holder: Optional[int] = None
+        self.largest_army_holder: Optional[int] = None
+        self.dev_card_deck = bytearray()  # DEV_CARDS slots, drawn from the end
+
+    # conversion
+
+    @classmethod
+    def from_game_state(cls, game_state: GameState, tables: Optional[BitboardTables] = None) -> "BitboardState":
+        """pack a GameState into bitboards"""
+        tables = tables or BitboardTables(game_state.board)
+        state = cls(tables, len(game_state.players))
+
+        for vertex, player_index in game_state.settlements.items():
+            state.settlements[player_index] |= 1 << vertex
+        for vertex, player_index in game_state.cities.items():
+            state.cities[player_index] |= 1 << vertex
+        for edge, player_index in game_state.roads.items():
+            state.roads[player_index] |= 1 << edge
+
+        for i, player in enumerate(game_state.players):
+            for rt, amount in player.resources.items():
+                state.hands[i * len(RESOURCES) + RESOURCE_SLOT[rt]] = amount
+            for card, amount in player.dev_cards.items():
+                state.dev_cards[i * len(DEV_CARDS) + DEV_CARD_SLOT[card]] = amount
+            state.knights_played[i] = player.knights_played
+            state.hidden_victory_points[i] = player.hidden_victory_points
+
+        state.current_player_index = game_state.current_player_index
+        state.game_phase = game_state.game_phase
+        state.setup_phase = game_state.setup_phase
+        state.setup_direction = game_state.setup_direction
+        state.setup_turns_completed = game_state.setup_turns_completed
+        state.placement_mode = game_state.placement_mode
+        state.placement_type = game_state.placement_type
+        state.dice_rolled = game_state.dice_rolled
+        state.dice_value = game_state.dice_value
+        state.hover_distance = game_state.hover_distance
+        state.robber_position = game_state.robber_position
+        state.longest_road_holder = game_state.longest_road_holder
+        state.largest_army_holder = game_state.largest_army_holder
+        state.dev_card_deck = bytearray(DEV_CARD_SLOT[card] for card in game_state.dev_card_deck)
+        return state
+
+    def to_game_state(self, players: Optional[List[Player]] = None) -> GameState:
+        """unpack into a GameState, reusing colors and names from players if given"""
+        seats = [(p.color, p.name) for p in players] if players else PLAYER_SEATS
+        new_players = []
+        for i in range(self.num_players):
+            player = Player(*seats[i])
+            for slot, rt in enumerate(RESOURCES):
+                player.resources[rt] = self.hands[i * len(RESOURCES) + slot]
+            for slot, card in enumerate(DEV_CARDS):
+                player.dev_cards[card] = self.dev_cards[i * len(DEV_CARDS) + slot]
+            player.settlements = list(iter_bits(self.settlements[i]))
+            player.cities = list(iter_bits(self.cities[i]))
+            player.roads = list(iter_bits(self.roads[i]))
+            player.knights_played = self.knights_played[i]
+            player.hidden_victory_points = self.hidden_victory_points[i]
+            player.has_longest_road = self.longest_road_holder == i
+            player.has_largest_army = self.largest_army_holder == i
+            player.visible_victory_points = self.visible_victory_points(i)
+            new_players.append(player)
+
+        return GameState(
+            board=self.tables.board,
+            players=new_players,
+            current_player_index=self.current_player_index,
+            game_phase=self.game_phase,
+            setup_phase=self.setup_phase,
+            setup_direction=self.setup_direction,
+            settlements={v: i for i in range(self.num_players) for v in iter_bits(self.settlements[i])},
+            roads={e: i for i in range(self.num_players) for e in iter_bits(self.roads[i])},
+            cities={v: i for i in range(self.num_players) for v in iter_bits(self.cities[i])},
+            placement_mode=self.placement_mode,
+            placement_type=self.placement_type,
+            dice_rolled=self.dice_rolled,
+            hover_distance=self.hover_distance,
+            setup_turns_completed=self.setup_turns_completed,
+            robber_position=self.robber_position,
+            dice_value=self.dice_value,
+            longest_road_holder=self.longest_road_holder,
+            largest_army_holder=self.largest_army_holder,
+            dev_card_deck=[DEV_CARDS[slot] for slot in self.dev_card_deck]
+        )
+
+    # copying and hashing
+
+    def copy(self) -> "BitboardState":
+        """cheap copy, the tables are shared"""
+        state = BitboardState.__new__(BitboardState)
+        for name in self.__slots__:
+            setattr(state, name, getattr(self, name))
+        state.settlements = self.settlements[:]
+        state.cities = self.cities[:]
+        state.roads = self.roads[:]
+        state.hands = array('H', self.hands)
+        state.dev_cards = array('H', self.dev_cards)
+        state.knights_played = array('H', self.knights_played)
+        state.hidden_victory_points = array('H', self.hidden_victory_points)
+        state.dev_card_deck = bytearray(self.dev_card_deck)
+        return state
+
+    def key(self) -> tuple:
+        """everything that identifies the state, usable as a dict key"""
+        return (
+            tuple(self.settlements), tuple(self.cities), tuple(self.roads),
+            self.hands.tobytes(), self.dev_cards.tobytes(), self.knights_played.tobytes(),
+            self.hidden_victory_points.tobytes(), self.current_player_index, self.game_phase,
+            self.setup_phase, self.setup_direction, self.setup_turns_completed, self.placement_mode,
+            self.placement_type, self.dice_rolled, self.dice_value, self.robber_position,
+            self.longest_road_holder, self.largest_army_holder, bytes(self.dev_card_deck),
+        )
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, BitboardState) and self.key() == other.key()
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+    # hands
+
+    def hand(self, player_index: int) -> array:
+        """resource counts for a player in RESOURCES order"""
+        start = player_index * len(RESOURCES)
+        return self.hands[start:start + len(RESOURCES)]
+
+    def can_afford(self, player_index: int, cost: Tuple[int, ...]) -> bool:
+        """check a player's hand against a cost tuple"""
+        start = player_index * len(RESOURCES)
+        return all(self.hands[start + slot] >= amount for slot, amount in enumerate(cost))
+
+    # legality
+
+    def occupied_vertices(self) -> int:
+        """every vertex holding a settlement or city"""
+        occupied = 0
+        for i in range(self.num_players):
+            occupied |= self.settlements[i] | self.cities[i]
+        return occupied
+
+    def all_roads(self) -> int:
+        """every edge holding a road"""
+        roads = 0
+        for mask in self.roads:
+            roads |= mask
+        return roads
+
+    def road_vertices(self, player_index: int) -> int:
+        """vertices touched by a player's roads"""
+        vertices = 0
+        for edge in iter_bits(self.roads[player_index]):
+            vertices |= self.tables.edge_vertex_mask[edge]
+        return vertices
+
+    def legal_settlement_mask(self, player_index: int) -> int:
+        """vertices the player could settle on"""
+        if self.settlements[player_index].bit_count() >= MAX_SETTLEMENTS:
+            return 0
+        blocked = 0
+        for vertex in iter_bits(self.occupied_vertices()):
+            blocked |= self.tables.vertex_block_mask[vertex]
+        legal = self.tables.all_vertices & ~blocked
+
+        if self.game_phase == GamePhase.PLAY:
+            if not self.can_afford(player_index, SETTLEMENT_COST):
+                return 0
+            legal &= self.road_vertices(player_index)
+        return legal
+
+    def legal_road_mask(self, player_index: int) -> int:
+        """edges the player could build a road on"""
+        if self.roads[player_index].bit_count() >= MAX_ROADS:
+            return 0
+        if self.game_phase == GamePhase.PLAY and not self.can_afford(player_index, ROAD_COST):
+            return 0
+        anchors = self.road_vertices(player_index) | self.settlements[player_index] | self.cities[player_index]
+        candidates = 0
+        for vertex in iter_bits(anchors):
+            candidates |= self.tables.vertex_edge_mask[vertex]
+        return candidates & ~self.all_roads()
+
+    def legal_city_mask(self, player_index: int) -> int:
+        """settlements the player could upgrade"""
+        if self.cities[player_index].bit_count() >= MAX_CITIES:
+            return 0
+        if self.game_phase == GamePhase.PLAY and not self.can_afford(player_index, CITY_COST):
+            return 0
+        return self.settlements[player_index]
+
+    # production
+
+    def produce(self, roll_value: int):
+        """pay out a dice roll straight into the hand arrays"""
+        for tile_idx, slot, vertex_mask in self.tables.tiles_by_number.get(roll_value, ()):
+            if tile_idx == self.robber_position:
+                continue
+            for i in range(self.num_players):
+                amount = (self.settlements[i] & vertex_mask).bit_count() + 2 * (self.cities[i] & vertex_mask).bit_count()
+                if amount:
+                    self.hands[i * len(RESOURCES) + slot] += amount
+
+    # scoring
+
+    def visible_victory_points(self, player_index: int) -> int:
+        """points other players can see"""
+        points = self.settlements[player_index].bit_count() + 2 * self.cities[player_index].bit_count()
+        points += 2 if self.longest_road_holder == player_index else 0
+        points += 2 if self.largest_army_holder == player_index else 0
+        return points
+
+    def victory_points(self, player_index: int) -> int:
+        """total points including victory point cards"""
+        return self.visible_victory_points(player_index) + self.hidden_victory_points[player_index]
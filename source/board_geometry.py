@@ -0,0 +1,145 @@
+import math
+from typing import List, Optional, Tuple
+from .constants import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE
+from .topology import BoardTopology
+from .spatial_index import SpatialGrid
+
+class BoardGeometry:
+    """maps board tiles, vertices and edges to screen pixels for the frontend"""
+    def __init__(self, topology: BoardTopology, tile_size: float = TILE_SIZE):
+        self.topology = topology
+        self.tile_size = tile_size
+        self.hex_height = tile_size * 2
+        self.hex_width = math.sqrt(3) * tile_size
+        self.calculate_board_dimensions()
+
+        # pixel positions indexed by vertex and edge id
+        self.vertex_positions: List[Tuple[int, int]] = [
+            self.lattice_to_pixel(x, y) for x, y in self.topology.vertex_lattice
+        ]
+        self.edge_positions: List[Tuple[Tuple[int, int], Tuple[int, int]]] = [
+            (self.vertex_positions[v1], self.vertex_positions[v2]) for v1, v2 in self.topology.edge_vertices
+        ]
+
+        # buckets for hover picking, half a tile per cell keeps each query to a handful of items
+        self.vertex_grid = SpatialGrid(tile_size / 2)
+        for vertex, (x, y) in enumerate(self.vertex_positions):
+            self.vertex_grid.insert_point(vertex, x, y)
+        self.edge_grid = SpatialGrid(tile_size / 2)
+        for edge, (start, end) in enumerate(self.edge_positions):
+            self.edge_grid.insert_segment(edge, start, end)
+
+    def calculate_board_dimensions(self):
+        """figure out where to place the board on screen"""
+        board_width = self.hex_width * 5
+        board_height = self.hex_height * 4.5
+        self.board_left = (SCREEN_WIDTH - board_width) // 2
+        self.board_top = (SCREEN_HEIGHT - board_height) // 2 - self.hex_height // 4
+        self.board_center_x = SCREEN_WIDTH // 2
+        self.board_center_y = self.board_top + board_height // 2
+
+    def lattice_to_pixel(self, x: int, y: int) -> Tuple[int, int]:
+        """convert a topology lattice point to a rounded screen position"""
+        return (round(self.board_center_x + x * self.hex_width / 2),
+                round(self.board_center_y + y * self.tile_size / 2))
+
+    def get_hex_center(self, q: int, r: int) -> Tuple[float, float]:
+        """convert hex coords to pixel position"""
+        x = self.board_center_x + self.hex_width * (q + r/2)
+        y = self.board_center_y + self.hex_height * r * 0.75
+        return (x, y)
+
+    def get_tile_center(self, tile_idx: int) -> Tuple[float, float]:
+        """pixel position of a tile's center"""
+        return self.get_hex_center(*self.topology.axial_layout[tile_idx])
+
+    def get_hex_corners(self, center_x: float, center_y: float) -> List[Tuple[float, float]]:
+        """get all corner points for a hex"""
+        corners = []
+        for i in range(6):
+            angle_deg = 60 * i - 30  # pointy-top orientation
+            angle_rad = math.pi / 180 * angle_deg
+            corner_x = center_x + self.tile_size * math.cos(angle_rad)
+            corner_y = center_y + self.tile_size * math.sin(angle_rad)
+            corners.append((corner_x, corner_y))
+        return corners
+
+    def find_nearest_vertex(self, pos: Tuple[int, int], max_dist: float = 20) -> Optional[int]:
+        """find closest vertex to mouse"""
+        nearest = None
+        min_dist = float('inf')
+
+        for vertex in sorted(self.vertex_grid.query(pos[0], pos[1], max_dist)):
+            x, y = self.vertex_positions[vertex]
+            dist = math.hypot(pos[0] - x, pos[1] - y)
+            if dist < min_dist and dist <= max_dist:
+                min_dist = dist
+                nearest = vertex
+
+        return nearest
+
+    def find_nearest_edge(self, pos: Tuple[int, int], max_dist: float = 20) -> Optional[int]:
+        """find closest edge to mouse"""
+        nearest = None
+        min_dist = float('inf')
+
+        for edge in sorted(self.edge_grid.query(pos[0], pos[1], max_dist)):
+            start, end = self.edge_positions[edge]
+            dist = point_to_segment_distance(pos, start, end)
+            if dist < min_dist and dist <= max_dist:
+                min_dist = dist
+                nearest = edge
+
+        return nearest
+
+    def pixel_to_axial(self, x: float, y: float) -> Tuple[int, int]:
+        """convert screen position to the hex it falls in"""
+        x_offset = (x - self.board_center_x)
+        y_offset = (y - self.board_center_y)
+
+        # fractional axial coords for a pointy-top layout
+        q = (math.sqrt(3) / 3 * x_offset - y_offset / 3) / self.tile_size
+        r = (2 / 3 * y_offset) / self.tile_size
+        return cube_round(q, r)
+
+    def tile_at_pixel(self, x: float, y: float) -> Optional[int]:
+        """get the index of the tile under a screen position"""
+        return self.topology.tile_index.get(self.pixel_to_axial(x, y))
+
+    def axial_to_pixel(self, q: int, r: int) -> Tuple[float, float]:
+        """Convert axial coordinates to pixel coordinates"""
+        return self.get_hex_center(q, r)
+
+def point_to_segment_distance(point: Tuple[float, float], line_start: Tuple[float, float],
+                              line_end: Tuple[float, float]) -> float:
+    """shortest distance from a point to a line segment"""
+    px, py = point
+    x1, y1 = line_start
+    x2, y2 = line_end
+
+    # vector math for distance
+    line_vec = (x2-x1, y2-y1)
+    point_vec = (px-x1, py-y1)
+    line_len = math.sqrt(line_vec[0]**2 + line_vec[1]**2)
+
+    if line_len == 0:
+        return math.hypot(px-x1, py-y1)
+
+    t = max(0, min(1, (point_vec[0]*line_vec[0] + point_vec[1]*line_vec[1]) / (line_len*line_len)))
+    proj_x = x1 + t * line_vec[0]
+    proj_y = y1 + t * line_vec[1]
+
+    return math.hypot(px-proj_x, py-proj_y)
+
+def cube_round(q: float, r: float) -> Tuple[int, int]:
+    """round fractional axial coords to the nearest hex"""
+    s = -q - r
+    rq, rr, rs = round(q), round(r), round(s)
+    q_diff, r_diff, s_diff = abs(rq - q), abs(rr - r), abs(rs - s)
+
+    # the coord that moved the most gets rebuilt from the other two
+    if q_diff > r_diff and q_diff > s_diff:
+        rq = -rr - rs
+    elif r_diff > s_diff:
+        rr = -rq - rs
+    return (rq, rr)
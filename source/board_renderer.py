@@ -2,19 +2,43 @@ import math
 from typing import List, Optional, Tuple
 from .enums import GamePhase
 from .constants import *
+from .fonts import render_text
 from .board import Board
+from .board_geometry import BoardGeometry
 import pygame
 
 class BoardRenderer:
     """handles rendering for the game board"""
-    def __init__(self, board: Board):
+    def __init__(self, board: Board, geometry: BoardGeometry):
         self.board = board
+        self.geometry = geometry
+        self.background: Optional[pygame.Surface] = None  # sea, tiles and numbers, they never change
+
+        # everything the board draws stays inside the tiles plus the biggest piece hanging over the edge
+        corners = [corner for q, r in self.board.axial_layout
+                   for corner in self.geometry.get_hex_corners(*self.geometry.get_hex_center(q, r))]
+        left = min(x for x, _ in corners)
+        top = min(y for _, y in corners)
+        self.board_rect = pygame.Rect(int(left), int(top), math.ceil(max(x for x, _ in corners) - left),
+                                      math.ceil(max(y for _, y in corners) - top)).inflate(32, 32)
+
+    def get_background(self, size: Tuple[int, int]) -> pygame.Surface:
+        """the static board layer, built once and again only when the screen size changes"""
+        if self.background is None or self.background.get_size() != size:
+            self.background = pygame.Surface(size).convert()
+            self.background.fill(BLUE_SEA)
+            self.draw_hex_tiles(self.background)
+        return self.background
+
+    def draw_board(self, screen, game) -> pygame.Rect:
+        """main draw function for the board and all its pieces, returns the area it covers"""
+        screen.blit(self.get_background(screen.get_size()), (0, 0))
+
+        # show where robber can move
+        if game.engine.robber_manager.move_pending:
+            game.robber_renderer.draw_placement_indicator(screen, pygame.mouse.get_pos())
+        game.robber_renderer.draw_robber(screen)
 
-    def draw_board(self, screen, game):
-        """main draw function for the board and all its pieces"""
-        self._draw_hex_tiles(screen, game)
-        game.robber_manager.draw_robber(screen) 
-        
         # draw game pieces in order
         self._draw_roads(screen, game.game_state.roads, game.game_state.players)
         self._draw_settlements(screen, game)
@@ -23,6 +47,7 @@ class BoardRenderer:
         # show placement indicators during setup and placement
         if game.game_state.placement_mode or game.game_state.game_phase == GamePhase.SETUP:
             self._draw_placement_indicators(screen, game)
+        return self.board_rect
 
     def draw_hexagon(self, surface: pygame.Surface, color: Tuple[int, int, int], 
                     center: Tuple[float, float], size: float):
@@ -36,41 +61,38 @@ class BoardRenderer:
         pygame.draw.polygon(surface, color, points)
         pygame.draw.polygon(surface, BLACK, points, 4)
 
-    def _draw_hex_tiles(self, screen, game):
+    def draw_hex_tiles(self, surface):
         """draw all the hex tiles on the board"""
         for index, (q, r) in enumerate(self.board.axial_layout):
             tile = self.board.get_tile_at(index)
-            x, y = self.board.get_hex_center(q, r)
+            x, y = self.geometry.get_hex_center(q, r)
             color = RESOURCE_COLORS[tile.resource_type.name]
-            self.draw_hexagon(screen, color, (x, y), TILE_SIZE)
-
-            # show where robber can move
-            if game.robber_manager.move_pending:
-                game.robber_manager.draw_placement_indicator(screen, pygame.mouse.get_pos())
+            self.draw_hexagon(surface, color, (x, y), TILE_SIZE)
 
             if tile.value is not None:
-                text = FONT.render(str(tile.value), True, BLACK)
+                text = render_text(str(tile.value), BLACK)
                 text_rect = text.get_rect(center=(x, y))
-                screen.blit(text, text_rect)
+                surface.blit(text, text_rect)
 
     def _draw_roads(self, screen, roads, players):
         """draw all player roads"""
-        for (start, end), player_index in roads.items():
+        for edge, player_index in roads.items():
+            start, end = self.geometry.edge_positions[edge]
             road_color = players[player_index].color
             pygame.draw.line(screen, BLACK, start, end, 6)
             pygame.draw.line(screen, road_color, start, end, 4)
 
     def _draw_settlements(self, screen, game):
         """draw all settlements"""
-        for coord, player_index in game.game_state.settlements.items():
-            x, y = coord
+        for vertex, player_index in game.game_state.settlements.items():
+            x, y = self.geometry.vertex_positions[vertex]
             pygame.draw.circle(screen, game.game_state.players[player_index].color, (int(x), int(y)), 8)
             pygame.draw.circle(screen, BLACK, (int(x), int(y)), 8, 2)
 
     def _draw_cities(self, screen, cities, players):
         """draw all cities as stars"""
-        for coord, player_index in cities.items():
-            x, y = coord
+        for vertex, player_index in cities.items():
+            x, y = self.geometry.vertex_positions[vertex]
             star_size = 12
             player_color = players[player_index].color
             
@@ -85,25 +107,35 @@ class BoardRenderer:
             pygame.draw.polygon(screen, player_color, points)
             pygame.draw.polygon(screen, BLACK, points, 2)
 
+    def placement_indicators(self, game) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+        """the hovered settlement spot, city upgrade and road that get an indicator, None where nothing shows"""
+        state = game.game_state
+        placement_manager = game.engine.placement_manager
+        corner, settlement, road = state.hovered_corner, state.hovered_settlement, state.hovered_road
+        if corner is not None and not placement_manager.is_valid_settlement_placement(corner):
+            corner = None
+        if settlement is not None and not (state.placement_mode and game.current_player.can_afford_city()):
+            settlement = None
+        if road is not None and not placement_manager.is_valid_road_placement(road):
+            road = None
+        return corner, settlement, road
+
     def _draw_placement_indicators(self, screen, game):
         """draw hover indicators for building placement"""
         current_player_color = game.game_state.players[game.game_state.current_player_index].color
+        corner, settlement, road = self.placement_indicators(game)
         
         # show settlement placement
-        if game.game_state.hovered_corner:
-            x, y = game.game_state.hovered_corner
-            if game.placement_manager.is_valid_settlement_placement((x, y)):
-                pygame.draw.circle(screen, current_player_color, (int(x), int(y)), 10, 4)
+        if corner is not None:
+            x, y = self.geometry.vertex_positions[corner]
+            pygame.draw.circle(screen, current_player_color, (int(x), int(y)), 10, 4)
 
         # show city upgrade
-        if game.game_state.hovered_settlement:
-            x, y = game.game_state.hovered_settlement
-            if (game.game_state.placement_mode and 
-                game.current_player.can_afford_city()):
-                pygame.draw.circle(screen, current_player_color, (int(x), int(y)), 14, 4)
+        if settlement is not None:
+            x, y = self.geometry.vertex_positions[settlement]
+            pygame.draw.circle(screen, current_player_color, (int(x), int(y)), 14, 4)
 
         # show road placement 
-        if game.game_state.hovered_road:
-            start, end = game.game_state.hovered_road
-            if game.placement_manager.is_valid_road_placement(start, end):
-                pygame.draw.line(screen, current_player_color, start, end, 4)
\ No newline at end of file
+        if road is not None:
+            start, end = self.geometry.edge_positions[road]
+            pygame.draw.line(screen, current_player_color, start, end, 4)
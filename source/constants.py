@@ -1,11 +1,15 @@
-import pygame
-pygame.init()
+from .enums import ResourceType, DevCardType
 
 # Screen size
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 900
 TILE_SIZE = 60
 
+# pieces each player has in their supply
+MAX_ROADS = 15
+MAX_SETTLEMENTS = 5
+MAX_CITIES = 4
+
 # colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -18,6 +22,15 @@ ORANGE = (255, 165, 0)
 LIGHT_GRAY = (200, 200, 200)
 GRAY = (100,100,100)
 
+# fixed slot order for hand and dev card arrays
+RESOURCES = [rt for rt in ResourceType if rt != ResourceType.DESERT]
+DEV_CARDS = list(DevCardType)
+RESOURCE_SLOT = {rt: i for i, rt in enumerate(RESOURCES)}
+DEV_CARD_SLOT = {card: i for i, card in enumerate(DEV_CARDS)}
+
+# seat colors and names in turn order
+PLAYER_SEATS = [(RED, "Red"), (BLUE, "Blue"), (GREEN, "Green"), (YELLOW, "Yellow")]
+
 # Resource colors
 RESOURCE_COLORS = {
     'WOOD': (34, 139, 34),    # Forest Green
@@ -27,6 +40,3 @@ RESOURCE_COLORS = {
     'WOOL': (144, 238, 144),  # Light Green
     'DESERT': (194, 178, 128) # Sand
 }
-
-# Font
-FONT = pygame.font.Font(None, 24)
\ No newline at end of file
@@ -0,0 +1,153 @@
+import os
+import struct
+from typing import Iterator, List, Optional, Set
+import numpy as np
+from .board import Board
+from .game_state import GameState
+from .observation import ObservationEncoder
+
+DATASET_MAGIC = b"CTNDS"
+DATASET_VERSION = 1
+HEADER_SIZE = 64  # keeps the records float aligned
+HEADER_FORMAT = struct.Struct("<5sBIIB")  # magic, version, observation size, record size, players
+
+def record_dtype(observation_size: int, num_players: int) -> np.dtype:
+    """one training position: the observation from the player to move plus the game's outcome
+
+    winner is -1 for games cut off before anyone won, victory_points are the
+    final totals by seat
+    """
+    return np.dtype([
+        ("observation", np.float32, (observation_size,)),
+        ("game", np.uint32),
+        ("turn", np.uint32),
+        ("player", np.uint8),
+        ("winner", np.int8),
+        ("victory_points", np.uint8, (num_players,)),
+    ], align=True)
+
+def _read_header(f) -> tuple:
+    magic, version, observation_size, record_size, num_players = HEADER_FORMAT.unpack(f.read(HEADER_FORMAT.size))
+    if magic != DATASET_MAGIC:
+        raise ValueError("not a position dataset")
+    if version != DATASET_VERSION:
+        raise ValueError(f"dataset version {version} is not supported, expected {DATASET_VERSION}")
+    dtype = record_dtype(observation_size, num_players)
+    if dtype.itemsize != record_size:
+        raise ValueError(f"dataset records are {record_size} bytes, expected {dtype.itemsize}")
+    return dtype, num_players
+
+class PositionRecorder:
+    """collects the encoded positions of one game until its outcome is known"""
+    def __init__(self, board: Board, game_id: int, num_players: int = 4):
+        self.encoder = ObservationEncoder(board, num_players)
+        self.dtype = record_dtype(self.encoder.size, num_players)
+        self.game_id = game_id
+        self.scratch = self.encoder.new_buffer()
+        self.records = np.zeros(64, dtype=self.dtype)
+        self.count = 0
+
+    def add(self, game_state: GameState, turn: int):
+        """encode the position from the point of view of the player to move"""
+        if self.count == len(self.records):
+            self.records = np.concatenate([self.records, np.zeros(len(self.records), dtype=self.dtype)])
+        player_index = game_state.current_player_index
+        record = self.records[self.count]
+        record["observation"] = self.encoder.encode(game_state, self.scratch, perspective=player_index)
+        record["game"] = self.game_id
+        record["turn"] = turn
+        record["player"] = player_index
+        self.count += 1
+
+    def finish(self, winner: Optional[int], victory_points: List[int]) -> np.ndarray:
+        """the game's records labelled with its outcome"""
+        records = self.records[:self.count]
+        records["winner"] = -1 if winner is None else winner
+        records["victory_points"] = victory_points
+        return records
+
+class DatasetWriter:
+    """appends fixed size position records to a single file
+
+    a new file takes its layout from the first records written. opening an
+    existing file cuts off a half written record left by a crash, and with
+    keep_games also the trailing records of games that aren't in it, for
+    resuming a run whose results file is the record of what finished
+    """
+    def __init__(self, path: str, keep_games: Optional[Set[int]] = None, buffer_size: int = 1 << 20):
+        self.path = path
+        self.dtype: Optional[np.dtype] = None
+        if os.path.exists(path) and os.path.getsize(path) >= HEADER_SIZE:
+            with open(path, "rb") as f:
+                self.dtype, _ = _read_header(f)
+            self._trim(keep_games)
+        else:
+            open(path, "wb").close()
+        self.file = open(path, "ab", buffering=buffer_size)
+
+    def _trim(self, keep_games: Optional[Set[int]]):
+        count = (os.path.getsize(self.path) - HEADER_SIZE) // self.dtype.itemsize
+        if keep_games is not None and count:
+            games = np.memmap(self.path, dtype=self.dtype, mode="r", offset=HEADER_SIZE, shape=(count,))["game"]
+            while count and int(games[count - 1]) not in keep_games:
+                count -= 1
+            del games
+        with open(self.path, "r+b") as f:
+            f.truncate(HEADER_SIZE + count * self.dtype.itemsize)
+
+    def write(self, records: np.ndarray) -> int:
+        """append records, returns how many"""
+        if self.dtype is None:
+            self.dtype = records.dtype
+            header = HEADER_FORMAT.pack(DATASET_MAGIC, DATASET_VERSION, self.dtype["observation"].shape[0],
+                                        self.dtype.itemsize, self.dtype["victory_points"].shape[0])
+            self.file.write(header.ljust(HEADER_SIZE, b"\0"))
+        elif records.dtype != self.dtype:
+            raise ValueError(f"records have dtype {records.dtype}, the dataset holds {self.dtype}")
+        self.file.write(records.tobytes())
+        return len(records)
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class DatasetReader:
+    """the records of a dataset file as a read only numpy.memmap
+
+    nothing is loaded up front, minibatches only touch the pages of the rows they pick
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self.dtype, self.num_players = _read_header(f)
+        count = (os.path.getsize(path) - HEADER_SIZE) // self.dtype.itemsize
+        if count:
+            self.records = np.memmap(path, dtype=self.dtype, mode="r", offset=HEADER_SIZE, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=self.dtype)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def observations(self) -> np.ndarray:
+        """(records, observation size) view straight onto the file"""
+        return self.records["observation"]
+
+    def sample(self, batch_size: int, rng: np.random.Generator) -> np.ndarray:
+        """batch_size random records, with replacement, read in file order"""
+        return self.records[np.sort(rng.integers(0, len(self.records), size=batch_size))]
+
+    def batches(self, batch_size: int, rng: Optional[np.random.Generator] = None) -> Iterator[np.ndarray]:
+        """one pass over every record in batches, shuffled when given rng"""
+        order = np.arange(len(self.records)) if rng is None else rng.permutation(len(self.records))
+        for start in range(0, len(order), batch_size):
+            yield self.records[np.sort(order[start:start + batch_size])]
@@ -1,6 +1,5 @@
 from typing import Optional
-import random
-from .enums import DevCardType, ResourceType
+from .enums import DevCardType, EventType, ResourceType, StateDomain
 from .player import Player
 
 class DevCardManager:
@@ -15,21 +14,22 @@ class DevCardManager:
             [DevCardType.YEAR_OF_PLENTY] * 2 +
             [DevCardType.MONOPOLY] * 2
         )
-        random.shuffle(self.initial_deck)
+        self.game.rng.deck.shuffle(self.initial_deck)
 
     def init_deck(self):
         """initialize the dev card deck with standard distribution"""
         self.game.game_state.dev_card_deck = self.initial_deck.copy()
-        self.game.update_game_state()
+        self.game.game_state.mark_dirty(StateDomain.DEV_CARDS)
 
     def draw_dev_card(self) -> Optional[DevCardType]:
         """draw a card from the deck if available"""
         if not self.game.game_state.dev_card_deck:
-            print("No development cards left in the deck!")
+            if not self.game.quiet:
+                print("No development cards left in the deck!")
             return None
             
         card = self.game.game_state.dev_card_deck.pop()
-        self.game.update_game_state()
+        self.game.game_state.mark_dirty(StateDomain.DEV_CARDS)
         return card
 
     def buy_dev_card(self, player: Player) -> bool:
@@ -42,12 +42,14 @@ class DevCardManager:
         
         # check if any cards in deck
         if not self.game.game_state.dev_card_deck:
-            print("No development cards left in the deck!")
+            if not self.game.quiet:
+                print("No development cards left in the deck!")
             return False
             
         # check if player can afford
         if not player.has_resources(dev_cost):
-            print(f"Player {player.name} cannot afford a development card!")
+            if not self.game.quiet:
+                print(f"Player {player.name} cannot afford a development card!")
             return False
             
         player.spend_resources(dev_cost)
@@ -55,7 +57,9 @@ class DevCardManager:
         # draw and add to hand
         drawn_card = self.draw_dev_card()
         player.dev_cards[drawn_card] += 1
-        print(f"Player {player.name} bought a {drawn_card.name} card!")
+        if not self.game.quiet:
+            print(f"Player {player.name} bought a {drawn_card.name} card!")
+        self.game.emit(EventType.BUY_DEV_CARD, self.game.game_state.current_player_index, item=drawn_card)
         
-        self.game.update_game_state()
+        self.game.game_state.mark_dirty(StateDomain.RESOURCES, StateDomain.DEV_CARDS)
         return True
\ No newline at end of file
@@ -0,0 +1,50 @@
+import pygame
+from typing import Optional
+from .constants import BLACK, LIGHT_GRAY
+from .dice import Dice
+from .fonts import render_text
+
+class DiceRenderer:
+    """draws the roll button and the latest dice roll"""
+    def __init__(self, screen, font, dice: Dice):
+        self.screen = screen
+        self.font = font
+        self.dice = dice
+        self.roll_time = 0
+        self.display_duration = 3000  # show roll for 3 seconds
+        self.seen_roll_count = 0
+        self.showing_roll = False
+
+    def get_button_rect(self) -> pygame.Rect:
+        """where the roll button sits on screen"""
+        return pygame.Rect(self.screen.get_width() - 150, 20, 130, 50)
+
+    def draw_button(self) -> pygame.Rect:
+        """draw the roll button"""
+        button_rect = self.get_button_rect()
+        pygame.draw.rect(self.screen, LIGHT_GRAY, button_rect)  
+        pygame.draw.rect(self.screen, BLACK, button_rect, 2)
+        text = render_text("Roll Dice", BLACK, self.font)
+        text_rect = text.get_rect(center=button_rect.center)
+        self.screen.blit(text, text_rect)
+        return button_rect
+
+    def update(self):
+        """note a new roll and hide the roll once its display time is up"""
+        current_time = pygame.time.get_ticks()
+        if self.dice.roll_count != self.seen_roll_count:
+            self.seen_roll_count = self.dice.roll_count
+            self.roll_time = current_time
+        self.showing_roll = self.dice.roll_value is not None and current_time - self.roll_time < self.display_duration
+
+    def draw_roll(self) -> Optional[pygame.Rect]:
+        """draw current roll if within display time"""
+        if self.showing_roll:
+            text = render_text(f"Dice Roll: {self.dice.roll_value}", BLACK, self.font)
+            text_rect = text.get_rect(center=(self.screen.get_width() // 2, 50))
+            return self.screen.blit(text, text_rect)
+        return None
+
+    def is_button_clicked(self, pos) -> bool:
+        """check if a click landed on the roll button"""
+        return self.get_button_rect().collidepoint(pos)
@@ -0,0 +1,278 @@
+from typing import Callable, List, Optional
+from .constants import PLAYER_SEATS
+from .enums import EventType, GamePhase, PlacementType, PlayerAction, StateDomain
+from .actions import Action, ActionSpace, GameEvent, legal_actions, legal_action_mask
+from .board import Board
+from .player import Player
+from .dice import Dice
+from .game_state import GameState
+from .setup_phase import SetupPhaseManager
+from .placement import PlacementManager
+from .resources import ResourceManager
+from .dev_card import DevCardManager
+from .victory_points import VictoryPointManager
+from .robber import RobberManager
+from .history import ActionHistory
+from .rng import GameRng
+
+class GameEngine:
+    """headless rules engine, owns the board, game state and managers"""
+    def __init__(self, seed: Optional[int] = None, quiet: bool = False):
+        """set up board, managers and the initial game state
+
+        every random part of the game draws from streams split from seed, none
+        given takes one from the module generator. a quiet engine prints nothing,
+        so searches and self-play don't pay for formatting messages no one reads
+        """
+        self.rng = GameRng(seed)
+        self.quiet = quiet
+        self.board = Board(rng=self.rng.board)
+        self.dice = Dice()
+        self.dice.set_game(self)
+        self.message_listeners: List[Callable[[str], None]] = []
+        self.event_listeners: List[Callable[[GameEvent], None]] = []
+        self.winner_index: Optional[int] = None
+
+        # initialize game managers
+        self.dev_card_manager = DevCardManager(self)  # create manager before game state
+        self.setup_manager = SetupPhaseManager(self)
+        self.placement_manager = PlacementManager(self)
+        self.resource_manager = ResourceManager(self)
+        self.robber_manager = RobberManager(self)
+        self.victory_point_manager = VictoryPointManager(self)
+
+        # set up initial game state
+        self.game_state = GameState(
+            board=self.board,
+            players=[Player(color, name) for color, name in PLAYER_SEATS],
+            current_player_index=0,
+            game_phase=GamePhase.SETUP,
+            setup_phase=0,
+            setup_direction=1,
+            setup_turns_completed=0,
+            settlements={},
+            roads={},
+            cities={},
+            placement_mode=True,
+            placement_type=PlacementType.SETTLEMENT,
+            dice_rolled=False,
+            hover_distance=20,
+            robber_position=self.board.robber_position
+        )
+
+        # init deck after game state exists
+        self.dev_card_manager.init_deck()
+        self.action_space = ActionSpace(self.board.topology, len(self.players))
+        self.history = ActionHistory(self)
+
+    def __getstate__(self):
+        """copies and pickles leave the listeners and undo history behind"""
+        state = self.__dict__.copy()
+        state["message_listeners"] = []
+        state["event_listeners"] = []
+        state["history"] = ActionHistory(self)
+        return state
+
+    @property
+    def players(self):
+        return self.game_state.players
+
+    @property
+    def settlements(self):
+        return self.game_state.settlements
+
+    @property
+    def roads(self):
+        return self.game_state.roads
+
+    @property
+    def cities(self):
+        return self.game_state.cities
+
+    @property
+    def placement_mode(self):
+        return self.game_state.placement_mode
+
+    @placement_mode.setter
+    def placement_mode(self, value):
+        self.game_state.placement_mode = value
+        self.game_state.mark_dirty(StateDomain.TURN)
+
+    @property
+    def dice_rolled_this_turn(self):
+        return self.game_state.dice_rolled
+
+    @dice_rolled_this_turn.setter
+    def dice_rolled_this_turn(self, value):
+        self.game_state.dice_rolled = value
+        self.game_state.mark_dirty(StateDomain.TURN)
+
+    @property
+    def game_phase(self):
+        return self.game_state.game_phase
+
+    @game_phase.setter
+    def game_phase(self, value):
+        self.game_state.game_phase = value
+        self.game_state.mark_dirty(StateDomain.TURN)
+
+    @property
+    def current_player_index(self):
+        return self.game_state.current_player_index
+
+    @current_player_index.setter
+    def current_player_index(self, value):
+        self.game_state.current_player_index = value
+        self.game_state.mark_dirty(StateDomain.TURN)
+
+    @property
+    def current_player(self):
+        return self.players[self.current_player_index]
+
+    def load_game_state(self, game_state: GameState):
+        """switch to a saved state and rebuild everything the managers derive from it
+
+        robber decisions in progress aren't part of GameState, so load states
+        saved between decisions (encode_snapshot refuses any other)
+        """
+        self.board = game_state.board
+        self.game_state = game_state
+        self.dice.roll_value = game_state.dice_value
+        self.placement_manager.rebuild_indexes()
+        self.resource_manager.rebuild_production()
+        self.robber_manager.reset()
+        self.victory_point_manager.longest_road_holder = game_state.longest_road_holder
+        self.victory_point_manager.largest_army_holder = game_state.largest_army_holder
+        self.victory_point_manager.road_lengths.clear()
+        self.winner_index = None
+        if game_state.game_phase == GamePhase.END:
+            self.winner_index = next((i for i, player in enumerate(self.players)
+                                      if player.calculate_total_victory_points() >= 10), None)
+        self.action_space = ActionSpace(self.board.topology, len(self.players))
+        self.history.clear()
+        game_state.mark_dirty(*StateDomain)
+
+    def notify(self, text: str):
+        """print a message and pass it on to anyone listening"""
+        if not self.quiet:
+            print(text)
+        for listener in self.message_listeners:
+            listener(text)
+
+    def emit(self, event_type: EventType, player_index: int, target: Optional[int] = None, item=None):
+        """pass a game event on to anyone listening, nothing is built when no one is"""
+        if self.event_listeners:
+            event = GameEvent(event_type, player_index, target, item)
+            for listener in self.event_listeners:
+                listener(event)
+
+    def step(self, action: Action) -> bool:
+        """carry out a player action, returns False if it isn't allowed right now"""
+        action_type = action.action_type
+        if self.game_phase == GamePhase.END:
+            return False
+
+        # robber decisions block everything else
+        if self.robber_manager.stealing_pending:
+            if action_type == PlayerAction.STEAL:
+                return self.robber_manager.choose_victim(action.target)
+            return False
+        if self.robber_manager.move_pending:
+            if action_type == PlayerAction.MOVE_ROBBER:
+                return self.robber_manager.move_robber(action.target)
+            return False
+
+        if self.game_phase == GamePhase.SETUP:
+            if action_type == PlayerAction.BUILD_SETTLEMENT:
+                return self.setup_manager.place_settlement(action.target)
+            if action_type == PlayerAction.BUILD_ROAD:
+                return self.setup_manager.place_road(action.target)
+            return False
+
+        # nothing else happens until the dice are rolled
+        if action_type == PlayerAction.ROLL_DICE:
+            return self.roll_dice() is not None
+        if not self.dice_rolled_this_turn:
+            return False
+        if action_type == PlayerAction.END_TURN:
+            return self.end_turn()
+        if action_type == PlayerAction.BUY_DEV_CARD:
+            return self.dev_card_manager.buy_dev_card(self.current_player)
+        if action_type == PlayerAction.BUILD_SETTLEMENT:
+            if self.placement_manager.is_valid_settlement_placement(action.target):
+                self.placement_manager.place_settlement(action.target)
+                return True
+        elif action_type == PlayerAction.BUILD_ROAD:
+            if self.placement_manager.is_valid_road_placement(action.target):
+                self.placement_manager.place_road(action.target)
+                return True
+        elif action_type == PlayerAction.BUILD_CITY:
+            if self.placement_manager.is_valid_city_placement(action.target):
+                self.placement_manager.place_city(action.target)
+                return True
+        return False
+
+    def apply(self, action: Action) -> bool:
+        """step like step does but keep what changed so undo can take it back"""
+        return self.history.apply(action)
+
+    def undo(self) -> Optional[Action]:
+        """take back the last applied action, returns it or None if there is nothing to undo"""
+        return self.history.undo()
+
+    def legal_actions(self) -> List[Action]:
+        """every action step would accept right now"""
+        return legal_actions(self)
+
+    def legal_action_mask(self) -> List[bool]:
+        """legal actions as booleans over the action space"""
+        return legal_action_mask(self)
+
+    def roll_dice(self, value: Optional[int] = None) -> Optional[int]:
+        """roll for the current turn and resolve production or the robber, value replays a recorded roll"""
+        if self.game_phase != GamePhase.PLAY or self.dice_rolled_this_turn:
+            return None
+
+        roll_value = self.dice.roll(value)
+        if not self.quiet:
+            print(f"rolled: {roll_value}")
+        self.dice_rolled_this_turn = True
+        self.emit(EventType.ROLL, self.current_player_index, roll_value)
+
+        if roll_value == 7:
+            self.robber_manager.handle_seven_rolled()
+        else:
+            self.resource_manager.distribute_resources(roll_value, self.players)
+        return roll_value
+
+    def end_turn(self) -> bool:
+        """handle end of turn logic and state updates"""
+        if not self.dice_rolled_this_turn:
+            if not self.quiet:
+                print("you must roll the dice before ending your turn")
+            return False
+
+        if self.robber_manager.move_pending:
+            if not self.quiet:
+                print("you must move the robber before ending your turn")
+            return False
+
+        # check for winner first
+        player_index = self.current_player_index
+        if self.victory_point_manager.update_victory_points():
+            self.emit(EventType.END_TURN, player_index)
+            return True
+
+        self.current_player_index = (self.current_player_index + 1) % len(self.players)
+        self.dice_rolled_this_turn = False
+        self.placement_mode = False
+        self.emit(EventType.END_TURN, player_index)
+        return True
+
+    def handle_winner(self, winner_index: int):
+        """handle game end when someone wins"""
+        winner = self.players[winner_index]
+        self.winner_index = winner_index
+        self.game_phase = GamePhase.END
+        if not self.quiet:
+            print(f"game over! {winner.name} wins with {winner.calculate_total_victory_points()} points!")
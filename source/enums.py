@@ -54,6 +54,9 @@ class PlayerAction(Enum):
     PLAY_DEV_CARD: Play a previously purchased development card
     TRADE: Trade resources with other players or the bank
     END_TURN: End the current player's turn
+    ROLL_DICE: Roll the dice to start the turn
+    MOVE_ROBBER: Move the robber to a new tile after rolling a 7
+    STEAL: Steal a random resource from a player next to the robber
     """
     BUILD_SETTLEMENT = auto()
     BUILD_CITY = auto()
@@ -62,6 +65,9 @@ class PlayerAction(Enum):
     PLAY_DEV_CARD = auto()
     TRADE = auto()
     END_TURN = auto()
+    ROLL_DICE = auto()
+    MOVE_ROBBER = auto()
+    STEAL = auto()
 
 class PlacementType(Enum):
     """
@@ -79,4 +85,52 @@ class TurnPhase(Enum):
     ROBBER = auto()      # after rolling 7, must move robber
     POST_ROLL = auto()   # after rolling, can build/trade/etc
     TRADING = auto()     # during trade negotiation
-    END = auto()         # turn is complete
\ No newline at end of file
+    END = auto()         # turn is complete
+
+class StateDomain(Enum):
+    """
+    Parts of the game state that can be marked dirty independently.
+    BOARD: Settlements, cities and roads on the board
+    RESOURCES: Resource cards in player hands
+    TURN: Current player, game phase and placement mode
+    DICE: Dice roll for the current turn
+    ROBBER: Robber position and pending robber decisions
+    DEV_CARDS: Development card deck and cards in hand
+    VICTORY_POINTS: Victory points, longest road and largest army
+    HOVER: Hovered vertex, edge or settlement in the frontend
+    """
+    BOARD = auto()
+    RESOURCES = auto()
+    TURN = auto()
+    DICE = auto()
+    ROBBER = auto()
+    DEV_CARDS = auto()
+    VICTORY_POINTS = auto()
+    HOVER = auto()
+
+class EventType(Enum):
+    """
+    Records in the binary game event log.
+    GAME_START: Snapshot of the state a game's events start from
+    CHECKPOINT: Snapshot taken every few turns so replays can seek
+    ROLL: Dice rolled for the turn
+    BUILD_SETTLEMENT: Settlement placed on a vertex
+    BUILD_ROAD: Road placed on an edge
+    BUILD_CITY: Settlement upgraded to a city
+    MOVE_ROBBER: Robber moved to a tile
+    STEAL: Resource taken from a player next to the robber
+    BUY_DEV_CARD: Development card bought from the deck
+    END_TURN: Turn passed to the next player
+    RESOURCE_CHEAT: Debug key handed out free resources
+    """
+    GAME_START = auto()
+    CHECKPOINT = auto()
+    ROLL = auto()
+    BUILD_SETTLEMENT = auto()
+    BUILD_ROAD = auto()
+    BUILD_CITY = auto()
+    MOVE_ROBBER = auto()
+    STEAL = auto()
+    BUY_DEV_CARD = auto()
+    END_TURN = auto()
+    RESOURCE_CHEAT = auto()
@@ -0,0 +1,293 @@
+import mmap
+import os
+import struct
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+from .actions import Action, GameEvent
+from .constants import RESOURCES, DEV_CARDS
+from .engine import GameEngine
+from .enums import EventType, GamePhase, PlayerAction
+from .snapshot import EMPTY, encode_snapshot, decode_snapshot
+
+EVENT_TYPES = list(EventType)
+EVENT_CODES = {event_type: code for code, event_type in enumerate(EVENT_TYPES)}
+RESOURCE_CODES = {resource: code for code, resource in enumerate(RESOURCES)}
+DEV_CARD_CODES = {card: code for code, card in enumerate(DEV_CARDS)}
+
+# every record is length prefixed so a reader can skip what it doesn't need:
+#   header      length of the rest of the record, event type
+#   event       player, target, item slot (resource or dev card), EMPTY when unused
+#   GAME_START  snapshot of the state the game's events start from
+#   CHECKPOINT  turns and events since GAME_START, then a snapshot
+RECORD_HEADER = struct.Struct("<HB")
+EVENT_BODY = struct.Struct("<BBB")
+EVENT_RECORD = struct.Struct("<HBBBB")  # header and body packed in one go
+CHECKPOINT_HEADER = struct.Struct("<II")
+
+# sidecar index, one entry per GAME_START and CHECKPOINT: event type, turn, events, offset
+INDEX_ENTRY = struct.Struct("<BIIQ")
+INDEX_SUFFIX = ".idx"
+
+BUILD_ACTIONS = {
+    EventType.BUILD_SETTLEMENT: PlayerAction.BUILD_SETTLEMENT,
+    EventType.BUILD_ROAD: PlayerAction.BUILD_ROAD,
+    EventType.BUILD_CITY: PlayerAction.BUILD_CITY,
+}
+
+class IndexEntry(NamedTuple):
+    event_type: EventType
+    turn: int
+    events: int
+    offset: int
+
+def _item_slot(event: GameEvent) -> int:
+    if event.item is None:
+        return EMPTY
+    if event.event_type == EventType.BUY_DEV_CARD:
+        return DEV_CARD_CODES[event.item]
+    return RESOURCE_CODES[event.item]
+
+def encode_event(event: GameEvent) -> bytes:
+    """one length prefixed event record"""
+    target = EMPTY if event.target is None else event.target
+    return EVENT_RECORD.pack(EVENT_BODY.size + 1, EVENT_CODES[event.event_type],
+                             event.player_index, target, _item_slot(event))
+
+def decode_event(event_type: EventType, body) -> GameEvent:
+    player_index, target, slot = EVENT_BODY.unpack(body)
+    item = None
+    if slot != EMPTY:
+        item = DEV_CARDS[slot] if event_type == EventType.BUY_DEV_CARD else RESOURCES[slot]
+    return GameEvent(event_type, player_index, None if target == EMPTY else target, item)
+
+class EventLogWriter:
+    """appends the events of an engine's games to a binary log as they happen
+
+    writes go through a buffered file, so call close (or use it as a context
+    manager) to get the tail onto disk. every checkpoint_every turns a snapshot
+    is written too and noted in the sidecar index so replays can start there
+    """
+    def __init__(self, path: str, checkpoint_every: Optional[int] = 10, buffer_size: int = 1 << 16):
+        self.path = path
+        self.checkpoint_every = checkpoint_every
+        self.file = open(path, "ab", buffering=buffer_size)
+        self.index_file = open(path + INDEX_SUFFIX, "ab", buffering=buffer_size)
+        self.offset = self.file.tell()
+        self.engine = None
+        self.turn = 0
+        self.events = 0
+
+    def attach(self, engine):
+        """start a new game in the log from the engine's current state"""
+        snapshot = encode_snapshot(engine)
+        if self.engine is not None:
+            self.detach()
+        self.engine = engine
+        self.turn = 0
+        self.events = 0
+        self._write_snapshot(EventType.GAME_START, snapshot)
+        engine.event_listeners.append(self.record)
+
+    def detach(self):
+        """stop following the current engine"""
+        if self.engine is not None:
+            self.engine.event_listeners.remove(self.record)
+            self.engine = None
+
+    def record(self, event: GameEvent):
+        """event listener, writes the event and any checkpoint due after it"""
+        data = encode_event(event)
+        self.file.write(data)
+        self.offset += len(data)
+        self.events += 1
+        if event.event_type == EventType.END_TURN:
+            self.turn += 1
+            if (self.checkpoint_every and self.turn % self.checkpoint_every == 0 and
+                    self.engine.game_phase != GamePhase.END):
+                self._write_snapshot(EventType.CHECKPOINT, CHECKPOINT_HEADER.pack(self.turn, self.events) +
+                                     encode_snapshot(self.engine))
+
+    def _write_snapshot(self, event_type: EventType, payload: bytes):
+        self.index_file.write(INDEX_ENTRY.pack(EVENT_CODES[event_type], self.turn, self.events, self.offset))
+        data = RECORD_HEADER.pack(len(payload) + 1, EVENT_CODES[event_type]) + payload
+        self.file.write(data)
+        self.offset += len(data)
+
+    def flush(self):
+        self.file.flush()
+        self.index_file.flush()
+
+    def close(self):
+        self.detach()
+        self.file.close()
+        self.index_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class EventLogReader:
+    """reads an event log back and rebuilds game states by replaying it through the engine"""
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self.index = self._load_index()
+        self.starts = [i for i, entry in enumerate(self.index) if entry.event_type == EventType.GAME_START]
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _load_index(self) -> List[IndexEntry]:
+        """the sidecar index, or a scan of the log when it's missing"""
+        index_path = self.path + INDEX_SUFFIX
+        if not os.path.exists(index_path):
+            return self.scan_index()
+        with open(index_path, "rb") as f:
+            raw = f.read()
+        index = []
+        for event_type, turn, events, offset in INDEX_ENTRY.iter_unpack(raw[:len(raw) - len(raw) % INDEX_ENTRY.size]):
+            if offset >= len(self.data):  # written before the log's own buffer reached the disk
+                break
+            index.append(IndexEntry(EVENT_TYPES[event_type], turn, events, offset))
+        return index
+
+    def scan_index(self) -> List[IndexEntry]:
+        """rebuild the index by walking the record headers"""
+        index = []
+        turn = events = 0
+        for offset, event_type, start, end in self._records(0, len(self.data)):
+            if event_type == EventType.GAME_START:
+                turn = events = 0
+                index.append(IndexEntry(event_type, 0, 0, offset))
+            elif event_type == EventType.CHECKPOINT:
+                index.append(IndexEntry(event_type, turn, events, offset))
+            else:
+                events += 1
+                turn += event_type == EventType.END_TURN
+        return index
+
+    def _records(self, offset: int, end: int) -> Iterator[Tuple[int, EventType, int, int]]:
+        """offset, type and payload bounds of every whole record between offset and end"""
+        data = self.data
+        unpack_header = RECORD_HEADER.unpack_from
+        header_size = RECORD_HEADER.size
+        while offset + header_size <= end:
+            length, event_type = unpack_header(data, offset)
+            next_offset = offset + 2 + length
+            if next_offset > end:  # torn write at the tail
+                return
+            yield offset, EVENT_TYPES[event_type], offset + header_size, next_offset
+            offset = next_offset
+
+    def __len__(self) -> int:
+        """number of games in the log"""
+        return len(self.starts)
+
+    def _game_bounds(self, game: int) -> Tuple[int, int]:
+        first = self.starts[game]
+        last = self.starts[game + 1] if game + 1 < len(self.starts) else len(self.index)
+        end = self.index[last].offset if last < len(self.index) else len(self.data)
+        return first, end
+
+    def events(self, game: int = 0) -> Iterator[GameEvent]:
+        """every event of one game in order"""
+        first, end = self._game_bounds(game)
+        data = self.data
+        for _, event_type, start, stop in self._records(self.index[first].offset, end):
+            if event_type not in (EventType.GAME_START, EventType.CHECKPOINT):
+                yield decode_event(event_type, data[start:stop])
+
+    def replay(self, game: int = 0, turn: Optional[int] = None, events: Optional[int] = None,
+               engine=None, quiet: bool = True, use_checkpoints: bool = True):
+        """engine holding the state after the first turn turns or events events of a game
+
+        with neither limit the whole game is replayed. starts from the latest
+        checkpoint before the limits unless use_checkpoints is off, pass engine
+        to reuse one instead of building a new one, quiet keeps the engine from printing
+        """
+        first, end = self._game_bounds(game)
+        last = self.starts[game + 1] if game + 1 < len(self.starts) else len(self.index)
+        entry = self.index[first]
+        for candidate in self.index[first + 1:last] if use_checkpoints else ():
+            # checkpoints come in turn order, take the latest one inside both limits
+            if (turn is None or candidate.turn <= turn) and (events is None or candidate.events <= events):
+                entry = candidate
+
+        if engine is None:
+            engine = GameEngine(seed=0, quiet=quiet)  # the snapshot replaces its board and deck
+        was_quiet = engine.quiet
+        engine.quiet = quiet or was_quiet
+        try:
+            _, event_type, start, stop = next(self._records(entry.offset, end))
+            payload = self.data[start:stop]
+            if event_type == EventType.CHECKPOINT:
+                payload = payload[CHECKPOINT_HEADER.size:]
+            engine.load_game_state(decode_snapshot(payload, board=engine.board, players=engine.players))
+            self._replay_events(engine, stop, end, entry.turn, entry.events, turn, events)
+        finally:
+            engine.quiet = was_quiet
+        return engine
+
+    def _replay_events(self, engine, offset: int, end: int, turn_count: int, event_count: int,
+                       turn: Optional[int], events: Optional[int]):
+        if (turn is not None and turn_count >= turn) or (events is not None and event_count >= events):
+            return
+        data = self.data
+        records = (decode_event(event_type, data[start:stop])
+                   for _, event_type, start, stop in self._records(offset, end)
+                   if event_type != EventType.CHECKPOINT)
+        event = next(records, None)
+        while event is not None:
+            following = next(records, None)
+            apply_event(engine, event, following)
+            event_count += 1
+            turn_count += event.event_type == EventType.END_TURN
+            if (turn is not None and turn_count >= turn) or (events is not None and event_count >= events):
+                return
+            event = following
+
+def apply_event(engine, event: GameEvent, following: Optional[GameEvent] = None):
+    """carry a logged event out on the engine, using its recorded outcome instead of chance
+
+    following is the next logged event, a robber move needs it to know what was stolen
+    """
+    event_type = event.event_type
+    if event.player_index != engine.current_player_index:
+        raise ValueError(f"{event} is for player {event.player_index}, it's player {engine.current_player_index}'s turn")
+
+    if event_type == EventType.ROLL:
+        applied = engine.roll_dice(event.target) is not None
+    elif event_type in BUILD_ACTIONS:
+        applied = engine.step(Action(BUILD_ACTIONS[event_type], event.target))
+    elif event_type == EventType.MOVE_ROBBER:
+        steal = following.item if following is not None and following.event_type == EventType.STEAL else None
+        applied = engine.robber_manager.move_robber(event.target, steal)
+    elif event_type == EventType.STEAL:
+        # a lone victim was already robbed when the robber moved
+        robber_manager = engine.robber_manager
+        applied = not robber_manager.stealing_pending or robber_manager.choose_victim(event.target, event.item)
+    elif event_type == EventType.BUY_DEV_CARD:
+        deck = engine.game_state.dev_card_deck
+        if not deck or deck[-1] != event.item:
+            raise ValueError(f"{event} doesn't match the top of the deck")
+        applied = engine.step(Action(PlayerAction.BUY_DEV_CARD))
+    elif event_type == EventType.END_TURN:
+        applied = engine.step(Action(PlayerAction.END_TURN))
+    elif event_type == EventType.RESOURCE_CHEAT:
+        engine.resource_manager.give_all_resources_cheat()
+        applied = True
+    else:
+        raise ValueError(f"{event_type.name} records don't replay as events")
+
+    if not applied:
+        raise ValueError(f"{event} could not be replayed")
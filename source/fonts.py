@@ -0,0 +1,12 @@
+from functools import lru_cache
+from typing import Tuple
+import pygame
+pygame.init()
+
+# Font
+FONT = pygame.font.Font(None, 24)
+
+@lru_cache(maxsize=512)
+def render_text(text: str, color: Tuple[int, int, int], font: pygame.font.Font = FONT) -> pygame.Surface:
+    """antialiased text surface, shared between callers so only blit it, least recently used dropped first"""
+    return font.render(text, True, color)
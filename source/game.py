@@ -1,194 +1,140 @@
 import pygame
-import math
-from typing import List, Tuple, Optional
+from typing import Dict, List, Optional
 from .constants import *
-from .enums import ResourceType, DevCardType, GamePhase, PlayerAction, PlacementType
-from .board import Board, Tile
-from .player import Player
-from .dice import Dice
-from .ui_renderer import *
-from .board import *
-from .setup_phase import *
-from .placement import *
+from .fonts import FONT
+from .enums import GamePhase, PlayerAction, StateDomain
+from .actions import Action
+from .engine import GameEngine
+from .ui_renderer import UIRenderer
 from .mouse import InteractionHandler
-from .resources import ResourceManager
 from .board_renderer import BoardRenderer
-from .dev_card import DevCardManager
-from .victory_points import VictoryPointManager
-from .robber import RobberManager
-from .game_state import GameState
+from .board_geometry import BoardGeometry
+from .dice_renderer import DiceRenderer
+from .robber_renderer import RobberRenderer
+from .agents import Agent, play_turn
 
 class Game:
-    """main game class that handles the catan game logic and display"""
-    def __init__(self):
-        """initialize the game state and display"""
+    """pygame frontend that draws the engine and feeds it player input"""
+    def __init__(self, agents: Optional[Dict[int, Agent]] = None):
+        """initialize the engine and display, seats in agents are played by them instead of the mouse"""
+        self.agents = agents or {}
         # set up pygame display
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Catan")
         self.clock = pygame.time.Clock()
-        
+
+        # all game rules live in the headless engine
+        self.engine = GameEngine()
+        self.board = self.engine.board
+        self.geometry = BoardGeometry(self.board.topology)  # pixel positions only exist on this side
+
         # core components for rendering/interaction
-        self.board = Board()
-        self.board_renderer = BoardRenderer(self.board)
+        self.board_renderer = BoardRenderer(self.board, self.geometry)
         self.ui_renderer = UIRenderer(self.screen, self)
         self.interaction_handler = InteractionHandler(self)
-        self.dice = Dice(self.screen, FONT)
-        self.dice.set_game(self)
-        
-        # initialize game managers
-        self.dev_card_manager = DevCardManager(self)  # create manager before game state
-        self.setup_manager = SetupPhaseManager(self)
-        self.placement_manager = PlacementManager(self)
-        self.resource_manager = ResourceManager(self)
-        self.robber_manager = RobberManager(self)
-        self.victory_point_manager = VictoryPointManager(self)
-        
-        # set up initial game state
-        self.game_state = GameState(
-            board=self.board,
-            players=[
-                Player(RED, "Red"),
-                Player(BLUE, "Blue"),
-                Player(GREEN, "Green"),
-                Player(YELLOW, "Yellow")
-            ],
-            current_player_index=0,
-            game_phase=GamePhase.SETUP,
-            setup_phase=0,
-            setup_direction=1,
-            setup_turns_completed=0,
-            settlements={},
-            roads={},
-            cities={},
-            placement_mode=True,
-            placement_type=PlacementType.SETTLEMENT,
-            dice_rolled=False,
-            hover_distance=20
-        )
-        
-        # init deck after game state exists
-        self.dev_card_manager.init_deck()
-        
-        self.board.calculate_board_dimensions()
-
-    @property
-    def current_player(self):
-        return self.game_state.players[self.game_state.current_player_index]
-
-    @property
-    def players(self):
-        return self.game_state.players
-
-    @property
-    def settlements(self):
-        return self.game_state.settlements
-
-    @property
-    def roads(self):
-        return self.game_state.roads
-
-    @property
-    def cities(self):
-        return self.game_state.cities
+        self.dice_renderer = DiceRenderer(self.screen, FONT, self.engine.dice)
+        self.robber_renderer = RobberRenderer(self)
+        self.engine.message_listeners.append(self.ui_renderer.add_message)
 
-    @property
-    def game_phase(self):
-        return self.game_state.game_phase
+        # what each layer showed and where it drew on the last presented frame
+        self.drawn_keys: Dict[str, Optional[tuple]] = {}
+        self.drawn_rects: Dict[str, Optional[pygame.Rect]] = {}
+        self.full_redraw = True
 
     @property
-    def placement_mode(self):
-        return self.game_state.placement_mode
-
-    @placement_mode.setter
-    def placement_mode(self, value):
-        self.game_state.placement_mode = value
-
-    @property 
-    def dice_rolled_this_turn(self):
-        return self.game_state.dice_rolled
+    def game_state(self):
+        return self.engine.game_state
 
-    @dice_rolled_this_turn.setter
-    def dice_rolled_this_turn(self, value):
-        self.game_state.dice_rolled = value
-
-    @property 
-    def game_phase(self):
-        return self.game_state.game_phase
-    
-    @game_phase.setter
-    def game_phase(self, value):
-        self.game_state.game_phase = value
-    
     @property
-    def current_player_index(self):
-        return self.game_state.current_player_index
-
-    @current_player_index.setter
-    def current_player_index(self, value):
-        self.game_state.current_player_index = value
+    def players(self):
+        return self.engine.players
 
     @property
     def current_player(self):
-        return self.players[self.current_player_index]
-        
-    def end_turn(self):
-        """handle end of turn logic and state updates"""
-        if not self.dice_rolled_this_turn:
-            print("you must roll the dice before ending your turn")
-            return
-            
-        if self.robber_manager.move_pending:
-            print("you must move the robber before ending your turn")
-            return
+        return self.engine.current_player
 
-        # check for winner first
-        if self.victory_point_manager.update_victory_points():
-            return
-            
-        self.current_player_index = (self.current_player_index + 1) % len(self.players)
-        self.dice_rolled_this_turn = False
-        self.placement_mode = False
-        self.update_game_state()
-        
-    def handle_robber_tile_click(self, mouse_pos):
-        """pass robber clicks to the manager"""
-        return self.robber_manager._handle_tile_click(mouse_pos)
+    def is_agent_turn(self) -> bool:
+        """check if an agent is playing the current seat"""
+        return self.engine.current_player_index in self.agents
 
     def handle_winner(self, winner_index: int):
-        """handle game end when someone wins"""
+        """show the end of game messages"""
         winner = self.players[winner_index]
-        self.game_phase = GamePhase.END
+        self.ui_renderer.game_over = True
         self.ui_renderer.clear_messages()
         self.ui_renderer.add_persistent_message(f"game over! {winner.name} wins with {winner.calculate_total_victory_points()} points!")
         self.ui_renderer.add_persistent_message("press ESC to exit")
 
-    def update_game_state(self):
-        """sync game state with current game info"""
-        self.game_state = GameState(
-            board=self.board,
-            players=self.game_state.players,
-            current_player_index=self.game_state.current_player_index,
-            game_phase=self.game_state.game_phase,
-            setup_phase=self.game_state.setup_phase,
-            setup_direction=self.game_state.setup_direction,
-            settlements=self.game_state.settlements,
-            roads=self.game_state.roads,
-            cities=self.game_state.cities,
-            placement_mode=self.game_state.placement_mode,
-            placement_type=self.game_state.placement_type,
-            dice_rolled=self.game_state.dice_rolled,
-            hover_distance=self.game_state.hover_distance,
-            setup_turns_completed=self.game_state.setup_turns_completed,
-            robber_position=self.game_state.robber_position,
-            dice_value=self.dice.roll_value if hasattr(self.dice, 'roll_value') else None,
-            longest_road_holder=self.victory_point_manager.longest_road_holder,
-            largest_army_holder=self.victory_point_manager.largest_army_holder,
-            hovered_corner=self.game_state.hovered_corner,
-            hovered_road=self.game_state.hovered_road,
-            hovered_city=self.game_state.hovered_city,
-            hovered_settlement=self.game_state.hovered_settlement,
-            dev_card_deck=self.game_state.dev_card_deck
-        )
+    def versions(self, *domains: StateDomain) -> tuple:
+        """version of each domain's last change"""
+        return tuple(self.game_state.domain_versions.get(domain, 0) for domain in domains)
+
+    def frame_keys(self) -> Dict[str, Optional[tuple]]:
+        """what each layer would show right now, a layer only needs drawing when its key changes"""
+        state = self.game_state
+        robber = self.engine.robber_manager
+        robber_hover = self.geometry.tile_at_pixel(*pygame.mouse.get_pos()) if robber.move_pending else None
+        indicators = None
+        if state.placement_mode or state.game_phase == GamePhase.SETUP:
+            # what the indicators show, validity included, since a roll or a purchase changes what's buildable
+            indicators = (state.current_player_index,) + self.board_renderer.placement_indicators(self)
+        return {
+            "board": self.versions(StateDomain.BOARD, StateDomain.ROBBER) + (robber.move_pending, robber_hover, indicators),
+            "players": self.versions(StateDomain.RESOURCES, StateDomain.DEV_CARDS),
+            "buttons": self.versions(StateDomain.TURN, StateDomain.DICE, StateDomain.RESOURCES, StateDomain.DEV_CARDS),
+            "roll": (state.game_phase, state.dice_rolled, self.dice_renderer.showing_roll, self.engine.dice.roll_value),
+            "messages": tuple(self.ui_renderer.status_lines()),
+            "stealing": (tuple(robber.current_victims),) + self.versions(StateDomain.RESOURCES)
+                        if robber.stealing_pending else None,
+        }
+
+    def draw_frame(self) -> Dict[str, Optional[pygame.Rect]]:
+        """draw every layer onto the screen surface, returns the area each one covers"""
+        def union(*rects: Optional[pygame.Rect]) -> Optional[pygame.Rect]:
+            rects = [rect for rect in rects if rect is not None]
+            return rects[0].unionall(rects[1:]) if rects else None
+
+        rects = {"board": self.board_renderer.draw_board(self.screen, self),
+                 "players": self.ui_renderer.draw_player_info(self.players),
+                 "buttons": None, "roll": None}
+        if self.game_state.game_phase == GamePhase.PLAY:
+            rects["buttons"] = union(self.ui_renderer.draw_end_turn_button(self.game_state.dice_rolled),
+                                     self.ui_renderer.draw_placement_mode_button(self.game_state.placement_mode),
+                                     self.ui_renderer.draw_buy_dev_card_button(self.game_state.placement_mode,
+                                                                               self.current_player))
+            # draw dice ui elements
+            if not self.game_state.dice_rolled:
+                rects["roll"] = self.dice_renderer.draw_button()
+            rects["roll"] = union(rects["roll"], self.dice_renderer.draw_roll())
+
+        rects["messages"] = self.ui_renderer.draw_status_messages()
+        rects["stealing"] = self.robber_renderer.draw_stealing_interface(self.screen)
+        return rects
+
+    def present(self) -> List[str]:
+        """redraw and push to the display only the regions whose layers changed since the last frame
+
+        returns the layers that changed
+        """
+        # settle timed messages and the roll once, so the keys and the drawing agree
+        self.ui_renderer.expire_messages()
+        self.dice_renderer.update()
+        keys = self.frame_keys()
+        changed = [name for name, key in keys.items() if self.drawn_keys.get(name) != key]
+        if not changed and not self.full_redraw:
+            return changed
+
+        # layers overlap, so the whole frame is redrawn on the screen surface, which is cheap
+        # with the board pre-rendered, but only the changed regions are sent to the display
+        rects = self.draw_frame()
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            pygame.display.update([rect for name in changed for rect in (self.drawn_rects.get(name), rects[name])
+                                   if rect is not None])
+        self.drawn_keys, self.drawn_rects = keys, rects
+        return changed
 
     def run(self):
         """main game loop"""
@@ -197,62 +143,40 @@ class Game:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.VIDEOEXPOSE:
+                    self.full_redraw = True  # the window was uncovered
                 elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if self.game_state.game_phase != GamePhase.END:
-                        if self.robber_manager.stealing_pending:
-                            self.robber_manager.handle_click(event.pos)
-                        elif self.robber_manager.move_pending:
-                            self.handle_robber_tile_click(event.pos)
-                        else:
-                            self.interaction_handler.handle_click(event.pos)
+                    if self.game_state.game_phase != GamePhase.END and not self.is_agent_turn():
+                        self.interaction_handler.handle_click(event.pos)
                 elif event.type == pygame.MOUSEMOTION:
                     if self.game_state.game_phase != GamePhase.END:
                         self.interaction_handler.handle_mouse_motion(event.pos)
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         running = False
-                    elif self.game_state.game_phase != GamePhase.END:
+                    elif self.game_state.game_phase != GamePhase.END and not self.is_agent_turn():
                         if event.key == pygame.K_f:
-                            self.resource_manager.give_all_resources_cheat()
+                            self.engine.resource_manager.give_all_resources_cheat()
                         elif event.key == pygame.K_r:
-                            if not self.game_state.dice_rolled:
-                                roll_value = self.dice.roll_dice()
-                                if roll_value is not None:
-                                    print(f"rolled: {roll_value}")
-                                    self.game_state.dice_rolled = True
-                                    
-                                    if roll_value == 7:
-                                        self.robber_manager.handle_seven_rolled()
-                                    else:
-                                        self.resource_manager.distribute_resources(roll_value, self.players)
+                            self.engine.step(Action(PlayerAction.ROLL_DICE))
                         elif event.key == pygame.K_e:
-                            self.end_turn()
+                            self.engine.step(Action(PlayerAction.END_TURN))
 
-            # draw everything
-            self.screen.fill(BLUE_SEA)
-            self.board_renderer.draw_board(self.screen, self)
-            self.ui_renderer.draw_player_info(self.players)
-            self.ui_renderer.draw_current_player(self)
-    
-            if self.robber_manager.move_pending:
-                self.ui_renderer.add_message("click a tile to move the robber")          
-            
-            if self.game_state.game_phase == GamePhase.PLAY:
-                self.ui_renderer.draw_end_turn_button(self.game_state.dice_rolled)
-                self.ui_renderer.draw_placement_mode_button(self.game_state.placement_mode)
-                self.ui_renderer.draw_buy_dev_card_button(self.game_state.placement_mode, self.current_player)
+            # agents take one action per frame so the board keeps drawing between them
+            if self.is_agent_turn():
+                play_turn(self.engine, self.agents)
 
-                # draw dice ui elements
-                if not self.game_state.dice_rolled:
-                    self.dice.draw_button()
-                self.dice.draw_roll()
-            
-            self.ui_renderer.draw_status_messages()
+            if self.game_state.game_phase == GamePhase.END and not self.ui_renderer.game_over:
+                self.handle_winner(self.engine.winner_index)
 
-            if self.robber_manager.stealing_pending:
-                self.robber_manager.draw_stealing_interface(self.screen)
-                
-            pygame.display.flip()
+            self.ui_renderer.draw_current_player(self)
+            if self.engine.robber_manager.move_pending:
+                self.ui_renderer.add_message("click a tile to move the robber")
+
+            # an idle frame draws nothing
+            self.present()
             self.clock.tick(60)
 
-        pygame.quit()
\ No newline at end of file
+        for agent in self.agents.values():
+            agent.close()
+        pygame.quit()
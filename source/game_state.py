@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Optional
-from .enums import ResourceType, DevCardType, GamePhase, TurnPhase, PlacementType
+from typing import List, Dict, Set, Tuple, Optional
+from .enums import ResourceType, DevCardType, GamePhase, TurnPhase, PlacementType, StateDomain
 from .player import Player
 from .board import Board
 
@@ -14,9 +14,9 @@ class GameState:
     game_phase: GamePhase
     setup_phase: int
     setup_direction: int
-    settlements: Dict[Tuple[int, int], int]  
-    roads: Dict[Tuple[Tuple[int, int], Tuple[int, int]], int]
-    cities: Dict[Tuple[int, int], int]
+    settlements: Dict[int, int]  # vertex id -> player index
+    roads: Dict[int, int]  # edge id -> player index
+    cities: Dict[int, int]  # vertex id -> player index
     placement_mode: bool
     placement_type: PlacementType
     dice_rolled: bool
@@ -28,17 +28,41 @@ class GameState:
     dice_value: Optional[int] = None
     longest_road_holder: Optional[int] = None
     largest_army_holder: Optional[int] = None
-    hovered_corner: Optional[Tuple[int, int]] = None
-    hovered_road: Optional[Tuple[Tuple[int, int], Tuple[int, int]]] = None
-    hovered_city: Optional[Tuple[int, int]] = None
-    hovered_settlement: Optional[Tuple[int, int]] = None
+    hovered_corner: Optional[int] = None
+    hovered_road: Optional[int] = None
+    hovered_city: Optional[int] = None
+    hovered_settlement: Optional[int] = None
     dev_card_deck: List[DevCardType] = field(default_factory=list)
 
+    # change tracking, the state is mutated in place so consumers check these instead
+    version: int = 0  # bumped on every change
+    dirty: Set[StateDomain] = field(default_factory=set)  # domains changed since the last clear_dirty
+    domain_versions: Dict[StateDomain, int] = field(default_factory=dict)  # version of each domain's last change
+
     def __post_init__(self):
         """make sure we have a deck"""
         if self.dev_card_deck is None:
             self.dev_card_deck = []
-            
+
+    def mark_dirty(self, *domains: StateDomain):
+        """record that the given parts of the state just changed"""
+        self.version += 1
+        for domain in domains:
+            self.dirty.add(domain)
+            self.domain_versions[domain] = self.version
+
+    def clear_dirty(self) -> Set[StateDomain]:
+        """hand back the dirty domains and reset them"""
+        dirty = self.dirty
+        self.dirty = set()
+        return dirty
+
+    def changed_since(self, version: int, *domains: StateDomain) -> bool:
+        """check if any of the domains (or anything at all if none given) changed after version"""
+        if not domains:
+            return self.version > version
+        return any(self.domain_versions.get(domain, 0) > version for domain in domains)
+
     def to_dict(self) -> Dict:
         """convert state to dict for ai processing"""
         return {
@@ -0,0 +1,197 @@
+from typing import Dict, List, Optional, Set, Tuple
+from .actions import Action
+from .enums import DevCardType, PlayerAction, ResourceType, StateDomain
+
+class ActionRecord:
+    """what one applied action changed, enough to put everything back"""
+    __slots__ = ("action", "player_index", "turn", "managers", "hand_changes", "point_changes",
+                 "road_lengths", "drawn_card", "new_blocked", "new_road_vertices", "settlement_slot",
+                 "rolled", "steal_state")
+
+    def __init__(self, action: Action, player_index: int):
+        self.action = action
+        self.player_index = player_index
+        self.turn: Tuple = ()  # game state scalars before the action
+        self.managers: Tuple = ()  # dice, robber and victory point manager fields before the action
+        self.hand_changes: List[Tuple[int, ResourceType, int]] = []  # (player, resource, amount gained)
+        self.point_changes: List[Tuple[int, Tuple]] = []  # (player, points before) for players that changed
+        self.road_lengths: Optional[Dict[int, int]] = None  # longest road cache before, if it changed
+        self.drawn_card: Optional[DevCardType] = None
+        self.new_blocked: List[int] = []  # vertices a settlement newly blocked
+        self.new_road_vertices: List[int] = []  # vertices a road newly connected
+        self.settlement_slot = 0  # where an upgraded settlement sat in the player's list
+        self.rolled: Optional[int] = None  # roll the action drew from the engine's rng
+        self.steal_state: Optional[Tuple] = None  # steal stream before a robber move or steal
+
+class ActionHistory:
+    """applies actions through the engine and keeps a stack of deltas so they can be undone"""
+    def __init__(self, engine):
+        self.engine = engine
+        self.stack: List[ActionRecord] = []
+
+    def __len__(self) -> int:
+        return len(self.stack)
+
+    def apply(self, action: Action) -> bool:
+        """step the engine and remember how to take it back, illegal actions aren't recorded"""
+        engine = self.engine
+        state = engine.game_state
+        players = engine.players
+        placement_manager = engine.placement_manager
+        record = ActionRecord(action, state.current_player_index)
+
+        # cheap captures of everything any action can touch
+        record.turn = self._turn_fields()
+        record.managers = self._manager_fields()
+        hands = [tuple(player.resources.values()) for player in players]
+        points = [self._point_fields(player) for player in players]
+        road_lengths = dict(engine.victory_point_manager.road_lengths)
+        deck_size = len(state.dev_card_deck)
+        top_card = state.dev_card_deck[-1] if state.dev_card_deck else None
+
+        # building deltas depend on the indexes before the placement
+        action_type = action.action_type
+        owner = record.player_index
+        if action_type == PlayerAction.BUILD_SETTLEMENT and isinstance(action.target, int):
+            neighbors = engine.board.topology.vertex_neighbors[action.target]
+            record.new_blocked = [v for v in (action.target, *neighbors)
+                                  if v not in placement_manager.blocked_vertices]
+        elif action_type == PlayerAction.BUILD_ROAD and isinstance(action.target, int):
+            record.new_road_vertices = [v for v in engine.board.topology.edge_vertices[action.target]
+                                        if v not in placement_manager.road_vertices[owner]]
+        elif action_type == PlayerAction.BUILD_CITY and action.target in players[owner].settlements:
+            record.settlement_slot = players[owner].settlements.index(action.target)
+        elif action_type in (PlayerAction.MOVE_ROBBER, PlayerAction.STEAL):
+            record.steal_state = engine.rng.steal.getstate()
+
+        if not engine.step(action):
+            return False
+        if action_type == PlayerAction.ROLL_DICE:
+            record.rolled = state.dice_value
+
+        for player_index, player in enumerate(players):
+            for (resource, amount), before in zip(player.resources.items(), hands[player_index]):
+                if amount != before:
+                    record.hand_changes.append((player_index, resource, amount - before))
+            if self._point_fields(player) != points[player_index]:
+                record.point_changes.append((player_index, points[player_index]))
+        if engine.victory_point_manager.road_lengths != road_lengths:
+            record.road_lengths = road_lengths
+        if len(state.dev_card_deck) != deck_size:
+            record.drawn_card = top_card
+
+        self.stack.append(record)
+        return True
+
+    def undo(self) -> Optional[Action]:
+        """take back the last applied action, returns it or None if there is nothing to undo"""
+        if not self.stack:
+            return None
+        record = self.stack.pop()
+        engine = self.engine
+        state = engine.game_state
+        players = engine.players
+        placement_manager = engine.placement_manager
+        action = record.action
+        owner = record.player_index
+        domains: Set[StateDomain] = {StateDomain.TURN}
+
+        # buildings first, production updates need the robber where it was after the action
+        if action.action_type == PlayerAction.BUILD_SETTLEMENT:
+            vertex = action.target
+            del state.settlements[vertex]
+            players[owner].settlements.remove(vertex)
+            placement_manager.player_buildings[owner].discard(vertex)
+            placement_manager.blocked_vertices.difference_update(record.new_blocked)
+            engine.resource_manager.update_production(vertex, owner, -1)
+            domains.add(StateDomain.BOARD)
+        elif action.action_type == PlayerAction.BUILD_ROAD:
+            del state.roads[action.target]
+            players[owner].roads.pop()
+            placement_manager.road_vertices[owner].difference_update(record.new_road_vertices)
+            domains.add(StateDomain.BOARD)
+        elif action.action_type == PlayerAction.BUILD_CITY:
+            vertex = action.target
+            del state.cities[vertex]
+            state.settlements[vertex] = owner
+            players[owner].cities.remove(vertex)
+            players[owner].settlements.insert(record.settlement_slot, vertex)
+            engine.resource_manager.update_production(vertex, owner, -1)
+            domains.add(StateDomain.BOARD)
+        elif action.action_type == PlayerAction.MOVE_ROBBER:
+            old_position = record.turn[9]  # robber_position in _turn_fields
+            engine.resource_manager.handle_robber_moved(state.robber_position, old_position)
+            domains.add(StateDomain.ROBBER)
+
+        for player_index, resource, amount in record.hand_changes:
+            players[player_index].resources[resource] -= amount
+        if record.hand_changes:
+            domains.add(StateDomain.RESOURCES)
+        for player_index, points in record.point_changes:
+            player = players[player_index]
+            (player.visible_victory_points, player.hidden_victory_points, player.has_longest_road,
+             player.has_largest_army, player.knights_played) = points
+        if record.point_changes:
+            domains.add(StateDomain.VICTORY_POINTS)
+        if record.road_lengths is not None:
+            vp_manager = engine.victory_point_manager
+            vp_manager.road_lengths.clear()
+            vp_manager.road_lengths.update(record.road_lengths)
+        if record.drawn_card is not None:
+            state.dev_card_deck.append(record.drawn_card)
+            players[owner].dev_cards[record.drawn_card] -= 1
+            domains.add(StateDomain.DEV_CARDS)
+
+        # rewind the rng so the same dice and steals come out again
+        if record.rolled is not None:
+            engine.rng.unroll(record.rolled)
+        if record.steal_state is not None:
+            engine.rng.steal.setstate(record.steal_state)
+
+        self._restore_turn_fields(record.turn)
+        self._restore_manager_fields(record.managers)
+        domains.update((StateDomain.DICE, StateDomain.ROBBER))
+
+        # the version keeps counting up so caches see the undo as a change
+        state.mark_dirty(*domains)
+        return action
+
+    def clear(self):
+        """forget every recorded action"""
+        self.stack.clear()
+
+    def _turn_fields(self) -> Tuple:
+        """game state scalars an action can change"""
+        state = self.engine.game_state
+        return (state.current_player_index, state.game_phase, state.setup_phase, state.setup_direction,
+                state.setup_turns_completed, state.placement_mode, state.placement_type, state.dice_rolled,
+                state.dice_value, state.robber_position, state.longest_road_holder, state.largest_army_holder)
+
+    def _restore_turn_fields(self, turn: Tuple):
+        state = self.engine.game_state
+        (state.current_player_index, state.game_phase, state.setup_phase, state.setup_direction,
+         state.setup_turns_completed, state.placement_mode, state.placement_type, state.dice_rolled,
+         state.dice_value, state.robber_position, state.longest_road_holder, state.largest_army_holder) = turn
+
+    def _manager_fields(self) -> Tuple:
+        """manager fields an action can change"""
+        engine = self.engine
+        robber_manager = engine.robber_manager
+        vp_manager = engine.victory_point_manager
+        return (engine.dice.roll_value, engine.dice.roll_count, robber_manager.move_pending,
+                robber_manager.stealing_pending, list(robber_manager.current_victims),
+                vp_manager.longest_road_holder, vp_manager.largest_army_holder, engine.winner_index)
+
+    def _restore_manager_fields(self, managers: Tuple):
+        engine = self.engine
+        robber_manager = engine.robber_manager
+        vp_manager = engine.victory_point_manager
+        (engine.dice.roll_value, engine.dice.roll_count, robber_manager.move_pending,
+         robber_manager.stealing_pending, victims, vp_manager.longest_road_holder,
+         vp_manager.largest_army_holder, engine.winner_index) = managers
+        robber_manager.current_victims[:] = victims  # the renderer may hold on to the list
+
+    @staticmethod
+    def _point_fields(player) -> Tuple:
+        return (player.visible_victory_points, player.hidden_victory_points, player.has_longest_road,
+                player.has_largest_army, player.knights_played)
@@ -0,0 +1,214 @@
+import io
+import math
+import pickle
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from .actions import Action
+from .agents import Agent
+from .enums import GamePhase
+from .rng import GameRng
+
+class Node:
+    """one action in the search tree, stats are kept for every player"""
+    __slots__ = ("player_index", "children", "visits", "rewards")
+
+    def __init__(self, player_index: int, num_players: int):
+        self.player_index = player_index  # who picked the action leading here
+        self.children: Dict[Action, "Node"] = {}
+        self.visits = 0
+        self.rewards = [0.0] * num_players
+
+class MCTSAgent(Agent):
+    """monte carlo tree search with root parallelisation over a process pool
+
+    every worker grows its own tree from a copy of the engine and the root
+    visit counts are summed, so workers never need to talk to each other
+    """
+    name = "mcts"
+
+    def __init__(self, workers: int = 1, time_limit: Optional[float] = 1.0, iterations: Optional[int] = None,
+                 rollout_depth: int = 200, exploration: float = 1.4, seed: Optional[int] = None, verbose: bool = True):
+        if time_limit is None and iterations is None:
+            raise ValueError("mcts needs a time limit, an iteration budget or both")
+        self.workers = max(1, workers)
+        self.time_limit = time_limit  # seconds per decision
+        self.iterations = iterations  # rollouts per decision, split across workers
+        self.rollout_depth = rollout_depth  # random actions before a rollout is scored
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self.verbose = verbose
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.last_stats: Dict[str, float] = {}
+
+    def choose_action(self, engine) -> Action:
+        """search from the current position and pick the most visited action"""
+        actions = engine.legal_actions()
+        if len(actions) == 1:
+            return actions[0]
+
+        start = time.perf_counter()
+        settings = (self.time_limit, self.rollout_depth, self.exploration)
+        budgets = self._split_iterations()
+        seeds = [self.rng.randrange(2 ** 32) for _ in range(self.workers)]
+
+        if self.workers == 1:
+            results = [search(pickle.dumps(engine), budgets[0], seeds[0], settings)]
+        else:
+            if self.pool is None:
+                self.pool = ProcessPoolExecutor(max_workers=self.workers)
+            payload = pickle.dumps(engine)  # pickled once, every worker gets the same bytes
+            futures = [self.pool.submit(search, payload, budget, seed, settings)
+                       for budget, seed in zip(budgets, seeds)]
+            results = [future.result() for future in futures]
+
+        # merge the root statistics of every tree
+        visits: Dict[Action, int] = {}
+        rewards: Dict[Action, float] = {}
+        rollouts = 0
+        for root_stats, worker_rollouts in results:
+            rollouts += worker_rollouts
+            for action, (action_visits, action_reward) in root_stats.items():
+                visits[action] = visits.get(action, 0) + action_visits
+                rewards[action] = rewards.get(action, 0.0) + action_reward
+
+        elapsed = time.perf_counter() - start
+        self.last_stats = {
+            "rollouts": rollouts,
+            "seconds": elapsed,
+            "rollouts_per_second": rollouts / elapsed if elapsed > 0 else 0.0,
+            "workers": self.workers,
+        }
+        if self.verbose:
+            print(f"mcts: {rollouts} rollouts in {elapsed:.2f}s ({self.last_stats['rollouts_per_second']:.0f}/s) "
+                  f"over {self.workers} workers")
+
+        if not visits:
+            return self.rng.choice(actions)
+        return max(visits, key=lambda a: (visits[a], rewards[a] / visits[a]))
+
+    def close(self):
+        """shut down the worker processes"""
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def _split_iterations(self) -> List[Optional[int]]:
+        """share the iteration budget out as evenly as possible"""
+        if self.iterations is None:
+            return [None] * self.workers
+        share, extra = divmod(self.iterations, self.workers)
+        return [share + (1 if i < extra else 0) for i in range(self.workers)]
+
+def search(payload: bytes, iterations: Optional[int], seed: int,
+           settings: Tuple[Optional[float], int, float]) -> Tuple[Dict[Action, Tuple[int, float]], int]:
+    """grow one tree from a pickled engine, returns root (visits, reward) per action and the rollout count"""
+    time_limit, rollout_depth, exploration = settings
+    engine = pickle.loads(payload)
+    engine.quiet = True  # rollouts step thousands of times, nobody reads their messages
+    rng = random.Random(seed)
+
+    # the deck order is hidden, so each tree sees its own shuffle
+    rng.shuffle(engine.game_state.dev_card_deck)
+
+    num_players = len(engine.players)
+    root_player = engine.current_player_index
+    root = Node(root_player, num_players)
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+
+    rollouts = 0
+    while (iterations is None or rollouts < iterations) and (deadline is None or time.perf_counter() < deadline):
+        # fresh streams every pass, the copy would otherwise roll the real game's upcoming dice
+        # and undo rewinds them, which would deal each descent the same dice and steals
+        engine.rng = GameRng(rng.randrange(2 ** 32))
+        _run_iteration(engine, root, rng, rollout_depth, exploration)
+        rollouts += 1
+
+    root_stats = {action: (child.visits, child.rewards[root_player]) for action, child in root.children.items()}
+    return root_stats, rollouts
+
+def _run_iteration(engine, root: Node, rng: random.Random, rollout_depth: int, exploration: float):
+    """select, expand, roll out and back up once, then undo back to the root"""
+    num_players = len(engine.players)
+    path = [root]
+    node = root
+    applied = 0
+
+    # selection and expansion, chance outcomes are re-rolled every pass so the tree is open loop
+    while engine.game_phase != GamePhase.END:
+        actions = engine.legal_actions()
+        untried = [action for action in actions if action not in node.children]
+        player_index = engine.current_player_index
+        if untried:
+            action = rng.choice(untried)
+            engine.apply(action)
+            applied += 1
+            child = Node(player_index, num_players)
+            node.children[action] = child
+            path.append(child)
+            break
+
+        log_visits = math.log(node.visits)
+        action = max(actions, key=lambda a: _uct(node.children[a], log_visits, exploration))
+        engine.apply(action)
+        applied += 1
+        node = node.children[action]
+        path.append(node)
+
+    # random rollout on a throwaway copy, plain step skips recording what every action changed
+    rollout = _throwaway_copy(engine)
+    for _ in range(rollout_depth):
+        if rollout.game_phase == GamePhase.END:
+            break
+        rollout.step(rng.choice(rollout.legal_actions()))
+
+    rewards = _evaluate(rollout)
+    for _ in range(applied):
+        engine.undo()
+
+    for visited in path:
+        visited.visits += 1
+        for i, reward in enumerate(rewards):
+            visited.rewards[i] += reward
+
+class _SharingPickler(pickle.Pickler):
+    """pickles an engine but leaves out the parts a copy can share with it"""
+    def __init__(self, file, shared: List):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.shared_ids = {id(obj): index for index, obj in enumerate(shared)}
+
+    def persistent_id(self, obj):
+        return self.shared_ids.get(id(obj))
+
+class _SharingUnpickler(pickle.Unpickler):
+    """hands the shared parts back to the copy"""
+    def __init__(self, file, shared: List):
+        super().__init__(file)
+        self.shared = shared
+
+    def persistent_load(self, pid):
+        return self.shared[pid]
+
+def _throwaway_copy(engine):
+    """a copy of the engine for one rollout
+
+    the board and action space never change during play and the rng
+    may as well keep running, so only the game state and managers are copied
+    """
+    shared = [engine.board, engine.action_space, engine.rng]
+    buffer = io.BytesIO()
+    _SharingPickler(buffer, shared).dump(engine)
+    buffer.seek(0)
+    return _SharingUnpickler(buffer, shared).load()
+
+def _uct(child: Node, log_parent_visits: float, exploration: float) -> float:
+    """upper confidence bound from the view of the player who picks the child"""
+    mean = child.rewards[child.player_index] / child.visits
+    return mean + exploration * math.sqrt(log_parent_visits / child.visits)
+
+def _evaluate(engine) -> List[float]:
+    """1 for the winner, otherwise a share of the way to ten points"""
+    if engine.winner_index is not None:
+        return [1.0 if i == engine.winner_index else 0.0 for i in range(len(engine.players))]
+    return [min(player.calculate_total_victory_points(), 9) / 10 for player in engine.players]
@@ -1,6 +1,7 @@
 import math
 from typing import Tuple
-from .enums import GamePhase
+from .enums import GamePhase, PlacementType, PlayerAction, StateDomain
+from .actions import Action
 import pygame
 
 class InteractionHandler:
@@ -9,44 +10,71 @@ class InteractionHandler:
 
     def handle_click(self, pos: Tuple[int, int]):
         """handle all mouse clicks during the game"""
-        if self.game.game_state.game_phase == GamePhase.SETUP:
-            self.game.setup_manager.handle_setup_phase()
+        engine = self.game.engine
+        state = self.game.game_state
+
+        # robber choices come first
+        if engine.robber_manager.stealing_pending:
+            victim_idx = self.game.robber_renderer.find_victim_at(pos)
+            if victim_idx is not None:
+                engine.step(Action(PlayerAction.STEAL, victim_idx))
+            return
+        if engine.robber_manager.move_pending:
+            tile_idx = self.game.robber_renderer.find_tile_at(pos)
+            if tile_idx is not None:
+                engine.step(Action(PlayerAction.MOVE_ROBBER, tile_idx))
+            return
+
+        if state.game_phase == GamePhase.SETUP:
+            if state.placement_type == PlacementType.SETTLEMENT and state.hovered_corner is not None:
+                engine.step(Action(PlayerAction.BUILD_SETTLEMENT, state.hovered_corner))
+            elif state.placement_type == PlacementType.ROAD and state.hovered_road is not None:
+                engine.step(Action(PlayerAction.BUILD_ROAD, state.hovered_road))
             
-        elif self.game.game_state.game_phase == GamePhase.PLAY:
+        elif state.game_phase == GamePhase.PLAY:
             # try rolling dice first if not rolled
-            if not self.game.game_state.dice_rolled:
-                roll_value = self.game.dice.handle_click(pos)
-                if roll_value is not None:
-                    print(f"rolled: {roll_value}")
-                    self.game.game_state.dice_rolled = True
-                    self.game.resource_manager.distribute_resources(roll_value, self.game.players)
+            if not state.dice_rolled and self.game.dice_renderer.is_button_clicked(pos):
+                engine.step(Action(PlayerAction.ROLL_DICE))
+                state = self.game.game_state
             
             # check end turn button
-            end_turn_rect = self.game.ui_renderer.draw_end_turn_button(self.game.game_state.dice_rolled)
-            if end_turn_rect is not None and end_turn_rect.collidepoint(pos) and self.game.game_state.dice_rolled:
-                self.game.end_turn()
+            end_turn_rect = self.game.ui_renderer.draw_end_turn_button(state.dice_rolled)
+            if end_turn_rect is not None and end_turn_rect.collidepoint(pos) and state.dice_rolled:
+                engine.step(Action(PlayerAction.END_TURN))
             
             # check placement mode toggle
             placement_mode_rect = self.game.ui_renderer.draw_placement_mode_button(self.game.game_state.placement_mode)
             if placement_mode_rect.collidepoint(pos):
-                self.game.placement_manager.toggle_placement_mode()
+                engine.placement_manager.toggle_placement_mode()
 
             # handle placement mode actions
-            if self.game.game_state.placement_mode:
+            state = self.game.game_state
+            if state.placement_mode:
                 # try buying dev card
                 dev_card_rect = pygame.Rect(20, 20, 150, 40)
                 if dev_card_rect.collidepoint(pos) and self.game.current_player.can_afford_dev():
-                    if self.game.dev_card_manager.buy_dev_card(self.game.current_player):
+                    if engine.step(Action(PlayerAction.BUY_DEV_CARD)):
                         print(f"development card purchased successfully!")
                     return
 
                 # try building things in order
-                if not self.game.placement_manager.try_place_settlement(pos):
-                    if not self.game.placement_manager.try_place_road(pos):
-                        self.game.placement_manager.try_place_city(pos)
+                if state.hovered_corner is not None and engine.step(Action(PlayerAction.BUILD_SETTLEMENT, state.hovered_corner)):
+                    return
+                if state.hovered_road is not None and engine.step(Action(PlayerAction.BUILD_ROAD, state.hovered_road)):
+                    return
+                if state.hovered_settlement is not None:
+                    engine.step(Action(PlayerAction.BUILD_CITY, state.hovered_settlement))
 
     def handle_mouse_motion(self, pos: Tuple[int, int]):
         """handle hover effects when mouse moves"""
+        state = self.game.game_state
+        previous = (state.hovered_corner, state.hovered_road, state.hovered_settlement)
+        self._update_hover(pos)
+        if (state.hovered_corner, state.hovered_road, state.hovered_settlement) != previous:
+            state.mark_dirty(StateDomain.HOVER)
+
+    def _update_hover(self, pos: Tuple[int, int]):
+        """pick the settlement, corner or road under the mouse"""
         if self.game.game_state.placement_mode or self.game.game_state.game_phase == GamePhase.SETUP:
             # clear previous hover states
             self.game.game_state.hovered_corner = None
@@ -55,19 +83,20 @@ class InteractionHandler:
             
             # check settlement upgrade first
             for settlement_pos, player_index in self.game.game_state.settlements.items():
+                x, y = self.game.geometry.vertex_positions[settlement_pos]
                 if (player_index == self.game.game_state.current_player_index and 
-                    math.hypot(pos[0] - settlement_pos[0], pos[1] - settlement_pos[1]) <= self.game.game_state.hover_distance):
+                    math.hypot(pos[0] - x, pos[1] - y) <= self.game.game_state.hover_distance):
                     self.game.game_state.hovered_settlement = settlement_pos
                     return
 
             # then check for new settlement spots
-            nearest_vertex = self.game.board.find_nearest_vertex(pos, self.game.game_state.hover_distance)
-            if nearest_vertex:
+            nearest_vertex = self.game.geometry.find_nearest_vertex(pos, self.game.game_state.hover_distance)
+            if nearest_vertex is not None:
                 self.game.game_state.hovered_corner = nearest_vertex
                 return
                 
             # finally check for road spots
-            nearest_edge = self.game.board.find_nearest_edge(pos, self.game.game_state.hover_distance)
-            if nearest_edge:
+            nearest_edge = self.game.geometry.find_nearest_edge(pos, self.game.game_state.hover_distance)
+            if nearest_edge is not None:
                 self.game.game_state.hovered_road = nearest_edge
                 return
\ No newline at end of file
@@ -0,0 +1,131 @@
+from typing import Dict, Optional, Tuple
+import numpy as np
+from .board import Board
+from .constants import RESOURCES, DEV_CARDS, RESOURCE_SLOT
+from .enums import GamePhase, PlacementType
+from .game_state import GameState
+
+NUMBERS = list(range(2, 13))
+PHASES = list(GamePhase)
+PLACEMENT_TYPES = list(PlacementType)
+PLAYER_SCALARS = ("knights_played", "visible_victory_points", "hidden_victory_points",
+                  "has_longest_road", "has_largest_army", "resource_count", "dev_card_count")
+
+class ObservationEncoder:
+    """writes a game state into flat float32 feature planes for a model
+
+    the buffer is one flat array so it can be a row of a bigger batch; each
+    plane is a reshaped view of it:
+      tiles     (tiles, resource one-hot + desert + number one-hot)
+      robber    (tiles,)
+      buildings (vertices, settlement per player + city per player)
+      roads     (edges, road per player)
+      players   (players, hand + dev cards + scalars)
+      turn      (phase one-hot, current player one-hot, setup phase, dice rolled,
+                 dice value, placement mode, placement type one-hot, deck size,
+                 longest road holder one-hot, largest army holder one-hot)
+    with a perspective seat, players are rotated so that seat comes first and
+    opponents' hands, dev cards and hidden points are blanked, leaving only counts
+    """
+    def __init__(self, board: Board, num_players: int = 4):
+        topology = board.topology
+        self.num_players = num_players
+        self.shapes: Dict[str, Tuple[int, ...]] = {
+            "tiles": (topology.num_tiles, len(RESOURCES) + 1 + len(NUMBERS)),
+            "robber": (topology.num_tiles,),
+            "buildings": (topology.num_vertices, 2 * num_players),
+            "roads": (topology.num_edges, num_players),
+            "players": (num_players, len(RESOURCES) + len(DEV_CARDS) + len(PLAYER_SCALARS)),
+            "turn": (len(PHASES) + num_players + 4 + len(PLACEMENT_TYPES) + 1 + 2 * num_players,),
+        }
+        self.offsets: Dict[str, int] = {}
+        self.size = 0
+        for name, shape in self.shapes.items():
+            self.offsets[name] = self.size
+            self.size += int(np.prod(shape))
+
+        # the board never changes during a game, so its plane is built once and copied in
+        self.tile_features = np.zeros(self.shapes["tiles"], dtype=np.float32)
+        desert_column = len(RESOURCES)
+        for tile_idx, tile in enumerate(board.tiles):
+            if tile.resource_type in RESOURCE_SLOT:
+                self.tile_features[tile_idx, RESOURCE_SLOT[tile.resource_type]] = 1
+            else:
+                self.tile_features[tile_idx, desert_column] = 1
+            if tile.value is not None:
+                self.tile_features[tile_idx, desert_column + 1 + NUMBERS.index(tile.value)] = 1
+
+        # flat positions of every plane, so encode writes straight into any buffer, batch rows included
+        self.blank = np.zeros(self.size, dtype=np.float32)  # an empty position with the board already in
+        self.blank[self.offsets["tiles"]:self.offsets["robber"]] = self.tile_features.ravel()
+        self.player_width = self.shapes["players"][1]
+
+    def new_buffer(self, batch_size: Optional[int] = None) -> np.ndarray:
+        """zeroed buffer for one observation, or a (batch_size, size) block of them"""
+        shape = (self.size,) if batch_size is None else (batch_size, self.size)
+        return np.zeros(shape, dtype=np.float32)
+
+    def views(self, out: np.ndarray) -> Dict[str, np.ndarray]:
+        """named plane views into a flat observation buffer, for reading it back"""
+        if out.shape != (self.size,) or out.dtype != np.float32:
+            raise ValueError(f"expected a float32 buffer of shape ({self.size},), got {out.dtype} {out.shape}")
+        return {name: out[offset:offset + int(np.prod(self.shapes[name]))].reshape(self.shapes[name])
+                for name, offset in self.offsets.items()}
+
+    def encode(self, game_state: GameState, out: np.ndarray, perspective: Optional[int] = None) -> np.ndarray:
+        """write game_state into out in place and return it, hiding opponents' secrets if perspective is set"""
+        if out.shape != (self.size,) or out.dtype != np.float32:
+            raise ValueError(f"expected a float32 buffer of shape ({self.size},), got {out.dtype} {out.shape}")
+        num_players = self.num_players
+        first = perspective or 0
+        offsets = self.offsets
+
+        out[:] = self.blank
+        out[offsets["robber"] + game_state.robber_position] = 1
+
+        # seats are relative to the perspective player, unchanged without one
+        base, stride = offsets["buildings"], 2 * num_players
+        for vertex, player_index in game_state.settlements.items():
+            out[base + vertex * stride + (player_index - first) % num_players] = 1
+        for vertex, player_index in game_state.cities.items():
+            out[base + vertex * stride + num_players + (player_index - first) % num_players] = 1
+        base = offsets["roads"]
+        for edge, player_index in game_state.roads.items():
+            out[base + edge * num_players + (player_index - first) % num_players] = 1
+
+        # each row is written in place, hidden fields are left at the blank's zeros
+        width = self.player_width
+        cards = len(RESOURCES) + len(DEV_CARDS)
+        for player_index, player in enumerate(game_state.players):
+            start = offsets["players"] + (player_index - first) % num_players * width
+            row = out[start:start + width]
+            if perspective is None or player_index == perspective:
+                row[:len(RESOURCES)] = [player.resources[resource] for resource in RESOURCES]
+                row[len(RESOURCES):cards] = [player.dev_cards[card] for card in DEV_CARDS]
+                row[cards + 2] = player.hidden_victory_points
+            row[cards] = player.knights_played
+            row[cards + 1] = player.visible_victory_points
+            row[cards + 3] = player.has_longest_road
+            row[cards + 4] = player.has_largest_army
+            row[cards + 5] = player.get_resource_count()
+            row[cards + 6] = player.get_dev_card_count()
+
+        i = offsets["turn"]
+        out[i + PHASES.index(game_state.game_phase)] = 1
+        i += len(PHASES)
+        out[i + (game_state.current_player_index - first) % num_players] = 1
+        i += num_players
+        out[i] = game_state.setup_phase
+        out[i + 1] = game_state.dice_rolled
+        out[i + 2] = game_state.dice_value or 0
+        out[i + 3] = game_state.placement_mode
+        i += 4
+        out[i + PLACEMENT_TYPES.index(game_state.placement_type)] = 1
+        i += len(PLACEMENT_TYPES)
+        out[i] = len(game_state.dev_card_deck)
+        i += 1
+        if game_state.longest_road_holder is not None:
+            out[i + (game_state.longest_road_holder - first) % num_players] = 1
+        if game_state.largest_army_holder is not None:
+            out[i + num_players + (game_state.largest_army_holder - first) % num_players] = 1
+        return out
@@ -1,84 +1,71 @@
-from typing import Tuple, Dict, Optional
-import math
-from .enums import GamePhase, ResourceType, PlacementType
+from collections import defaultdict
+from typing import Tuple, Dict, List, Optional, Set
+from .constants import MAX_ROADS, MAX_SETTLEMENTS, MAX_CITIES
+from .enums import EventType, GamePhase, ResourceType, PlacementType, StateDomain
 
 class PlacementManager:
     """handles placement of game pieces on the board"""
     
     def __init__(self, game):
         self.game = game
+        # vertices taken by a building or next to one, so the distance rule is one set lookup
+        self.blocked_vertices: Set[int] = set()
+        # per player indexes so connectivity checks are set lookups
+        self.road_vertices: Dict[int, Set[int]] = defaultdict(set)  # vertices touched by their roads
+        self.player_buildings: Dict[int, Set[int]] = defaultdict(set)  # vertices with their settlements or cities
+
+    def rebuild_indexes(self):
+        """recompute the blocked vertices and per player indexes from the game state"""
+        topology = self.game.board.topology
+        self.blocked_vertices = set()
+        self.road_vertices = defaultdict(set)
+        self.player_buildings = defaultdict(set)
+        for buildings in (self.game.game_state.settlements, self.game.game_state.cities):
+            for vertex, player_index in buildings.items():
+                self.player_buildings[player_index].add(vertex)
+                self.blocked_vertices.add(vertex)
+                self.blocked_vertices.update(topology.vertex_neighbors[vertex])
+        for edge, player_index in self.game.game_state.roads.items():
+            self.road_vertices[player_index].update(topology.edge_vertices[edge])
 
     def toggle_placement_mode(self):
         """toggle placement mode on/off"""
         self.game.game_state.placement_mode = not self.game.game_state.placement_mode
         if self.game.game_state.placement_mode:
             self.game.game_state.placement_type = PlacementType.SETTLEMENT
-        print(f"Placement mode {'activated' if self.game.game_state.placement_mode else 'deactivated'}")
-
-    def try_place_settlement(self, pos: Tuple[int, int]) -> bool:
-        """attempt to place settlement at hover position"""
-        if self.game.game_state.hovered_corner:
-            corner_x, corner_y = self.game.game_state.hovered_corner
-            if self.is_valid_settlement_placement((corner_x, corner_y)):
-                self.place_settlement((corner_x, corner_y))
-                return True
-        return False
+        self.game.game_state.mark_dirty(StateDomain.TURN)
+        if not self.game.quiet:
+            print(f"Placement mode {'activated' if self.game.game_state.placement_mode else 'deactivated'}")
 
-    def try_place_road(self, pos: Tuple[int, int]) -> bool:
-        """attempt to place road at hover position"""
-        if self.game.game_state.hovered_road:
-            start, end = self.game.game_state.hovered_road
-            if self.is_valid_road_placement(start, end):
-                self.place_road(start, end)
-                return True
-        return False
-
-    def is_valid_road_placement(self, start: Tuple[float, float], end: Tuple[float, float]) -> bool:
+    def is_valid_road_placement(self, edge: int) -> bool:
         """check if road placement is valid"""
-        # check if road exists
-        if (start, end) in self.game.game_state.roads or (end, start) in self.game.game_state.roads:
+        # check if road exists or the player is out of roads
+        if edge in self.game.game_state.roads or len(self.game.current_player.roads) >= MAX_ROADS:
             return False
         
-        # check for connection to settlement
-        player_settlements = [pos for pos, player in self.game.game_state.settlements.items() 
-                            if player == self.game.game_state.current_player_index]
-        if start in player_settlements or end in player_settlements:
+        start, end = self.game.board.topology.edge_vertices[edge]
+        player_index = self.game.game_state.current_player_index
+
+        # must touch one of the player's buildings or roads
+        buildings = self.player_buildings[player_index]
+        road_vertices = self.road_vertices[player_index]
+        if start in buildings or end in buildings or start in road_vertices or end in road_vertices:
             if self.game.game_state.game_phase == GamePhase.PLAY:
                 return self.game.current_player.can_afford_road()
             return True
         
-        # check for connection to road
-        player_roads = [road for road, player in self.game.game_state.roads.items() 
-                       if player == self.game.game_state.current_player_index]
-        for road_start, road_end in player_roads:
-            if start == road_start or start == road_end or end == road_start or end == road_end:
-                if self.game.game_state.game_phase == GamePhase.PLAY:
-                    return self.game.current_player.can_afford_road()
-                return True
-        
         return False
 
-    def is_valid_settlement_placement(self, pos: Tuple[float, float]) -> bool:
+    def is_valid_settlement_placement(self, pos: int) -> bool:
         """check if settlement placement is valid"""
-        # check for existing buildings
-        if pos in self.game.game_state.settlements or pos in self.game.game_state.cities:
+        # check for existing buildings and the distance rule
+        if pos in self.blocked_vertices or len(self.game.current_player.settlements) >= MAX_SETTLEMENTS:
             return False
-        
-        # check distance rule
-        for settlement_pos in self.game.game_state.settlements:
-            if math.hypot(pos[0] - settlement_pos[0], pos[1] - settlement_pos[1]) < self.game.board.hex_width:
-                return False
-        
-        for city_pos in self.game.game_state.cities:
-            if math.hypot(pos[0] - city_pos[0], pos[1] - city_pos[1]) < self.game.board.hex_width:
-                return False
             
         # main game phase checks
         if self.game.game_state.game_phase == GamePhase.PLAY:
             # must connect to own road
-            player_roads = [road for road, player in self.game.game_state.roads.items() 
-                          if player == self.game.game_state.current_player_index]
-            if not any(pos in road for road in player_roads):
+            if pos not in self.road_vertices[self.game.game_state.current_player_index]:
                 return False
             
             # check resources
@@ -87,14 +74,28 @@ class PlacementManager:
         
         return True
 
-    def place_settlement(self, pos: Tuple[float, float]):
+    def get_legal_settlement_vertices(self) -> List[int]:
+        """list every vertex the current player could settle on right now"""
+        if len(self.game.current_player.settlements) >= MAX_SETTLEMENTS:
+            return []
+        free_vertices = [vertex for vertex in range(self.game.board.topology.num_vertices)
+                         if vertex not in self.blocked_vertices]
+        if self.game.game_state.game_phase != GamePhase.PLAY:
+            return free_vertices
+
+        if not self.game.current_player.can_afford_settlement():
+            return []
+        road_vertices = self.road_vertices[self.game.game_state.current_player_index]
+        return [vertex for vertex in free_vertices if vertex in road_vertices]
+
+    def place_settlement(self, pos: int):
         """place settlement and handle resource costs"""
         current_player = self.game.current_player
-        axial_pos = self.game.board.pixel_to_axial(*pos)
         
         if self.game.game_state.game_phase == GamePhase.PLAY:
             if not current_player.can_afford_settlement():
-                print(f"Player {current_player.name} cannot afford a settlement.")
+                if not self.game.quiet:
+                    print(f"Player {current_player.name} cannot afford a settlement.")
                 return
             
             settlement_cost = {
@@ -106,26 +107,36 @@ class PlacementManager:
             current_player.spend_resources(settlement_cost)
         
         self.game.game_state.settlements[pos] = self.game.game_state.current_player_index
-        current_player.build_settlement(axial_pos)
-        print(f"Player {current_player.name} placed a settlement at {pos}")
+        current_player.build_settlement(pos)
+        self.player_buildings[self.game.game_state.current_player_index].add(pos)
+        self.blocked_vertices.add(pos)
+        self.blocked_vertices.update(self.game.board.topology.vertex_neighbors[pos])
+        self.game.victory_point_manager.handle_settlement_built(pos, self.game.game_state.current_player_index)
+        self.game.resource_manager.update_production(pos, self.game.game_state.current_player_index)
+        if not self.game.quiet:
+            print(f"Player {current_player.name} placed a settlement at {pos}")
         
         # handle setup phase resources
         if self.game.game_state.game_phase == GamePhase.SETUP and self.game.setup_manager.setup_phase == 1:
-            adjacent_tiles = self.game.board.get_adjacent_tiles(*pos)
+            adjacent_tiles = self.game.board.get_adjacent_tiles(pos)
             for _, tile in adjacent_tiles:
                 if tile.resource_type != ResourceType.DESERT:
                     current_player.add_resource(tile.resource_type)
-                    print(f"Player {current_player.name} received 1 {tile.resource_type.name}")
+                    if not self.game.quiet:
+                        print(f"Player {current_player.name} received 1 {tile.resource_type.name}")
 
+        self.game.game_state.mark_dirty(StateDomain.BOARD, StateDomain.RESOURCES)
+        self.game.emit(EventType.BUILD_SETTLEMENT, self.game.game_state.current_player_index, pos)
         self.game.victory_point_manager.update_victory_points()
 
-    def place_road(self, start: Tuple[float, float], end: Tuple[float, float]):
+    def place_road(self, edge: int):
         """place road and handle resource costs"""
         current_player = self.game.current_player
         
         if self.game.game_state.game_phase == GamePhase.PLAY:
             if not current_player.can_afford_road():
-                print(f"Player {current_player.name} cannot afford a road.")
+                if not self.game.quiet:
+                    print(f"Player {current_player.name} cannot afford a road.")
                 return
             
             road_cost = {
@@ -134,14 +145,19 @@ class PlacementManager:
             }
             current_player.spend_resources(road_cost)
         
-        self.game.game_state.roads[(start, end)] = self.game.game_state.current_player_index
-        current_player.build_road(start, end)
-        print(f"Player {current_player.name} placed a road from {start} to {end}")
+        self.game.game_state.roads[edge] = self.game.game_state.current_player_index
+        current_player.build_road(edge)
+        self.road_vertices[self.game.game_state.current_player_index].update(self.game.board.topology.edge_vertices[edge])
+        self.game.victory_point_manager.handle_road_built(self.game.game_state.current_player_index)
+        self.game.game_state.mark_dirty(StateDomain.BOARD, StateDomain.RESOURCES)
+        self.game.emit(EventType.BUILD_ROAD, self.game.game_state.current_player_index, edge)
+        self.game.victory_point_manager.update_victory_points()
+        if not self.game.quiet:
+            print(f"Player {current_player.name} placed a road on edge {edge}")
 
-    def place_city(self, pos: Tuple[float, float]):
+    def place_city(self, pos: int):
         """upgrade settlement to city"""
         current_player = self.game.current_player
-        axial_pos = self.game.board.pixel_to_axial(*pos)
         
         if pos not in self.game.game_state.settlements or self.game.game_state.settlements[pos] != self.game.game_state.current_player_index:
             return
@@ -154,26 +170,44 @@ class PlacementManager:
         
         del self.game.game_state.settlements[pos]
         self.game.game_state.cities[pos] = self.game.game_state.current_player_index
-        current_player.build_city(axial_pos)
-        print(f"Player {current_player.name} upgraded settlement to city at {pos}")
+        current_player.build_city(pos)
+        self.game.resource_manager.update_production(pos, self.game.game_state.current_player_index)  # second resource
+        if not self.game.quiet:
+            print(f"Player {current_player.name} upgraded settlement to city at {pos}")
+        self.game.game_state.mark_dirty(StateDomain.BOARD, StateDomain.RESOURCES)
+        self.game.emit(EventType.BUILD_CITY, self.game.game_state.current_player_index, pos)
         self.game.victory_point_manager.update_victory_points()
 
-    def is_valid_city_placement(self, pos: Tuple[float, float]) -> bool:
+    def is_valid_city_placement(self, pos: int) -> bool:
         """check if city placement is valid"""
         if pos not in self.game.game_state.settlements:
             return False
         if self.game.game_state.settlements[pos] != self.game.game_state.current_player_index:
             return False
+        if len(self.game.current_player.cities) >= MAX_CITIES:
+            return False
         if self.game.game_state.game_phase == GamePhase.PLAY:
             if not self.game.current_player.can_afford_city():
                 return False
         return True
-    
-    def try_place_city(self, pos: Tuple[int, int]) -> bool:
-        """attempt to place city at hover position"""
-        if self.game.game_state.hovered_settlement:
-            settlement_pos = self.game.game_state.hovered_settlement
-            if self.is_valid_city_placement(settlement_pos):
-                self.place_city(settlement_pos)
-                return True
-        return False
\ No newline at end of file
+
+    def get_legal_road_edges(self) -> List[int]:
+        """list every edge the current player could build a road on right now"""
+        player_index = self.game.game_state.current_player_index
+        if len(self.game.current_player.roads) >= MAX_ROADS:
+            return []
+        if self.game.game_state.game_phase == GamePhase.PLAY and not self.game.current_player.can_afford_road():
+            return []
+
+        vertex_edges = self.game.board.topology.vertex_edges
+        anchors = self.road_vertices[player_index] | self.player_buildings[player_index]
+        return sorted({edge for vertex in anchors for edge in vertex_edges[vertex]
+                       if edge not in self.game.game_state.roads})
+
+    def get_legal_city_vertices(self) -> List[int]:
+        """list every settlement the current player could upgrade right now"""
+        if len(self.game.current_player.cities) >= MAX_CITIES:
+            return []
+        if self.game.game_state.game_phase == GamePhase.PLAY and not self.game.current_player.can_afford_city():
+            return []
+        return sorted(self.game.current_player.settlements)
@@ -11,7 +11,7 @@ class Player:
         self.dev_cards: Dict[DevCardType, int] = {dt: 0 for dt in DevCardType}
         self.settlements: List[int] = []
         self.cities: List[int] = []
-        self.roads: List[Tuple[int, int]] = []
+        self.roads: List[int] = []
         self.knights_played: int = 0
         self.victory_points: int = 0
         self.has_longest_road = False
@@ -63,21 +63,21 @@ class Player:
         return (self.resources.get(ResourceType.GRAIN, 0) >= 2 and 
                 self.resources.get(ResourceType.ORE, 0) >= 3)
 
-    def build_settlement(self, position: Tuple[int, int]):
+    def build_settlement(self, position: int):
         """add settlement and update points"""
         self.settlements.append(position)
         self.visible_victory_points = self.calculate_visible_victory_points()
 
-    def build_city(self, position: Tuple[int, int]):
+    def build_city(self, position: int):
         """upgrade settlement to city and update points"""
         if position in self.settlements:
             self.settlements.remove(position)
             self.cities.append(position)
         self.visible_victory_points = self.calculate_visible_victory_points()
         
-    def build_road(self, start: int, end: int):
+    def build_road(self, edge: int):
         """add road to player's roads"""
-        self.roads.append((start, end))
+        self.roads.append(edge)
 
     def get_resource_count(self) -> int:
         """get total number of resource cards"""
@@ -95,9 +95,7 @@ class Player:
     
     def calculate_building_points(self) -> int:
         """calculate points from settlements and cities"""
-        points = len(self.settlements) + (len(self.cities) * 2)
-        print(f"{self.name} has {len(self.settlements)} settlements and {len(self.cities)} cities for {points} points\n")
-        return points
+        return len(self.settlements) + (len(self.cities) * 2)
         
     def calculate_total_victory_points(self) -> int:
         """calculate total points including hidden ones"""
@@ -0,0 +1,54 @@
+from functools import lru_cache
+from typing import Optional, Tuple
+import numpy as np
+from .constants import RESOURCES, RESOURCE_SLOT
+from .enums import ResourceType
+from .topology import BoardTopology
+
+# ways two dice make each total out of 36, indexed by the total
+PIPS = (0, 0, 1, 2, 3, 4, 5, 6, 5, 4, 3, 2, 1)
+DICE_PIPS = np.array(PIPS, dtype=np.int32)
+DICE_PROBABILITY = DICE_PIPS / 36
+
+class ProductionTables:
+    """expected yield of one board's tiles and vertices, in pips (chances out of 36 a turn)
+
+    counting pips keeps the sums exact, divide by 36 for resources per roll
+      tile_pips         (tiles,) pips of each tile's number, 0 for the desert
+      tile_production   (tiles, resources) pips of the resource each tile pays
+      vertex_tiles      (vertices, tiles) 1 where a vertex touches a tile
+      vertex_production (vertices, resources) pips a settlement on each vertex collects
+      vertex_pips       (vertices,) all resources together
+    """
+    def __init__(self, topology: BoardTopology, tiles: Tuple[Tuple[ResourceType, Optional[int]], ...]):
+        self.tile_pips = np.array([DICE_PIPS[value] if value else 0 for _, value in tiles], dtype=np.int32)
+        self.tile_production = np.zeros((len(tiles), len(RESOURCES)), dtype=np.int32)
+        for tile_idx, (resource_type, _) in enumerate(tiles):
+            if resource_type in RESOURCE_SLOT:
+                self.tile_production[tile_idx, RESOURCE_SLOT[resource_type]] = self.tile_pips[tile_idx]
+
+        self.vertex_tiles = np.zeros((topology.num_vertices, topology.num_tiles), dtype=np.int32)
+        for vertex, tile_ids in enumerate(topology.vertex_tiles):
+            self.vertex_tiles[vertex, list(tile_ids)] = 1
+        self.vertex_production = self.vertex_tiles @ self.tile_production
+        self.vertex_pips = self.vertex_production.sum(axis=1)
+        for table in (self.tile_pips, self.tile_production, self.vertex_tiles, self.vertex_production, self.vertex_pips):
+            table.flags.writeable = False  # shared between every board with this layout
+
+    def vertex_production_with_robber(self, robber_position: int) -> np.ndarray:
+        """(vertices, resources) pips with the robber's tile paying nothing"""
+        return self.vertex_production - np.outer(self.vertex_tiles[:, robber_position],
+                                                  self.tile_production[robber_position])
+
+    def expected_vertex_production(self, robber_position: Optional[int] = None) -> np.ndarray:
+        """(vertices, resources) resources a settlement on each vertex collects per roll"""
+        pips = self.vertex_production if robber_position is None else self.vertex_production_with_robber(robber_position)
+        return pips / 36
+
+@lru_cache(maxsize=64)
+def _tables(topology: BoardTopology, tiles: Tuple[Tuple[ResourceType, Optional[int]], ...]) -> ProductionTables:
+    return ProductionTables(topology, tiles)
+
+def get_production_tables(board) -> ProductionTables:
+    """production tables for a board, built once per layout of tiles and numbers"""
+    return _tables(board.topology, tuple((tile.resource_type, tile.value) for tile in board.tiles))
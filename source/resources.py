@@ -1,39 +1,96 @@
-from typing import List
-from .enums import ResourceType, GamePhase
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from .constants import PLAYER_SEATS, RESOURCES, RESOURCE_SLOT
+from .enums import EventType, ResourceType, GamePhase, StateDomain
 from .player import Player
+from .production import PIPS, get_production_tables
 
 class ResourceManager:
     def __init__(self, game):
         self.game = game
 
+        # dice number -> {(player index, resource): amount}, only for tiles the robber isn't on
+        self.production_table: Dict[int, Dict[Tuple[int, ResourceType], int]] = {
+            number: {} for number in range(2, 13)
+        }
+        # tile index -> {player index: amount}, kept so robber moves can block and unblock tiles
+        self.tile_yields: List[Dict[int, int]] = [{} for _ in self.game.board.tiles]
+        # expected yield per board and per player, the player totals follow the production table
+        self.production = get_production_tables(self.game.board)
+        # lists rather than an array, they change on every build and robber move
+        self.production_pips: List[List[int]] = [[0] * len(RESOURCES) for _ in PLAYER_SEATS]
+
+    def rebuild_production(self):
+        """recompute the production table from scratch for the current buildings and robber"""
+        self.production_table = {number: {} for number in range(2, 13)}
+        self.tile_yields = [{} for _ in self.game.board.tiles]
+        self.production = get_production_tables(self.game.board)
+        self.production_pips = [[0] * len(RESOURCES) for _ in self.game.players]
+        for vertex, player_index in self.game.game_state.settlements.items():
+            self.update_production(vertex, player_index)
+        for vertex, player_index in self.game.game_state.cities.items():
+            self.update_production(vertex, player_index, 2)
+
     def distribute_resources(self, roll_value: int, players):
         """Distribute resources to players based on dice roll"""
-        print(f"Rolling {roll_value}")
-
-        for player_index, player in enumerate(players):
-            for settlement_pos in self.game.game_state.settlements:
-                if self.game.game_state.settlements[settlement_pos] == player_index:
-                    adjacent_tiles = self.game.board.get_adjacent_tiles(*settlement_pos)
-                    for _, tile in adjacent_tiles:
-                        if tile.value == roll_value and tile.resource_type != ResourceType.DESERT:
-                            player.add_resource(tile.resource_type)  # first resource for settlement
-                            
-                            # if city add second resource
-                            if settlement_pos in self.game.game_state.cities:
-                                player.add_resource(tile.resource_type)
-                                print(f"Player {player.name} received 2 {tile.resource_type.name} from city")
-                            else:
-                                print(f"Player {player.name} received 1 {tile.resource_type.name} from settlement")
-        
-        self.game.update_game_state()
+        if not self.game.quiet:
+            print(f"Rolling {roll_value}")
+
+        for (player_index, resource), amount in self.production_table.get(roll_value, {}).items():
+            players[player_index].add_resource(resource, amount)
+            if not self.game.quiet:
+                print(f"Player {players[player_index].name} received {amount} {resource.name}")
+
+        self.game.game_state.mark_dirty(StateDomain.RESOURCES)
+
+    def update_production(self, vertex: int, player_index: int, amount: int = 1):
+        """add (or with a negative amount remove) a building's yield around a vertex"""
+        robber_position = self.game.game_state.robber_position
+        for tile_idx, tile in self.game.board.get_adjacent_tiles(vertex):
+            if tile.value is None:
+                continue
+            yields = self.tile_yields[tile_idx]
+            total = yields.get(player_index, 0) + amount
+            if total:
+                yields[player_index] = total
+            else:
+                del yields[player_index]
+            if tile_idx != robber_position:
+                self._adjust_production(tile_idx, player_index, amount)
+
+    def handle_robber_moved(self, old_position: int, new_position: int):
+        """unblock the tile the robber left and block the one it moved to"""
+        for player_index, amount in self.tile_yields[old_position].items():
+            self._adjust_production(old_position, player_index, amount)
+        for player_index, amount in self.tile_yields[new_position].items():
+            self._adjust_production(new_position, player_index, -amount)
+
+    def expected_production(self, player_index: Optional[int] = None) -> np.ndarray:
+        """resources per roll for every player (players x resources) or one, the robber's tile excluded"""
+        pips = self.production_pips if player_index is None else self.production_pips[player_index]
+        return np.array(pips, dtype=np.float64) / 36
+
+    def _adjust_production(self, tile_idx: int, player_index: int, amount: int):
+        """change one player's payout for a tile's dice number"""
+        tile = self.game.board.tiles[tile_idx]
+        self.production_pips[player_index][RESOURCE_SLOT[tile.resource_type]] += amount * PIPS[tile.value]
+        entries = self.production_table[tile.value]
+        key = (player_index, tile.resource_type)
+        total = entries.get(key, 0) + amount
+        if total:
+            entries[key] = total
+        else:
+            del entries[key]
 
     def give_all_resources_cheat(self):
         """Cheat function that gives all resources to current player"""
         if self.game.game_state.game_phase == GamePhase.PLAY:
             for resource in ResourceType:
-                if resource != ResourceType.DESERT:  
+                if resource != ResourceType.DESERT:
                     for _ in range(10):  # Give 10 of each resource
                         self.game.current_player.add_resource(resource)
-                    print(f"Gave {self.game.current_player.name} 10 {resource.name}")
-            
-            self.game.update_game_state()
\ No newline at end of file
+                    if not self.game.quiet:
+                        print(f"Gave {self.game.current_player.name} 10 {resource.name}")
+
+            self.game.game_state.mark_dirty(StateDomain.RESOURCES)
+            self.game.emit(EventType.RESOURCE_CHEAT, self.game.game_state.current_player_index)
@@ -0,0 +1,39 @@
+import random
+from typing import List, Optional
+import numpy as np
+
+DICE_BLOCK = 256  # rolls drawn per refill
+
+def _stream_seed(sequence: np.random.SeedSequence) -> int:
+    return int.from_bytes(sequence.generate_state(4).tobytes(), "little")
+
+class GameRng:
+    """one game's random streams, split from a single seed
+
+    board, deck and steal are random.Random streams and the dice come from a
+    numpy generator a block at a time. a stream only moves when its part of
+    the game uses it, so games with the same seed get the same board, deck
+    order and roll sequence whatever the players do, which lets two agent
+    versions be compared on paired dice
+    """
+    def __init__(self, seed: Optional[int] = None):
+        if seed is None:
+            seed = random.getrandbits(64)  # still reproducible for callers that seed the module generator
+        self.seed = seed
+        board, dice, deck, steal = np.random.SeedSequence(seed).spawn(4)
+        self.board = random.Random(_stream_seed(board))
+        self.deck = random.Random(_stream_seed(deck))
+        self.steal = random.Random(_stream_seed(steal))
+        self.dice = np.random.default_rng(dice)
+        self._rolls: List[int] = []  # the rest of the current block, next roll last
+
+    def roll(self) -> int:
+        """sum of two dice"""
+        if not self._rolls:
+            block = self.dice.integers(1, 7, size=(DICE_BLOCK, 2)).sum(axis=1)
+            self._rolls = block[::-1].tolist()
+        return self._rolls.pop()
+
+    def unroll(self, value: int):
+        """put a roll back so it comes out next, for undo"""
+        self._rolls.append(value)
@@ -0,0 +1,89 @@
+from typing import Dict, Optional, Tuple
+import pygame
+from .constants import BLACK, GRAY, TILE_SIZE, WHITE, SCREEN_HEIGHT, SCREEN_WIDTH
+from .fonts import render_text
+
+class RobberRenderer:
+    """draws the robber and turns robber clicks into tiles and victims"""
+    
+    def __init__(self, game):
+        self.game = game
+        self.victim_buttons: Dict[int, pygame.Rect] = {}
+
+    @property
+    def robber_manager(self):
+        return self.game.engine.robber_manager
+        
+    def draw_robber(self, screen):
+        """draw the robber token on its tile"""
+        x, y = self.game.geometry.get_tile_center(self.game.game_state.robber_position)
+        radius = TILE_SIZE * 0.2
+        pygame.draw.circle(screen, GRAY, (int(x), int(y)), int(radius))
+        pygame.draw.circle(screen, BLACK, (int(x), int(y)), int(radius), 2)
+    
+    def draw_placement_indicator(self, screen, mouse_pos: Tuple[int, int]):
+        """show where robber can be placed"""
+        if not self.robber_manager.move_pending:
+            return
+
+        index = self.game.geometry.tile_at_pixel(*mouse_pos)
+        if index is not None and index != self.game.game_state.robber_position:
+            x, y = self.game.geometry.get_tile_center(index)
+            pygame.draw.circle(screen, BLACK, (int(x), int(y)), int(TILE_SIZE * 0.3), 3)
+
+    def draw_stealing_interface(self, screen) -> Optional[pygame.Rect]:
+        """draw the interface for choosing who to steal from, it darkens the whole screen"""
+        if not self.robber_manager.stealing_pending:
+            return None
+
+        self.victim_buttons.clear()
+        victims = self.robber_manager.current_victims
+
+        # darken background
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        overlay.fill((0, 0, 0))
+        overlay.set_alpha(128)
+        screen.blit(overlay, (0, 0))
+
+        # set up dialog box
+        box_width = 300
+        box_height = 50 + (len(victims) * 60)
+        x = (SCREEN_WIDTH - box_width) // 2
+        y = (SCREEN_HEIGHT - box_height) // 2
+
+        # draw box
+        pygame.draw.rect(screen, WHITE, (x, y, box_width, box_height))
+        pygame.draw.rect(screen, BLACK, (x, y, box_width, box_height), 2)
+
+        # add title
+        title = render_text("select a player to steal from:", BLACK)
+        title_rect = title.get_rect(centerx=SCREEN_WIDTH//2, y=y+10)
+        screen.blit(title, title_rect)
+
+        # add player buttons
+        button_y = y + 50
+        for victim_idx in victims:
+            victim = self.game.players[victim_idx]
+            button_rect = pygame.Rect(x+20, button_y, box_width-40, 40)
+            self.victim_buttons[victim_idx] = button_rect
+
+            pygame.draw.rect(screen, victim.color, button_rect)
+            pygame.draw.rect(screen, BLACK, button_rect, 2)
+
+            text = render_text(f"{victim.name} ({victim.get_resource_count()} resources)", BLACK)
+            text_rect = text.get_rect(center=button_rect.center)
+            screen.blit(text, text_rect)
+
+            button_y += 60
+        return screen.get_rect()
+
+    def find_victim_at(self, pos: Tuple[int, int]) -> Optional[int]:
+        """get the victim whose button was clicked"""
+        for victim_idx, button_rect in self.victim_buttons.items():
+            if button_rect.collidepoint(pos[0], pos[1]):
+                return victim_idx
+        return None
+
+    def find_tile_at(self, mouse_pos: Tuple[int, int]) -> Optional[int]:
+        """get the tile under the mouse"""
+        return self.game.geometry.tile_at_pixel(*mouse_pos)
@@ -0,0 +1,167 @@
+import contextlib
+import json
+import multiprocessing
+import os
+import time
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from .agents import Agent, RandomAgent, play_turn
+from .engine import GameEngine
+from .enums import GamePhase, PlayerAction
+from .dataset import DatasetWriter, PositionRecorder
+from .event_log import EventLogWriter, INDEX_SUFFIX
+from .mcts import MCTSAgent
+from .setup_agent import SetupAgent
+
+AGENT_NAMES = ("random", "mcts")
+
+def make_agent(name: str, seed: int, mcts_time: Optional[float], mcts_iterations: Optional[int]) -> Agent:
+    """build an agent by name, mcts searches in-process since the games are already spread over the pool"""
+    if name == "random":
+        return RandomAgent(seed)
+    if name == "mcts":
+        return MCTSAgent(workers=1, time_limit=mcts_time, iterations=mcts_iterations, seed=seed, verbose=False)
+    raise ValueError(f"unknown agent {name}, expected one of {AGENT_NAMES}")
+
+def event_log_path(event_log_dir: str, game_id: int) -> str:
+    return os.path.join(event_log_dir, f"game_{game_id:06d}.evlog")
+
+def play_selfplay_game(job: Tuple[int, int, Tuple[str, ...], Optional[float], Optional[int], int,
+                                   Optional[str], bool, bool]) -> Dict:
+    """play one complete headless game and summarise it
+
+    logs its events if given a directory, with record_positions encodes the
+    position at the start of every turn into the summary's positions, and
+    with heuristic_setup every seat opens with SetupAgent's placements
+    """
+    (game_id, seed, seat_agents, mcts_time, mcts_iterations, max_actions, event_log_dir, record_positions,
+     heuristic_setup) = job
+    start = time.perf_counter()
+
+    with contextlib.ExitStack() as stack:
+        engine = GameEngine(seed, quiet=True)  # board layout, deck order, dice and steals
+        if event_log_dir is not None:
+            # a game cut short by a crash is played again from the start
+            path = event_log_path(event_log_dir, game_id)
+            for stale in (path, path + INDEX_SUFFIX):
+                if os.path.exists(stale):
+                    os.remove(stale)
+            stack.enter_context(EventLogWriter(path)).attach(engine)
+        agents = {seat: make_agent(name, seed * 10 + seat, mcts_time, mcts_iterations)
+                  for seat, name in enumerate(seat_agents)}
+        if heuristic_setup:
+            agents = {seat: SetupAgent(agent) for seat, agent in agents.items()}
+        recorder = PositionRecorder(engine.board, game_id, len(engine.players)) if record_positions else None
+        turns = 1
+        recorded_turns = 0
+        actions_taken = 0
+        while engine.game_phase != GamePhase.END and actions_taken < max_actions:
+            if recorder is not None and engine.game_phase == GamePhase.PLAY and recorded_turns < turns:
+                recorder.add(engine.game_state, turns)
+                recorded_turns = turns
+            action = play_turn(engine, agents)
+            actions_taken += 1
+            if action.action_type == PlayerAction.END_TURN:
+                turns += 1
+        victory_points = [player.calculate_total_victory_points() for player in engine.players]
+        for agent in agents.values():
+            agent.close()
+
+    result = {
+        "game": game_id,
+        "seed": seed,
+        "agents": list(seat_agents),
+        "winner": engine.winner_index,
+        "victory_points": victory_points,
+        "turns": turns,
+        "actions": actions_taken,
+        "duration": round(time.perf_counter() - start, 4),
+    }
+    if recorder is not None:
+        result["positions"] = recorder.finish(engine.winner_index, victory_points)
+    return result
+
+def load_finished_games(path: str) -> Set[int]:
+    """ids of games already in the results file, a half written last line from a crash is cut off"""
+    if not os.path.exists(path):
+        return set()
+    with open(path, "rb") as f:
+        data = f.read()
+
+    complete = data[:data.rfind(b"\n") + 1]
+    if len(complete) != len(data):
+        with open(path, "r+b") as f:
+            f.truncate(len(complete))
+
+    finished = set()
+    for line in complete.splitlines():
+        if line.strip():
+            finished.add(json.loads(line)["game"])
+    return finished
+
+def run_selfplay(num_games: int, seat_agents: List[str], workers: int = 1, output_path: str = "selfplay.jsonl",
+                 seed: int = 0, chunksize: Optional[int] = None, mcts_time: Optional[float] = 0.1,
+                 mcts_iterations: Optional[int] = None, max_actions: int = 20000,
+                 event_log_dir: Optional[str] = None, dataset_path: Optional[str] = None,
+                 heuristic_setup: bool = False) -> int:
+    """play num_games over a process pool, appending each result to output_path as it finishes
+
+    games are numbered and seeded from seed, so rerunning the same command
+    after a crash skips finished games and plays the rest exactly as before.
+    runs with the same seed but different agents get the same boards, decks
+    and dice game by game, so agent versions can be compared on paired games.
+    with event_log_dir every game's events go to their own log there for replaying,
+    and with dataset_path every turn's starting position goes into a training dataset.
+    heuristic_setup has every seat place its opening pieces with SetupAgent,
+    which takes microseconds where mcts would search every placement
+    """
+    finished = load_finished_games(output_path)
+    if event_log_dir is not None:
+        os.makedirs(event_log_dir, exist_ok=True)
+    jobs = [(game_id, seed + game_id, tuple(seat_agents), mcts_time, mcts_iterations, max_actions, event_log_dir,
+             dataset_path is not None, heuristic_setup)
+            for game_id in range(num_games) if game_id not in finished]
+    if finished:
+        print(f"resuming: {len(finished)} games already in {output_path}, {len(jobs)} to go")
+    if not jobs:
+        return 0
+
+    # a few chunks per worker keeps them busy without a round trip per game
+    workers = max(1, workers)
+    if chunksize is None:
+        chunksize = max(1, len(jobs) // (workers * 4))
+
+    wins = [0] * len(seat_agents)
+    played = 0
+    start = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        out = stack.enter_context(open(output_path, "a"))
+        # positions of a game that never made it into the results are dropped and played again
+        dataset = stack.enter_context(DatasetWriter(dataset_path, keep_games=finished)) if dataset_path else None
+        for result in _results(jobs, workers, chunksize):
+            positions = result.pop("positions", None)
+            if dataset is not None:
+                dataset.write(positions)
+                dataset.flush()
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+            played += 1
+            if result["winner"] is not None:
+                wins[result["winner"]] += 1
+            elapsed = time.perf_counter() - start
+            print(f"game {result['game']}: winner {result['winner']} in {result['turns']} turns "
+                  f"[{played}/{len(jobs)}, {played / elapsed:.2f} games/s]")
+
+    elapsed = time.perf_counter() - start
+    print(f"played {played} games in {elapsed:.1f}s ({played / elapsed:.2f} games/s) on {workers} workers")
+    for seat, (name, seat_wins) in enumerate(zip(seat_agents, wins)):
+        print(f"seat {seat} ({name}): {seat_wins} wins")
+    return played
+
+def _results(jobs: List[Tuple], workers: int, chunksize: int) -> Iterator[Dict]:
+    """results in the order games finish"""
+    if workers == 1:
+        for job in jobs:
+            yield play_selfplay_game(job)
+        return
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap_unordered(play_selfplay_game, jobs, chunksize)
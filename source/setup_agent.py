@@ -0,0 +1,140 @@
+from functools import lru_cache
+from typing import Optional, Tuple
+import numpy as np
+from .actions import Action
+from .agents import Agent, RandomAgent
+from .constants import RESOURCE_SLOT
+from .enums import GamePhase, PlacementType, PlayerAction, ResourceType
+from .topology import BoardTopology
+
+# resources a first settlement and road cost, worth having in the starting hand
+STARTING_RESOURCES = [RESOURCE_SLOT[resource] for resource in
+                      (ResourceType.WOOD, ResourceType.BRICK, ResourceType.GRAIN, ResourceType.WOOL)]
+
+class SetupPairs:
+    """every (settlement vertex, road edge) pair of a layout as flat arrays
+
+    index num_vertices is padding, so score arrays get one extra zero slot
+      vertex, edge, far  settlement, road and the road's other end for each pair
+      beyond             (pairs, 2) vertices one step past the far end
+      neighbors          (vertices, 3) neighbours of each vertex
+      edge_ends          (edges, 2) both ends of each edge
+    """
+    def __init__(self, topology: BoardTopology):
+        pad = topology.num_vertices
+        vertex, edge, far, beyond = [], [], [], []
+        for v in range(topology.num_vertices):
+            for e in topology.vertex_edges[v]:
+                a, b = topology.edge_vertices[e]
+                u = b if a == v else a
+                past = [w for w in topology.vertex_neighbors[u] if w != v]
+                vertex.append(v)
+                edge.append(e)
+                far.append(u)
+                beyond.append(past + [pad] * (2 - len(past)))
+        self.vertex = np.array(vertex)
+        self.edge = np.array(edge)
+        self.far = np.array(far)
+        self.beyond = np.array(beyond)
+        self.neighbors = np.array([list(n) + [pad] * (3 - len(n)) for n in topology.vertex_neighbors])
+        self.edge_ends = np.array([list(ends) for ends in topology.edge_vertices])
+
+@lru_cache(maxsize=None)
+def get_setup_pairs(topology: BoardTopology) -> SetupPairs:
+    return SetupPairs(topology)
+
+class SetupAgent(Agent):
+    """places the opening settlements and roads by scoring every legal choice at once
+
+    a settlement spot is scored on its pips, the scarcity of what it
+    produces across the board, how many resources it covers and how many
+    the player doesn't produce yet, the pips of the free spots it blocks
+    for opponents and, for the second settlement, the starting hand. each
+    settlement is picked together with its road, which is scored on the
+    best free spot it leads towards. after setup the fallback agent plays
+    """
+    name = "setup"
+
+    def __init__(self, fallback: Optional[Agent] = None, seed: Optional[int] = None,
+                 pips: float = 1.0, scarcity: float = 0.5, diversity: float = 1.0, new_resources: float = 1.5,
+                 blocking: float = 0.1, starting_hand: float = 0.5, road: float = 0.3):
+        self.fallback = fallback if fallback is not None else RandomAgent(seed)
+        self.weights = (pips, scarcity, diversity, new_resources, blocking, starting_hand)
+        self.road_weight = road
+        self.planned: Optional[Tuple[int, int]] = None  # settlement and the road meant to go with it
+
+    def choose_action(self, engine) -> Action:
+        if engine.game_phase != GamePhase.SETUP:
+            return self.fallback.choose_action(engine)
+        if engine.game_state.placement_type == PlacementType.SETTLEMENT:
+            self.planned = self.best_placement(engine)
+            if self.planned is None:
+                # no free spot has a free road beside it, take the best of whatever the engine allows
+                score, _ = self.score_vertices(engine)
+                return max(engine.legal_actions(), key=lambda action: score[action.target])
+            return Action(PlayerAction.BUILD_SETTLEMENT, self.planned[0])
+        road = self.best_road(engine)
+        if road is None:
+            # nothing this agent can score, leave it to the fallback
+            return self.fallback.choose_action(engine)
+        return Action(PlayerAction.BUILD_ROAD, road)
+
+    def close(self):
+        self.fallback.close()
+
+    def score_vertices(self, engine) -> Tuple[np.ndarray, np.ndarray]:
+        """score of every vertex for the current player, and which ones are legal"""
+        state = engine.game_state
+        topology = engine.board.topology
+        tables = engine.resource_manager.production
+        pairs = get_setup_pairs(topology)
+        w_pips, w_scarcity, w_diversity, w_new, w_blocking, w_start = self.weights
+
+        legal = np.ones(topology.num_vertices, dtype=bool)
+        legal[list(engine.placement_manager.blocked_vertices)] = False
+
+        production = tables.vertex_production_with_robber(state.robber_position)  # (vertices, resources) pips
+        pips = production.sum(axis=1)
+        totals = tables.tile_production.sum(axis=0)
+        scarcity = totals.mean() / np.maximum(totals, 1)
+        produces = production > 0
+        owned = np.array(engine.resource_manager.production_pips[state.current_player_index]) > 0
+
+        free_pips = np.append(np.where(legal, pips, 0), 0)
+        score = (w_pips * pips + w_scarcity * (production @ scarcity) + w_diversity * produces.sum(axis=1) +
+                 w_new * (produces & ~owned).sum(axis=1) + w_blocking * free_pips[pairs.neighbors].sum(axis=1))
+        if state.setup_phase == 1:
+            # the second settlement pays one of each adjacent resource straight away
+            hand = tables.vertex_tiles @ (tables.tile_production > 0)
+            score = score + w_start * hand[:, STARTING_RESOURCES].sum(axis=1)
+        return score, legal
+
+    def best_placement(self, engine) -> Optional[Tuple[int, int]]:
+        """the best settlement vertex together with its road, None if no pair is legal"""
+        score, legal = self.score_vertices(engine)
+        pairs = get_setup_pairs(engine.board.topology)
+        free_edges = np.ones(len(pairs.edge_ends), dtype=bool)
+        free_edges[list(engine.game_state.roads)] = False
+
+        # the road is worth the best spot one step past its far end
+        spots = np.append(np.where(legal, score, 0), 0)
+        pair_score = score[pairs.vertex] + self.road_weight * spots[pairs.beyond].max(axis=1)
+        pair_score[~(legal[pairs.vertex] & free_edges[pairs.edge])] = -np.inf
+        best = int(np.argmax(pair_score))
+        if pair_score[best] == -np.inf:
+            return None
+        return int(pairs.vertex[best]), int(pairs.edge[best])
+
+    def best_road(self, engine) -> Optional[int]:
+        """the planned road if it's still free, else the legal road leading to the best spot, None if there is none"""
+        edges = engine.placement_manager.get_legal_road_edges()
+        if not edges:
+            return None
+        if self.planned is not None and self.planned[1] in edges:
+            return self.planned[1]
+        score, legal = self.score_vertices(engine)
+        pairs = get_setup_pairs(engine.board.topology)
+        spots = np.append(np.where(legal, score, 0), 0)
+        ends = pairs.edge_ends[edges]  # (legal edges, 2)
+        reach = spots[pairs.neighbors[ends]].max(axis=(1, 2))
+        return edges[int(np.argmax(reach))]
@@ -1,5 +1,4 @@
-from .enums import GamePhase, PlacementType
-import pygame
+from .enums import GamePhase, PlacementType, StateDomain
 
 class SetupPhaseManager:
     def __init__(self, game):
@@ -12,6 +11,7 @@ class SetupPhaseManager:
     def next_setup_turn(self):
         """Advance to the next player's setup turn"""
         self.game.game_state.setup_turns_completed += 1
+        self.game.game_state.mark_dirty(StateDomain.TURN)
         
         if self.setup_phase == 0:
             self.game.game_state.current_player_index = (self.game.game_state.current_player_index + 1) % len(self.game.players)
@@ -28,22 +28,37 @@ class SetupPhaseManager:
             self.end_setup_phase()
         else:
             self.game.game_state.placement_type = PlacementType.SETTLEMENT
-            print(f"Next player: {self.game.current_player.name}. Place a settlement.")
+            if not self.game.quiet:
+                print(f"Next player: {self.game.current_player.name}. Place a settlement.")
 
     def end_setup_phase(self):
         """End the setup phase and begin main game"""
         self.game.game_state.game_phase = GamePhase.PLAY
         self.game.game_state.placement_mode = False
         self.game.game_state.current_player_index = 0  # start main game with first player
-        print("Setup phase complete. Starting main game phase.")
+        self.game.game_state.mark_dirty(StateDomain.TURN)
+        if not self.game.quiet:
+            print("Setup phase complete. Starting main game phase.")
 
-    def handle_setup_phase(self):
-        """Handle setup phase placement logic"""
-        current_pos = pygame.mouse.get_pos()
-        if self.game.game_state.placement_type == PlacementType.SETTLEMENT:
-            if self.game.placement_manager.try_place_settlement(current_pos):
-                self.game.game_state.placement_type = PlacementType.ROAD
-                print(f"Player {self.game.current_player.name} placed a settlement. Now place a road.")
-        elif self.game.game_state.placement_type == PlacementType.ROAD:
-            if self.game.placement_manager.try_place_road(current_pos):
-                self.next_setup_turn()
\ No newline at end of file
+    def place_settlement(self, pos: int) -> bool:
+        """place a setup settlement, then ask for its road"""
+        if self.game.game_state.placement_type != PlacementType.SETTLEMENT:
+            return False
+        if not self.game.placement_manager.is_valid_settlement_placement(pos):
+            return False
+        self.game.placement_manager.place_settlement(pos)
+        self.game.game_state.placement_type = PlacementType.ROAD
+        self.game.game_state.mark_dirty(StateDomain.TURN)
+        if not self.game.quiet:
+            print(f"Player {self.game.current_player.name} placed a settlement. Now place a road.")
+        return True
+
+    def place_road(self, edge: int) -> bool:
+        """place a setup road, then hand over to the next player"""
+        if self.game.game_state.placement_type != PlacementType.ROAD:
+            return False
+        if not self.game.placement_manager.is_valid_road_placement(edge):
+            return False
+        self.game.placement_manager.place_road(edge)
+        self.next_setup_turn()
+        return True
@@ -0,0 +1,187 @@
+import struct
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from .board import Board, Tile
+from .constants import MAX_ROADS, MAX_SETTLEMENTS, MAX_CITIES, PLAYER_SEATS, RESOURCES, DEV_CARDS
+from .enums import ResourceType, GamePhase, PlacementType
+from .game_state import GameState
+from .player import Player
+
+SNAPSHOT_MAGIC = b"CTN"
+SNAPSHOT_VERSION = 1
+EMPTY = 0xFF  # padding for unused piece slots and missing holders
+DECK_SIZE = 25
+
+TILE_RESOURCES = list(ResourceType)
+PHASES = list(GamePhase)
+PLACEMENT_TYPES = list(PlacementType)
+
+# every field has a fixed place, little endian, sized for the given board and player count:
+#   header   magic, version, players, tiles
+#   tiles    resource index and number token (0 for the desert) per tile
+#   turn     current player, phase, setup phase, setup direction, setup turns, placement mode,
+#            placement type, dice rolled, dice value (0 before the first roll), robber tile,
+#            hover distance, longest road holder, largest army holder
+#   players  per player: hand, dev cards, knights, visible points, hidden points, holder flags,
+#            then roads, settlements and cities in build order, padded with EMPTY
+#   deck     card count then the deck bottom to top, padded with EMPTY
+HEADER_FORMAT = "<3sBBB"
+HEADER_FIELDS = 4
+TURN_FORMAT = "BBBbBBBBBBBBB"
+TURN_FIELDS = len(TURN_FORMAT)
+PLAYER_FORMAT = f"{len(RESOURCES)}H{len(DEV_CARDS)}HHBBB{MAX_ROADS}s{MAX_SETTLEMENTS}s{MAX_CITIES}s"
+DECK_FORMAT = f"B{DECK_SIZE}s"
+
+@lru_cache(maxsize=None)
+def snapshot_struct(num_tiles: int, num_players: int) -> struct.Struct:
+    """the full layout for one board size and player count"""
+    return struct.Struct(HEADER_FORMAT + f"{2 * num_tiles}B" + TURN_FORMAT +
+                         PLAYER_FORMAT * num_players + DECK_FORMAT)
+
+def _padded(values: List[int], size: int, what: str) -> bytes:
+    if len(values) > size:
+        raise ValueError(f"{len(values)} {what} don't fit in a snapshot, the limit is {size}")
+    return bytes(values) + bytes([EMPTY] * (size - len(values)))
+
+def _unpadded(data: bytes) -> List[int]:
+    return [value for value in data if value != EMPTY]
+
+def _tile_values(tiles: List[Tile]) -> Tuple[int, ...]:
+    """resource index and number token of every tile, flattened"""
+    values = []
+    for tile in tiles:
+        values.append(TILE_RESOURCES.index(tile.resource_type))
+        values.append(tile.value or 0)
+    return tuple(values)
+
+def _holder(value: Optional[int]) -> int:
+    return EMPTY if value is None else value
+
+def encode_snapshot(engine) -> bytes:
+    """pack the engine's game state into a fixed layout byte string
+
+    hover fields and the change tracking version are frontend bookkeeping and left out.
+    a robber move or steal in progress lives in the engine's RobberManager, not the
+    state, so snapshots are refused until the decision is made
+    """
+    robber_manager = engine.robber_manager
+    if robber_manager.move_pending or robber_manager.stealing_pending:
+        raise ValueError("can't snapshot in the middle of a robber move or steal, it would be lost")
+    game_state = engine.game_state
+    tiles = game_state.board.tiles
+    players = game_state.players
+    values = [SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(players), len(tiles)]
+    values += _tile_values(tiles)
+
+    values += [
+        game_state.current_player_index,
+        PHASES.index(game_state.game_phase),
+        game_state.setup_phase,
+        game_state.setup_direction,
+        game_state.setup_turns_completed,
+        game_state.placement_mode,
+        PLACEMENT_TYPES.index(game_state.placement_type),
+        game_state.dice_rolled,
+        game_state.dice_value or 0,
+        game_state.robber_position,
+        game_state.hover_distance,
+        _holder(game_state.longest_road_holder),
+        _holder(game_state.largest_army_holder),
+    ]
+
+    for player in players:
+        values += [player.resources[resource] for resource in RESOURCES]
+        values += [player.dev_cards[card] for card in DEV_CARDS]
+        values += [
+            player.knights_played,
+            player.visible_victory_points,
+            player.hidden_victory_points,
+            player.has_longest_road | (player.has_largest_army << 1),
+            _padded(player.roads, MAX_ROADS, "roads"),
+            _padded(player.settlements, MAX_SETTLEMENTS, "settlements"),
+            _padded(player.cities, MAX_CITIES, "cities"),
+        ]
+
+    deck = [DEV_CARDS.index(card) for card in game_state.dev_card_deck]
+    values += [len(deck), _padded(deck, DECK_SIZE, "dev cards")]
+    return snapshot_struct(len(tiles), len(players)).pack(*values)
+
+def decode_snapshot(data: bytes, board: Optional[Board] = None,
+                    players: Optional[List[Player]] = None) -> GameState:
+    """unpack a snapshot into a new GameState
+
+    pass board to share an existing Board when its tiles match the snapshot,
+    and players to reuse their colors and names
+    """
+    magic, version, num_players, num_tiles = struct.unpack_from(HEADER_FORMAT, data)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("not a game state snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"snapshot version {version} is not supported, expected {SNAPSHOT_VERSION}")
+    layout = snapshot_struct(num_tiles, num_players)
+    if len(data) != layout.size:
+        raise ValueError(f"snapshot is {len(data)} bytes, expected {layout.size}")
+    values = layout.unpack(data)
+    pos = HEADER_FIELDS
+
+    tile_values = values[pos:pos + 2 * num_tiles]
+    pos += 2 * num_tiles
+    if board is None or _tile_values(board.tiles) != tile_values:
+        board = Board([Tile(TILE_RESOURCES[tile_values[i]], tile_values[i + 1] or None)
+                       for i in range(0, len(tile_values), 2)])
+
+    (current_player_index, phase, setup_phase, setup_direction, setup_turns_completed, placement_mode,
+     placement_type, dice_rolled, dice_value, robber_position, hover_distance,
+     longest_road_holder, largest_army_holder) = values[pos:pos + TURN_FIELDS]
+    pos += TURN_FIELDS
+
+    seats = [(p.color, p.name) for p in players] if players else PLAYER_SEATS
+    num_resources, num_cards = len(RESOURCES), len(DEV_CARDS)
+    new_players = []
+    settlements, roads, cities = {}, {}, {}
+    for i in range(num_players):
+        player = Player(*seats[i])
+        player.resources = dict(zip(RESOURCES, values[pos:pos + num_resources]))
+        pos += num_resources
+        player.dev_cards = dict(zip(DEV_CARDS, values[pos:pos + num_cards]))
+        pos += num_cards
+        (player.knights_played, player.visible_victory_points, player.hidden_victory_points,
+         flags, player_roads, player_settlements, player_cities) = values[pos:pos + 7]
+        pos += 7
+        player.has_longest_road = bool(flags & 1)
+        player.has_largest_army = bool(flags & 2)
+        player.roads = _unpadded(player_roads)
+        player.settlements = _unpadded(player_settlements)
+        player.cities = _unpadded(player_cities)
+        for edge in player.roads:
+            roads[edge] = i
+        for vertex in player.settlements:
+            settlements[vertex] = i
+        for vertex in player.cities:
+            cities[vertex] = i
+        new_players.append(player)
+
+    deck_count, deck_slots = values[pos:pos + 2]
+    deck = [DEV_CARDS[slot] for slot in deck_slots[:deck_count]]
+
+    return GameState(
+        board=board,
+        players=new_players,
+        current_player_index=current_player_index,
+        game_phase=PHASES[phase],
+        setup_phase=setup_phase,
+        setup_direction=setup_direction,
+        settlements=settlements,
+        roads=roads,
+        cities=cities,
+        placement_mode=bool(placement_mode),
+        placement_type=PLACEMENT_TYPES[placement_type],
+        dice_rolled=bool(dice_rolled),
+        hover_distance=hover_distance,
+        setup_turns_completed=setup_turns_completed,
+        robber_position=robber_position,
+        dice_value=dice_value or None,
+        longest_road_holder=None if longest_road_holder == EMPTY else longest_road_holder,
+        largest_army_holder=None if largest_army_holder == EMPTY else largest_army_holder,
+        dev_card_deck=deck
+    )
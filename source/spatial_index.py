@@ -0,0 +1,35 @@
+import math
+from typing import Dict, Hashable, List, Set, Tuple
+
+class SpatialGrid:
+    """uniform grid of buckets so hover picking only looks at nearby items"""
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Hashable]] = {}
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def insert_point(self, item: Hashable, x: float, y: float):
+        """add an item that lives at a single point"""
+        self.cells.setdefault(self._cell(x, y), []).append(item)
+
+    def insert_segment(self, item: Hashable, start: Tuple[float, float], end: Tuple[float, float]):
+        """add an item to every cell its bounding box touches"""
+        min_cx, min_cy = self._cell(min(start[0], end[0]), min(start[1], end[1]))
+        max_cx, max_cy = self._cell(max(start[0], end[0]), max(start[1], end[1]))
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                self.cells.setdefault((cx, cy), []).append(item)
+
+    def query(self, x: float, y: float, radius: float) -> Set[Hashable]:
+        """get every item that could be within radius of a point"""
+        min_cx, min_cy = self._cell(x - radius, y - radius)
+        max_cx, max_cy = self._cell(x + radius, y + radius)
+        candidates = set()
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    candidates.update(bucket)
+        return candidates
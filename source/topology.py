@@ -0,0 +1,98 @@
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# corner offsets on an integer lattice, x in half hex widths and y in half tile sizes.
+# same order as the pointy-top corners the renderer draws (-30, 30, 90 ... degrees)
+CORNER_OFFSETS = [(1, -1), (1, 1), (0, 2), (-1, 1), (-1, -1), (0, -2)]
+
+class BoardTopology:
+    """integer ids for tiles, vertices and edges plus the adjacency between them"""
+    def __init__(self, axial_layout: Tuple[Tuple[int, int], ...]):
+        self.axial_layout = list(axial_layout)
+        self.tile_index: Dict[Tuple[int, int], int] = {axial: i for i, axial in enumerate(self.axial_layout)}
+
+        # collect every corner as an exact lattice point, no floats involved
+        tile_corners = [[self.corner_lattice_point(q, r, i) for i in range(6)] for q, r in self.axial_layout]
+        points = sorted({point for corners in tile_corners for point in corners}, key=lambda p: (p[1], p[0]))
+        self.vertex_lattice: List[Tuple[int, int]] = points
+        vertex_ids = {point: vid for vid, point in enumerate(points)}
+
+        self.tile_vertices: List[Tuple[int, ...]] = [
+            tuple(vertex_ids[point] for point in corners) for corners in tile_corners
+        ]
+
+        # edge i of a tile runs from corner i to corner i + 1
+        edge_pairs = sorted({
+            tuple(sorted((corners[i], corners[(i + 1) % 6])))
+            for corners in self.tile_vertices
+            for i in range(6)
+        })
+        self.edge_vertices: List[Tuple[int, int]] = edge_pairs
+        self.edge_index: Dict[Tuple[int, int], int] = {pair: eid for eid, pair in enumerate(edge_pairs)}
+        self.tile_edges: List[Tuple[int, ...]] = [
+            tuple(self.edge_between(corners[i], corners[(i + 1) % 6]) for i in range(6))
+            for corners in self.tile_vertices
+        ]
+
+        # adjacency tables
+        vertex_tiles = [[] for _ in points]
+        for tile_idx, corners in enumerate(self.tile_vertices):
+            for vid in corners:
+                vertex_tiles[vid].append(tile_idx)
+
+        vertex_edges = [[] for _ in points]
+        vertex_neighbors = [[] for _ in points]
+        for eid, (v1, v2) in enumerate(edge_pairs):
+            vertex_edges[v1].append(eid)
+            vertex_edges[v2].append(eid)
+            vertex_neighbors[v1].append(v2)
+            vertex_neighbors[v2].append(v1)
+
+        edge_tiles = [[] for _ in edge_pairs]
+        for tile_idx, edges in enumerate(self.tile_edges):
+            for eid in edges:
+                edge_tiles[eid].append(tile_idx)
+
+        self.vertex_tiles: List[Tuple[int, ...]] = [tuple(t) for t in vertex_tiles]
+        self.vertex_edges: List[Tuple[int, ...]] = [tuple(e) for e in vertex_edges]
+        self.vertex_neighbors: List[Tuple[int, ...]] = [tuple(n) for n in vertex_neighbors]
+        self.edge_tiles: List[Tuple[int, ...]] = [tuple(t) for t in edge_tiles]
+
+    @staticmethod
+    def corner_lattice_point(q: int, r: int, corner: int) -> Tuple[int, int]:
+        """lattice point for one corner of the hex at q, r"""
+        dx, dy = CORNER_OFFSETS[corner]
+        return (2 * q + r + dx, 3 * r + dy)
+
+    @property
+    def num_tiles(self) -> int:
+        return len(self.axial_layout)
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self.vertex_lattice)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.edge_vertices)
+
+    def edge_between(self, v1: int, v2: int) -> Optional[int]:
+        """get the edge joining two vertices, if there is one"""
+        if v1 > v2:
+            v1, v2 = v2, v1
+        return self.edge_index.get((v1, v2))
+
+@lru_cache(maxsize=None)
+def get_topology(axial_layout: Tuple[Tuple[int, int], ...]) -> BoardTopology:
+    """build the topology once per layout and share it between boards"""
+    return BoardTopology(axial_layout)
+
+def hex_layout(radius: int) -> List[Tuple[int, int]]:
+    """axial coordinates for a hexagon shaped board of the given radius"""
+    layout = []
+    for q in range(-radius, radius + 1):
+        r1 = max(-radius, -q - radius)
+        r2 = min(radius, -q + radius)
+        for r in range(r1, r2 + 1):
+            layout.append((q, r))
+    return layout
@@ -1,5 +1,7 @@
 import pygame
+from typing import List, Optional
 from .constants import *
+from .fonts import render_text
 from .enums import ResourceType, DevCardType, GamePhase, PlayerAction, PlacementType
 
 class UIRenderer:
@@ -19,7 +21,7 @@ class UIRenderer:
         self.COLUMN_SPACING = 0 
         self.COLUMN_WIDTH = 100
 
-    def draw_player_info(self, players):
+    def draw_player_info(self, players) -> pygame.Rect:
         player_width = SCREEN_WIDTH // 4
         max_height = 0
         
@@ -47,8 +49,8 @@ class UIRenderer:
             
             # draw titles
             text_y = y + self.PADDING
-            resources_title = FONT.render("Resources", True, BLACK)
-            dev_cards_title = FONT.render("Dev Cards", True, BLACK)
+            resources_title = render_text("Resources", BLACK)
+            dev_cards_title = render_text("Dev Cards", BLACK)
             self.screen.blit(resources_title, (x + self.PADDING, text_y))
             self.screen.blit(dev_cards_title, (x + left_col_width + self.PADDING, text_y))
             text_y += self.BASE_LINE_HEIGHT
@@ -58,7 +60,7 @@ class UIRenderer:
             for resource in ResourceType:
                 if resource != ResourceType.DESERT:
                     amount = player.resources[resource]
-                    text = FONT.render(f"{resource.name}: {amount}", True, BLACK)
+                    text = render_text(f"{resource.name}: {amount}", BLACK)
                     self.screen.blit(text, (x + self.PADDING, resources_y))
                     resources_y += self.BASE_LINE_HEIGHT
             
@@ -66,16 +68,17 @@ class UIRenderer:
             dev_cards_y = text_y
             for dev_card, amount in player.dev_cards.items():
                 if amount > 0:
-                    text = FONT.render(f"{dev_card.name}: {amount}", True, BLACK)
+                    text = render_text(f"{dev_card.name}: {amount}", BLACK)
                     self.screen.blit(text, (x + left_col_width + self.PADDING, dev_cards_y))
                     dev_cards_y += self.BASE_LINE_HEIGHT
+        return pygame.Rect(0, SCREEN_HEIGHT - max_height, SCREEN_WIDTH, max_height)
 
     def draw_end_turn_button(self, dice_rolled):
         if dice_rolled:
             button_rect = pygame.Rect(SCREEN_WIDTH - 150, SCREEN_HEIGHT - self.current_info_height - 60, 130, 50)
             pygame.draw.rect(self.screen, LIGHT_GRAY, button_rect)
             pygame.draw.rect(self.screen, BLACK, button_rect, 2)
-            text = FONT.render("End Turn", True, BLACK)
+            text = render_text("End Turn", BLACK)
             text_rect = text.get_rect(center=button_rect.center)
             self.screen.blit(text, text_rect)
             return button_rect
@@ -85,7 +88,7 @@ class UIRenderer:
         color = LIGHT_GRAY if not placement_mode else YELLOW
         pygame.draw.rect(self.screen, color, button_rect)
         pygame.draw.rect(self.screen, BLACK, button_rect, 2)
-        text = FONT.render("Placement Mode", True, BLACK)
+        text = render_text("Placement Mode", BLACK)
         text_rect = text.get_rect(center=button_rect.center)
         self.screen.blit(text, text_rect)
         return button_rect
@@ -98,7 +101,7 @@ class UIRenderer:
             pygame.draw.rect(self.screen, color, button_rect)
             pygame.draw.rect(self.screen, BLACK, button_rect, 2)
             
-            text = FONT.render("Buy Dev Card", True, BLACK)
+            text = render_text("Buy Dev Card", BLACK)
             text_rect = text.get_rect(center=button_rect.center)
             self.screen.blit(text, text_rect)
             return button_rect
@@ -126,30 +129,27 @@ class UIRenderer:
     def set_current_player_message(self, text):
         self.current_player_message = text
 
-    def draw_status_messages(self):
+    def expire_messages(self):
+        """drop messages that have been shown for their duration"""
         current_time = pygame.time.get_ticks()
         self.message_queue = [msg for msg in self.message_queue 
                             if current_time - msg['timestamp'] < msg['duration']]
-        
-        y_offset = 30
 
-        if self.current_player_message:
-            text = FONT.render(self.current_player_message, True, BLACK)
-            text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-            self.screen.blit(text, text_rect)
-            y_offset += 35
+    def status_lines(self) -> List[str]:
+        """message lines on screen, top to bottom"""
+        lines = [self.current_player_message] if self.current_player_message else []
+        return lines + [msg['text'] for msg in self.message_queue] + self.persistent_messages
 
-        for msg in self.message_queue:
-            text = FONT.render(msg['text'], True, BLACK)
-            text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-            self.screen.blit(text, text_rect)
-            y_offset += 35
-
-        for msg in self.persistent_messages:
-            text = FONT.render(msg, True, BLACK)
+    def draw_status_messages(self) -> Optional[pygame.Rect]:
+        """draw the message lines at the top, returns the area they cover"""
+        y_offset = 30
+        rects = []
+        for line in self.status_lines():
+            text = render_text(line, BLACK)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-            self.screen.blit(text, text_rect)
+            rects.append(self.screen.blit(text, text_rect))
             y_offset += 35
+        return rects[0].unionall(rects[1:]) if rects else None
 
     def add_persistent_message(self, text):
         self.add_message(text, float('inf'))
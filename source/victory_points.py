@@ -1,5 +1,6 @@
-from typing import List, Optional
-from .player import Player
+from collections import defaultdict, deque
+from typing import Dict
+from .enums import StateDomain
 
 class VictoryPointManager:
     """tracks victory points and special cards"""
@@ -10,6 +11,7 @@ class VictoryPointManager:
         self.min_knights_for_largest = 3
         self.longest_road_holder = None  # tracks who has longest road card
         self.largest_army_holder = None  # tracks who has largest army card
+        self.road_lengths: Dict[int, int] = {}  # cached longest road per player, missing means stale
         
     def update_victory_points(self):
         """check if anyone has won after point changes"""
@@ -30,7 +32,7 @@ class VictoryPointManager:
         
         # find longest road >= minimum length
         for i, player in enumerate(self.game.players):
-            road_length = self._calculate_longest_road_length(player)
+            road_length = self.get_longest_road_length(i)
             if road_length >= self.min_road_length_for_longest:
                 if road_length > longest_length:
                     longest_length = road_length
@@ -42,12 +44,14 @@ class VictoryPointManager:
         if new_holder != current_holder:
             if current_holder is not None:
                 self.game.players[current_holder].has_longest_road = False
+                self.game.players[current_holder].visible_victory_points = self.game.players[current_holder].calculate_visible_victory_points()
             if new_holder is not None:
                 self.game.players[new_holder].has_longest_road = True
+                self.game.players[new_holder].visible_victory_points = self.game.players[new_holder].calculate_visible_victory_points()
             self.longest_road_holder = new_holder
             if hasattr(self.game, 'game_state'):
                 self.game.game_state.longest_road_holder = new_holder
-                self.game.update_game_state()
+                self.game.game_state.mark_dirty(StateDomain.VICTORY_POINTS)
     
     def _update_largest_army(self):
         """figure out who gets largest army card"""
@@ -68,21 +72,87 @@ class VictoryPointManager:
         if new_holder != current_holder:
             if current_holder is not None:
                 self.game.players[current_holder].has_largest_army = False
+                self.game.players[current_holder].visible_victory_points = self.game.players[current_holder].calculate_visible_victory_points()
             if new_holder is not None:
                 self.game.players[new_holder].has_largest_army = True
+                self.game.players[new_holder].visible_victory_points = self.game.players[new_holder].calculate_visible_victory_points()
             self.largest_army_holder = new_holder
             if hasattr(self.game, 'game_state'):
                 self.game.game_state.largest_army_holder = new_holder
-                self.game.update_game_state()
+                self.game.game_state.mark_dirty(StateDomain.VICTORY_POINTS)
     
-    def _calculate_longest_road_length(self, player: Player) -> int:
+    def get_longest_road_length(self, player_index: int) -> int:
+        """longest road for a player, only recalculated after it could have changed"""
+        if player_index not in self.road_lengths:
+            self.road_lengths[player_index] = self._calculate_longest_road_length(player_index)
+        return self.road_lengths[player_index]
+
+    def handle_road_built(self, player_index: int):
+        """a new road can only change its owner's longest road"""
+        self.road_lengths.pop(player_index, None)
+
+    def handle_settlement_built(self, vertex: int, owner_index: int):
+        """a settlement breaks any opponent road running through its vertex"""
+        for player_index, road_vertices in self.game.placement_manager.road_vertices.items():
+            if player_index != owner_index and vertex in road_vertices:
+                self.road_lengths.pop(player_index, None)
+
+    def _calculate_longest_road_length(self, player_index: int) -> int:
         """get longest continuous road length"""
-        # todo: implement actual road length calculation
-        return len(player.roads)
+        edge_vertices = self.game.board.topology.edge_vertices
+        settlements = self.game.game_state.settlements
+        cities = self.game.game_state.cities
+
+        def road_node(vertex, edge):
+            # an opponent building splits its vertex so roads can end there but not pass through
+            owner = settlements.get(vertex, cities.get(vertex))
+            if owner is not None and owner != player_index:
+                return (vertex, edge)
+            return vertex
+
+        adjacency = defaultdict(list)
+        for edge in self.game.players[player_index].roads:
+            start, end = edge_vertices[edge]
+            start_node, end_node = road_node(start, edge), road_node(end, edge)
+            adjacency[start_node].append((edge, end_node))
+            adjacency[end_node].append((edge, start_node))
+
+        # a longest trail always starts at an odd degree node, unless its whole
+        # component is a circuit, in which case any node of it will do
+        start_nodes = []
+        seen = set()
+        for node in adjacency:
+            if node in seen:
+                continue
+            component = []
+            queue = deque([node])
+            seen.add(node)
+            while queue:
+                current = queue.popleft()
+                component.append(current)
+                for _, neighbor in adjacency[current]:
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        queue.append(neighbor)
+            odd_nodes = [n for n in component if len(adjacency[n]) % 2 == 1]
+            start_nodes.extend(odd_nodes if odd_nodes else component[:1])
+
+        used_edges = set()
+
+        def walk(node) -> int:
+            best = 0
+            for edge, neighbor in adjacency[node]:
+                if edge not in used_edges:
+                    used_edges.add(edge)
+                    best = max(best, 1 + walk(neighbor))
+                    used_edges.remove(edge)
+            return best
+
+        return max((walk(node) for node in start_nodes), default=0)
     
     def add_victory_point_card(self, player_index: int):
         """add point from victory point dev card"""
         self.game.players[player_index].hidden_victory_points += 1
         if hasattr(self.game, 'game_state'):
-            self.game.update_game_state()
+            self.game.game_state.mark_dirty(StateDomain.VICTORY_POINTS)
         self.update_victory_points()  # check for winner
\ No newline at end of file
@@ -0,0 +1,26 @@
+import random
+from source.engine import GameEngine
+
+def test_legal_actions_match_step_and_mask():
+    rng = random.Random(0)
+    for seed in range(3):
+        engine = GameEngine(seed, quiet=True)
+        space = engine.action_space
+        for _ in range(400):
+            legal = engine.legal_actions()
+            if not legal:
+                break
+            mask = engine.legal_action_mask()
+            assert [index for index, allowed in enumerate(mask) if allowed] == sorted(space.index[a] for a in legal)
+
+            # every legal action goes through, undo puts the position back each time
+            for action in legal:
+                assert engine.apply(action), action
+                engine.undo()
+
+            # and a sample of what the mask rules out is turned down
+            illegal = [action for action, allowed in zip(space.actions, mask) if not allowed]
+            for action in rng.sample(illegal, min(20, len(illegal))):
+                assert not engine.step(action), action
+
+            engine.step(rng.choice(legal))
@@ -0,0 +1,37 @@
+import random
+from source.engine import GameEngine
+from source.enums import GamePhase
+from source.event_log import EventLogReader, EventLogWriter
+from source.snapshot import encode_snapshot
+
+def test_replay_reproduces_live_game(tmp_path):
+    path = str(tmp_path / "games.log")
+    finals, turns = [], []
+    with EventLogWriter(path, checkpoint_every=5) as writer:
+        for seed in range(2):
+            rng = random.Random(seed)
+            engine = GameEngine(seed, quiet=True)
+            writer.attach(engine)
+            at_turn = {}
+            for _ in range(1500):
+                if engine.game_phase == GamePhase.END:
+                    break
+                engine.step(rng.choice(engine.legal_actions()))
+                if writer.turn not in at_turn and not engine.robber_manager.move_pending:
+                    at_turn[writer.turn] = encode_snapshot(engine)  # right after the turn's END_TURN
+            # finish any robber decision so the final position can be snapshotted
+            while engine.robber_manager.move_pending or engine.robber_manager.stealing_pending:
+                engine.step(rng.choice(engine.legal_actions()))
+            finals.append(encode_snapshot(engine))
+            turns.append(at_turn)
+
+    with EventLogReader(path) as reader:
+        assert len(reader) == 2
+        assert any(entry.turn for entry in reader.index)  # there are checkpoints to start from
+        for game, final in enumerate(finals):
+            for use_checkpoints in (True, False):
+                assert encode_snapshot(reader.replay(game, use_checkpoints=use_checkpoints)) == final
+            for turn in (1, 7, 12, max(turns[game])):
+                for use_checkpoints in (True, False):
+                    replayed = reader.replay(game, turn=turn, use_checkpoints=use_checkpoints)
+                    assert encode_snapshot(replayed) == turns[game][turn]
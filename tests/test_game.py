@@ -0,0 +1,39 @@
+import os
+import random
+import pytest
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+pytest.importorskip("pygame")
+from source.enums import GamePhase, ResourceType, StateDomain
+from source.game import Game
+
+def test_resource_change_redraws_placement_indicators():
+    """a roll or purchase changes what's buildable, so the hovered road's indicator has to be redrawn"""
+    game = Game()
+    engine = game.engine
+    engine.quiet = True
+    rng = random.Random(0)
+    while engine.game_phase == GamePhase.SETUP:
+        engine.step(rng.choice(engine.legal_actions()))
+
+    state = game.game_state
+    player_index = state.current_player_index
+    engine.current_player.resources = {resource: 0 for resource in engine.current_player.resources}
+    state.mark_dirty(StateDomain.RESOURCES)
+    if not state.placement_mode:
+        engine.placement_manager.toggle_placement_mode()
+
+    # a free edge touching the player's pieces, only buildable once they can pay for it
+    own = engine.placement_manager.road_vertices[player_index] | engine.placement_manager.player_buildings[player_index]
+    state.hovered_road = next(edge for edge, ends in enumerate(engine.board.topology.edge_vertices)
+                              if edge not in state.roads and own & set(ends))
+    state.mark_dirty(StateDomain.HOVER)
+    game.present()
+    assert game.board_renderer.placement_indicators(game)[2] is None
+    assert game.present() == []
+
+    # a roll paying out the road's cost, nothing that changes whether a city is affordable
+    engine.current_player.add_resource(ResourceType.WOOD)
+    engine.current_player.add_resource(ResourceType.BRICK)
+    state.mark_dirty(StateDomain.RESOURCES)
+    assert "board" in game.present()
+    assert game.board_renderer.placement_indicators(game)[2] == state.hovered_road
@@ -0,0 +1,36 @@
+import copy
+import random
+from source.engine import GameEngine
+from source.enums import GamePhase
+from source.snapshot import encode_snapshot
+
+def upcoming_chance(engine, rolls: int = 5):
+    """the next few dice rolls and the steal stream, drawn from a copy"""
+    rng = copy.deepcopy(engine.rng)
+    return [rng.roll() for _ in range(rolls)], rng.steal.getstate()
+
+def test_undo_restores_state_and_rng():
+    rng = random.Random(0)
+    for seed in range(4):
+        engine = GameEngine(seed, quiet=True)
+        for _ in range(150):
+            if engine.game_phase == GamePhase.END:
+                break
+            robber_manager = engine.robber_manager
+            if not (robber_manager.move_pending or robber_manager.stealing_pending):
+                before = encode_snapshot(engine), upcoming_chance(engine)
+                applied = 0
+                for _ in range(rng.randint(1, 12)):
+                    if engine.game_phase == GamePhase.END:
+                        break
+                    assert engine.apply(rng.choice(engine.legal_actions()))
+                    applied += 1
+                for _ in range(applied):
+                    assert engine.undo() is not None
+                assert not (robber_manager.move_pending or robber_manager.stealing_pending)
+                assert (encode_snapshot(engine), upcoming_chance(engine)) == before
+            # move on a few actions so the sequences start all through the game
+            for _ in range(rng.randint(1, 8)):
+                if engine.game_phase != GamePhase.END:
+                    engine.step(rng.choice(engine.legal_actions()))
+        assert engine.undo() is None
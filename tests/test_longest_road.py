@@ -0,0 +1,57 @@
+import random
+from source.engine import GameEngine
+
+def naive_longest_road(engine, player_index: int) -> int:
+    """try every trail from every vertex, stopping at opponent buildings"""
+    topology = engine.board.topology
+    roads = set(engine.players[player_index].roads)
+    buildings = {**engine.settlements, **engine.cities}
+    best = 0
+
+    def walk(vertex, used, first):
+        nonlocal best
+        best = max(best, len(used))
+        if not first and buildings.get(vertex, player_index) != player_index:
+            return
+        for edge in topology.vertex_edges[vertex]:
+            if edge in roads and edge not in used:
+                start, end = topology.edge_vertices[edge]
+                used.add(edge)
+                walk(end if start == vertex else start, used, False)
+                used.remove(edge)
+
+    for vertex in range(topology.num_vertices):
+        walk(vertex, set(), True)
+    return best
+
+def test_longest_road_matches_naive_search():
+    rng = random.Random(0)
+    for _ in range(200):
+        engine = GameEngine(rng.randrange(2 ** 32), quiet=True)
+        topology = engine.board.topology
+        engine.players[0].roads = rng.sample(range(topology.num_edges), rng.randint(1, 25))
+        for vertex in rng.sample(range(topology.num_vertices), rng.randint(0, 8)):
+            engine.game_state.settlements[vertex] = rng.randrange(len(engine.players))
+        expected = naive_longest_road(engine, 0)
+        assert engine.victory_point_manager._calculate_longest_road_length(0) == expected
+
+def test_opponent_settlement_cuts_road():
+    engine = GameEngine(0, quiet=True)
+    topology = engine.board.topology
+    # walk a path of five roads, then settle an opponent on its middle vertex
+    path, vertex, seen = [], 0, {0}
+    while len(path) < 5:
+        edge = next(e for e in topology.vertex_edges[vertex]
+                    if e not in path and set(topology.edge_vertices[e]) - seen)
+        path.append(edge)
+        vertex = next(v for v in topology.edge_vertices[edge] if v != vertex)
+        seen.add(vertex)
+    engine.players[0].roads = path
+    manager = engine.victory_point_manager
+    assert manager.get_longest_road_length(0) == 5
+
+    middle = set(topology.edge_vertices[path[2]]) & set(topology.edge_vertices[path[3]])
+    engine.game_state.settlements[middle.pop()] = 1
+    manager.road_lengths.clear()
+    assert manager.get_longest_road_length(0) == 3
+    assert manager.get_longest_road_length(0) == naive_longest_road(engine, 0)
@@ -0,0 +1,47 @@
+import random
+import pytest
+from source.engine import GameEngine
+from source.enums import GamePhase
+from source.snapshot import decode_snapshot, encode_snapshot
+
+STATE_FIELDS = ("current_player_index", "game_phase", "setup_phase", "setup_direction", "setup_turns_completed",
+                "placement_mode", "placement_type", "dice_rolled", "dice_value", "robber_position",
+                "hover_distance", "longest_road_holder", "largest_army_holder",
+                "settlements", "roads", "cities", "dev_card_deck")
+PLAYER_FIELDS = ("resources", "dev_cards", "knights_played", "visible_victory_points", "hidden_victory_points",
+                 "has_longest_road", "has_largest_army", "roads", "settlements", "cities")
+
+def mid_game_engines(seed: int, every: int = 25):
+    """copies of one random game paused between robber decisions"""
+    rng = random.Random(seed)
+    engine = GameEngine(seed, quiet=True)
+    for step in range(1500):
+        if engine.game_phase == GamePhase.END:
+            break
+        robber_manager = engine.robber_manager
+        if step % every == 0 and not (robber_manager.move_pending or robber_manager.stealing_pending):
+            yield engine
+        engine.step(rng.choice(engine.legal_actions()))
+
+def test_snapshot_round_trip():
+    for seed in range(3):
+        for engine in mid_game_engines(seed):
+            data = encode_snapshot(engine)
+            state = decode_snapshot(data, board=engine.board, players=engine.players)
+            for field in STATE_FIELDS:
+                assert getattr(state, field) == getattr(engine.game_state, field), field
+            for restored, player in zip(state.players, engine.players):
+                for field in PLAYER_FIELDS:
+                    assert getattr(restored, field) == getattr(player, field), field
+
+            # a fresh engine on the decoded state offers the same moves and snapshots the same
+            fresh = GameEngine(seed, quiet=True)
+            fresh.load_game_state(state)
+            assert fresh.legal_actions() == engine.legal_actions()
+            assert encode_snapshot(fresh) == data
+
+def test_snapshot_refuses_pending_robber_decision():
+    engine = GameEngine(0, quiet=True)
+    engine.robber_manager.move_pending = True
+    with pytest.raises(ValueError):
+        encode_snapshot(engine)